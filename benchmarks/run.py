@@ -0,0 +1,497 @@
+"""Benchmark the backtest and environment hot paths
+
+Runs every benchmark at several data sizes over synthetic market data served by a
+terminal replay backend and writes the timings as JSON. When a baseline file
+is given, the medians are compared. A failing benchmark is reported and the others
+still run. The exit code is 1 if any benchmark failed or got slower than the
+threshold.
+
+Usage:
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --compare baseline.json --threshold 0.2
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from AlgorithmicTrading.terminal import ReplayBackend, set_backend
+from AlgorithmicTrading.terminal import constants as mt5
+from benchmarks.synthetic import candles_to_frame, generate_market
+
+SYMBOL = "EURUSD"
+
+# Terminal serving the synthetic data
+BACKEND = ReplayBackend(balance=100_000)
+set_backend(BACKEND)
+
+# File formats measured by the files benchmarks
+FILE_FORMATS = (".csv", ".zip", ".parquet", ".feather", ".pkl", ".json")
+
+# Benchmark setup: receives the data size and returns the measured function and the
+# number of items it processes
+Setup = Callable[[int], Tuple[Callable[[], None], int]]
+
+
+def load_market(n_candles: int, model: str = "regime", seed: int = 7) -> pd.DataFrame:
+    """Generate a market and serve it through the replay terminal
+
+    Args:
+        n_candles (int): Number of candles
+        model (str, optional): Price model. Defaults to "regime".
+        seed (int, optional): Random seed. Defaults to 7.
+
+    Returns:
+        pd.DataFrame: Candles with the environment columns
+    """
+    candles, ticks = generate_market(n_candles, model=model, seed=seed)
+    BACKEND.load_symbol(SYMBOL, ticks=ticks, rates={mt5.TIMEFRAME_M5: candles})
+
+    return candles_to_frame(candles)
+
+
+# Benchmarks ----------------------------------------------------------------------
+def bench_env_step(size: int) -> Tuple[Callable[[], None], int]:
+    """Reset the environment and run random actions over "size" candles"""
+    from AlgorithmicTrading.backtest.environment.environment import TradingEnv
+
+    df = load_market(size)
+    env = TradingEnv(df=df, initial_balance=100_000)
+    n_steps = min(500, size - env.start_trading_step - 2)
+    actions = np.random.default_rng(1).integers(0, 3, n_steps)
+
+    def run():
+        env.reset(seed=1)
+        for action in actions:
+            env.step(action)
+
+    return run, n_steps
+
+
+def bench_get_last_tick(size: int) -> Tuple[Callable[[], None], int]:
+    """Last tick of 200 candles spread over "size" candles"""
+    from AlgorithmicTrading.utils.trades import get_last_tick
+
+    df = load_market(size)
+    steps = np.linspace(10, size - 1, 200).astype(int)
+
+    def run():
+        for step in steps:
+            get_last_tick(SYMBOL, df.iloc[: step + 1])
+
+    return run, len(steps)
+
+
+def bench_compute_profit(size: int) -> Tuple[Callable[[], None], int]:
+    """Profit of "size" positions"""
+    from AlgorithmicTrading.models.metatrader import ENUM_POSITION_TYPE, MqlTick
+    from AlgorithmicTrading.rates import Rates
+    from AlgorithmicTrading.utils.trades import compute_profit
+
+    load_market(1_000)
+    symbol_data = Rates.get_symbol_data(SYMBOL)
+    tick = MqlTick.parse_tick(
+        BACKEND.copy_ticks_from(SYMBOL, 0, 1, mt5.COPY_TICKS_ALL)[0]
+    )
+
+    rng = np.random.default_rng(2)
+    prices = np.round(1.1 + rng.normal(0, 0.01, (size, 2)), 5).tolist()
+    types = [ENUM_POSITION_TYPE(value) for value in rng.integers(0, 2, size)]
+
+    def run():
+        for (price_open, price_close), position_type in zip(prices, types):
+            compute_profit(
+                price_open=price_open,
+                price_close=price_close,
+                price_volume=0.1,
+                tick_close=tick,
+                symbol_data=symbol_data,
+                position_type=position_type,
+                account_currency="USD",
+            )
+
+    return run, size
+
+
+def bench_compute_profit_batch(size: int) -> Tuple[Callable[[], None], int]:
+    """Profit of "size" positions, in one vectorized call"""
+    from AlgorithmicTrading.rates import Rates
+    from AlgorithmicTrading.utils.trades import compute_profit_batch
+
+    load_market(1_000)
+    symbol_data = Rates.get_symbol_data(SYMBOL)
+
+    rng = np.random.default_rng(2)
+    prices = np.round(1.1 + rng.normal(0, 0.01, (size, 2)), 5)
+    types = rng.integers(0, 2, size)
+    volumes = np.full(size, 0.1)
+
+    def run():
+        compute_profit_batch(
+            price_open=prices[:, 0],
+            price_close=prices[:, 1],
+            price_volume=volumes,
+            symbol_data=symbol_data,
+            position_type=types,
+            account_currency="USD",
+        )
+
+    return run, size
+
+
+def _trade_requests(size: int) -> List[dict]:
+    """Market buy requests of "size" orders, as sent by Trade"""
+    from AlgorithmicTrading.models.metatrader import (
+        ENUM_ORDER_TYPE,
+        ENUM_ORDER_TYPE_FILLING,
+        ENUM_TRADE_REQUEST_ACTIONS,
+    )
+
+    prices = np.round(1.1 + np.random.default_rng(6).normal(0, 0.01, size), 5)
+
+    return [
+        {
+            "action": ENUM_TRADE_REQUEST_ACTIONS.TRADE_ACTION_DEAL,
+            "symbol": SYMBOL,
+            "type": ENUM_ORDER_TYPE.ORDER_TYPE_BUY,
+            "price": price,
+            "sl": round(price - 0.01, 5),
+            "tp": round(price + 0.01, 5),
+            "comment": "benchmark",
+            "volume": 0.1,
+            "type_filling": ENUM_ORDER_TYPE_FILLING.ORDER_FILLING_FOK,
+            "deviation": 5,
+            "magic": 1,
+        }
+        for price in prices.tolist()
+    ]
+
+
+def bench_trade_request_model(size: int) -> Tuple[Callable[[], None], int]:
+    """Validate and prepare "size" requests with MqlTradeRequest"""
+    from AlgorithmicTrading.models.metatrader import MqlTradeRequest
+
+    requests = _trade_requests(size)
+
+    def run():
+        for request in requests:
+            MqlTradeRequest(**request).prepare()
+
+    return run, size
+
+
+def bench_trade_request_template(size: int) -> Tuple[Callable[[], None], int]:
+    """Prepare "size" requests with a validated request template"""
+    from AlgorithmicTrading.trade.templates import RequestTemplates
+
+    requests = _trade_requests(size)
+    templates = RequestTemplates()
+
+    def run():
+        for request in requests:
+            templates.build(request)
+
+    return run, size
+
+
+def bench_fit_trendlines(size: int) -> Tuple[Callable[[], None], int]:
+    """Trend lines of 20 windows of "size" candles"""
+    from AlgorithmicTrading.ta.support_and_resistance import fit_trendlines_high_low
+
+    df = candles_to_frame(generate_market(size * 20, seed=5)[0])
+    # Indexed by date as the environment does, the trend lines read the window
+    # slices by position
+    windows = [
+        df.iloc[start : start + size].set_index("Datetime")
+        for start in range(0, size * 20, size)
+    ]
+
+    def run():
+        for window in windows:
+            fit_trendlines_high_low(window["High"], window["Low"], window["Close"])
+
+    return run, len(windows)
+
+
+def bench_features_engineering(size: int) -> Tuple[Callable[[], None], int]:
+    """Perceptron strategy features of "size" candles"""
+    from AlgorithmicTrading.strategies.perceptron import Strategy
+
+    candles, _ = generate_market(size, seed=3)
+    df = pd.DataFrame(candles)
+
+    def run():
+        Strategy.features_engineering(df)
+
+    return run, size
+
+
+def bench_rates_candles(size: int) -> Tuple[Callable[[], None], int]:
+    """Request and parse "size" candles"""
+    from AlgorithmicTrading.rates import Rates
+
+    df = load_market(size)
+    date_from = df["Datetime"].iloc[0].to_pydatetime()
+    date_to = df["Datetime"].iloc[-1].to_pydatetime()
+
+    def run():
+        Rates.get_candles_range(SYMBOL, date_from=date_from, date_to=date_to)
+
+    return run, size
+
+
+def bench_rates_ticks(size: int) -> Tuple[Callable[[], None], int]:
+    """Request and parse "size" ticks"""
+    from AlgorithmicTrading.rates import Rates
+
+    df = load_market(size // 10 + 1)
+    date_from = df["Datetime"].iloc[0].to_pydatetime()
+    date_to = df["Datetime"].iloc[-1].to_pydatetime()
+
+    def run():
+        Rates.get_ticks_range(SYMBOL, date_from=date_from, date_to=date_to)
+
+    return run, size
+
+
+def file_benchmarks(directory: str) -> Dict[str, Setup]:
+    """Build the write and read benchmarks of each file format
+
+    Args:
+        directory (str): Directory of the written files
+
+    Returns:
+        Dict[str, Setup]: Benchmarks by name
+    """
+    from AlgorithmicTrading.utils.files import read_file, write_file
+
+    def write_setup(extension: str) -> Setup:
+        def setup(size: int):
+            df = candles_to_frame(generate_market(size, seed=4)[0])
+            file_name = os.path.join(directory, f"write_{size}{extension}")
+
+            return (lambda: write_file(df, file_name)), size
+
+        return setup
+
+    def read_setup(extension: str) -> Setup:
+        def setup(size: int):
+            df = candles_to_frame(generate_market(size, seed=4)[0])
+            file_name = os.path.join(directory, f"read_{size}{extension}")
+            write_file(df, file_name)
+
+            return (lambda: read_file(file_name)), size
+
+        return setup
+
+    benchmarks = {}
+    for extension in FILE_FORMATS:
+        benchmarks[f"write_file[{extension[1:]}]"] = write_setup(extension)
+        benchmarks[f"read_file[{extension[1:]}]"] = read_setup(extension)
+
+    return benchmarks
+
+
+BENCHMARKS: Dict[str, Tuple[Setup, List[int]]] = {
+    "env_step": (bench_env_step, [1_000, 10_000, 100_000]),
+    "get_last_tick": (bench_get_last_tick, [1_000, 10_000, 100_000]),
+    "compute_profit": (bench_compute_profit, [1_000, 10_000, 100_000]),
+    "compute_profit_batch": (bench_compute_profit_batch, [1_000, 10_000, 100_000]),
+    "trade_request_model": (bench_trade_request_model, [1_000, 10_000]),
+    "trade_request_template": (bench_trade_request_template, [1_000, 10_000]),
+    "fit_trendlines_high_low": (bench_fit_trendlines, [50, 200, 1_000]),
+    "features_engineering": (bench_features_engineering, [1_000, 10_000, 100_000]),
+    "rates_candles": (bench_rates_candles, [1_000, 10_000, 100_000]),
+    "rates_ticks": (bench_rates_ticks, [1_000, 10_000, 100_000]),
+}
+FILE_SIZES = [1_000, 10_000, 100_000]
+
+
+# Runner --------------------------------------------------------------------------
+def measure(function: Callable[[], None], repeat: int) -> List[float]:
+    """Time a function, after one warm up call
+
+    Args:
+        function (Callable[[], None]): Measured function
+        repeat (int): Number of timed calls
+
+    Returns:
+        List[float]: Duration of each call in seconds
+    """
+    function()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def run_benchmark(name: str, setup: Setup, size: int, repeat: int) -> dict:
+    """Run a benchmark at one data size
+
+    Args:
+        name (str): Benchmark name
+        setup (Setup): Benchmark setup
+        size (int): Data size
+        repeat (int): Number of timed calls
+
+    Returns:
+        dict: Benchmark result
+    """
+    # Keep the output clean from the library prints and pandas warnings
+    with contextlib.redirect_stdout(io.StringIO()), warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        function, items = setup(size)
+        timings = measure(function, repeat)
+
+    median = statistics.median(timings)
+
+    return {
+        "name": name,
+        "size": size,
+        "items": items,
+        "repeat": repeat,
+        "min_s": min(timings),
+        "median_s": median,
+        "mean_s": statistics.fmean(timings),
+        "stdev_s": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "items_per_s": items / median if median else None,
+    }
+
+
+def get_metadata() -> dict:
+    """Describe the machine and code measured"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "date": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+
+
+def compare(results: List[dict], baseline: List[dict], threshold: float) -> bool:
+    """Compare the medians with a baseline
+
+    Args:
+        results (List[dict]): Current results
+        baseline (List[dict]): Baseline results
+        threshold (float): Accepted slowdown ratio
+
+    Returns:
+        bool: There are regressions
+    """
+    baseline = {(result["name"], result["size"]): result for result in baseline}
+    regression = False
+
+    for result in results:
+        reference = baseline.get((result["name"], result["size"]))
+        if reference is None:
+            continue
+
+        ratio = result["median_s"] / reference["median_s"]
+        status = "REGRESSION" if ratio > 1 + threshold else "ok"
+        regression |= status == "REGRESSION"
+
+        print(f"{result['name']:<28} {result['size']:>9} {ratio:>7.2f}x {status}")
+
+    return regression
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", default="", help="Run the benchmarks containing it")
+    parser.add_argument(
+        "--quick", action="store_true", help="Only run the smallest data size"
+    )
+    parser.add_argument("--compare", help="Baseline results file")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument(
+        "--latency", type=float, default=0, help="Terminal call latency in seconds"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0, help="Terminal call mean jitter in seconds"
+    )
+    args = parser.parse_args(argv)
+
+    # Simulated terminal communication
+    BACKEND.latency = args.latency
+    BACKEND.jitter = args.jitter
+
+    results = []
+    errors = []
+    with tempfile.TemporaryDirectory() as directory:
+        benchmarks = dict(BENCHMARKS)
+        benchmarks.update(
+            {
+                name: (setup, FILE_SIZES)
+                for name, setup in file_benchmarks(directory).items()
+            }
+        )
+
+        for name, (setup, sizes) in benchmarks.items():
+            if args.filter not in name:
+                continue
+
+            for size in sizes[:1] if args.quick else sizes:
+                # A failing benchmark is reported, the others still run
+                try:
+                    result = run_benchmark(name, setup, size, args.repeat)
+                except Exception as e:
+                    errors.append({"name": name, "size": size, "error": repr(e)})
+                    print(f"{name:<28} {size:>9} FAILED {e!r}")
+                    continue
+
+                results.append(result)
+
+                print(
+                    f"{name:<28} {size:>9} {result['median_s'] * 1_000:>12.3f} ms"
+                    f" {result['items_per_s']:>14,.0f} items/s"
+                )
+
+    with open(args.output, "w") as file:
+        json.dump(
+            {"metadata": get_metadata(), "results": results, "errors": errors},
+            file,
+            indent=2,
+        )
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+
+        if compare(results, baseline, args.threshold):
+            return 1
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime, timezone
+from typing import Tuple
+
+from AlgorithmicTrading.terminal import constants as mt5
+from AlgorithmicTrading.terminal.structures import RATES_DTYPE, TICKS_DTYPE
+
+# Bid and ask changed
+TICK_FLAGS_QUOTE = mt5.TICK_FLAG_BID | mt5.TICK_FLAG_ASK
+
+
+def generate_log_returns(
+    n: int,
+    model: str = "gbm",
+    sigma: float = 0.0005,
+    drift: float = 0.0,
+    jump_intensity: float = 0.002,
+    jump_std: float = 0.004,
+    regime_switch: float = 0.001,
+    regime_sigma_ratio: float = 3.0,
+    rng: np.random.Generator = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Generate log returns of a price model
+
+    Args:
+        n (int): Number of returns
+        model (str, optional): "gbm", "jump" (Merton jump diffusion) or "regime" (Markov switching volatility). Defaults to "gbm".
+        sigma (float, optional): Volatility of each return. Defaults to 0.0005.
+        drift (float, optional): Drift of each return. Defaults to 0.0.
+        jump_intensity (float, optional): Jump probability of each return. Defaults to 0.002.
+        jump_std (float, optional): Jump size deviation. Defaults to 0.004.
+        regime_switch (float, optional): Regime switch probability of each return. Defaults to 0.001.
+        regime_sigma_ratio (float, optional): High over low volatility regime ratio. Defaults to 3.0.
+        rng (np.random.Generator, optional): Random generator. Defaults to None.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Log returns and volatility of each return
+    """
+    if model not in ("gbm", "jump", "regime"):
+        raise ValueError("[ERROR]: The model must be 'gbm', 'jump' or 'regime'")
+
+    rng = np.random.default_rng() if rng is None else rng
+
+    volatility = np.full(n, sigma)
+
+    # Two states Markov chain, each switch flips the regime
+    if model == "regime":
+        regime = np.cumsum(rng.random(n) < regime_switch) % 2
+        volatility[regime == 1] *= regime_sigma_ratio
+
+    returns = drift - 0.5 * volatility**2 + volatility * rng.standard_normal(n)
+
+    # Compound Poisson jumps
+    if model == "jump":
+        jumps = rng.random(n) < jump_intensity
+        returns[jumps] += rng.normal(0, jump_std, jumps.sum())
+
+    return returns, volatility
+
+
+def generate_market(
+    n_candles: int,
+    ticks_per_candle: int = 10,
+    model: str = "gbm",
+    timeframe_seconds: int = 300,
+    start_price: float = 1.1,
+    digits: int = 5,
+    spread_points: int = 8,
+    sigma: float = 0.0005,
+    date_to: datetime = None,
+    seed: int = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Generate synthetic ticks and candles
+
+    The mid price is simulated at tick level and the candles are aggregated from the
+    bid ticks, as the MetaTrader charts. The spread widens with the volatility and
+    around the daily rollover.
+
+    Args:
+        n_candles (int): Number of candles
+        ticks_per_candle (int, optional): Ticks inside each candle. Defaults to 10.
+        model (str, optional): Price model, see generate_log_returns. Defaults to "gbm".
+        timeframe_seconds (int, optional): Candle duration. Defaults to 300.
+        start_price (float, optional): First mid price. Defaults to 1.1.
+        digits (int, optional): Price digits. Defaults to 5.
+        spread_points (int, optional): Typical spread in points. Defaults to 8.
+        sigma (float, optional): Volatility of each candle. Defaults to 0.0005.
+        date_to (datetime, optional): Time after the last candle. Defaults to the current day.
+        seed (int, optional): Random seed. Defaults to None.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Candles and ticks as MetaTrader5 structured arrays
+    """
+    rng = np.random.default_rng(seed)
+    n_ticks = n_candles * ticks_per_candle
+    point = 10.0**-digits
+
+    # Candles open time, aligned with the timeframe and in the past
+    if date_to is None:
+        date_to = datetime.now(timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+    last_time = int(date_to.timestamp()) // timeframe_seconds * timeframe_seconds
+    candles_time = last_time - timeframe_seconds * np.arange(n_candles, 0, -1)
+
+    # Mid prices at tick level
+    returns, volatility = generate_log_returns(
+        n_ticks, model=model, sigma=sigma / np.sqrt(ticks_per_candle), rng=rng
+    )
+    returns[0] = 0
+    mid = start_price * np.exp(np.cumsum(returns))
+
+    # Ticks time, the first tick of each candle is at the candle open
+    offsets = np.sort(
+        rng.integers(0, timeframe_seconds * 1_000, (n_candles, ticks_per_candle)), axis=1
+    )
+    offsets[:, 0] = 0
+    time_msc = (candles_time[:, None] * 1_000 + offsets).ravel()
+
+    # Spread widens with the volatility and around the daily rollover
+    hours = (time_msc // 3_600_000) % 24
+    spread = (
+        spread_points
+        * rng.lognormal(0, 0.25, n_ticks)
+        * (volatility / volatility.min())
+        * np.where((hours >= 21) & (hours < 23), 3.0, 1.0)
+    )
+    spread = np.maximum(np.rint(spread), 1).astype(np.int64)
+
+    # Quotes
+    ticks = np.zeros(n_ticks, dtype=TICKS_DTYPE)
+    ticks["time_msc"] = time_msc
+    ticks["time"] = time_msc // 1_000
+    ticks["bid"] = np.round(mid - spread * point / 2, digits)
+    ticks["ask"] = np.round(ticks["bid"] + spread * point, digits)
+    ticks["volume"] = rng.integers(1, 10, n_ticks)
+    ticks["volume_real"] = ticks["volume"]
+    ticks["flags"] = TICK_FLAGS_QUOTE
+
+    # Candles from the bid ticks
+    bid = ticks["bid"].reshape(n_candles, ticks_per_candle)
+    candles = np.zeros(n_candles, dtype=RATES_DTYPE)
+    candles["time"] = candles_time
+    candles["open"] = bid[:, 0]
+    candles["high"] = bid.max(axis=1)
+    candles["low"] = bid.min(axis=1)
+    candles["close"] = bid[:, -1]
+    candles["tick_volume"] = ticks_per_candle
+    candles["spread"] = spread.reshape(n_candles, ticks_per_candle).min(axis=1)
+
+    return candles, ticks
+
+
+def candles_to_frame(candles: np.ndarray) -> pd.DataFrame:
+    """Convert candles to the trading environment DataFrame
+
+    Args:
+        candles (np.ndarray): Candles structured array
+
+    Returns:
+        pd.DataFrame: Candles with the environment columns
+    """
+    return pd.DataFrame(
+        {
+            "Open": candles["open"],
+            "High": candles["high"],
+            "Low": candles["low"],
+            "Close": candles["close"],
+            "Adj Close": candles["close"],
+            "Volume": candles["tick_volume"],
+            "Datetime": pd.to_datetime(candles["time"], unit="s", utc=True),
+        }
+    )
+
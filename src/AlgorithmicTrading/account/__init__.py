@@ -1 +1,2 @@
-from .account import AccountBacktest, AccountLive
\ No newline at end of file
+from .account import AccountBacktest, AccountLive
+from .supervisor import ConnectionSupervisor
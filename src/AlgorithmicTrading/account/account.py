@@ -1,4 +1,5 @@
-import MetaTrader5 as mt5
+from AlgorithmicTrading.terminal import mt5
+from AlgorithmicTrading.terminal.metrics import timed
 from AlgorithmicTrading.models.metatrader import MqlAccountInfo
 from AlgorithmicTrading.models.metatrader import (
     MqlAccountInfo,
@@ -7,8 +8,11 @@ from AlgorithmicTrading.models.metatrader import (
     ENUM_ACCOUNT_MARGIN_MODE,
     MqlTradeDeal
 )
-from AlgorithmicTrading.utils.metatrader import decorator_validate_mt5_connection
-import MetaTrader5 as mt5
+from AlgorithmicTrading.utils.metatrader import (
+    decorator_validate_mt5_connection,
+    reset_connection_check,
+)
+from AlgorithmicTrading.terminal import mt5
 
 
 class AccountLive:
@@ -66,12 +70,14 @@ class AccountLive:
     @decorator_validate_mt5_connection
     def logout(cls) -> None:
         """Shut down connection to the MetaTrader 5 terminal"""
-        # Shut down the connection
+        # Shut down the connection, the next calls check the terminal again
         mt5.shutdown()
+        reset_connection_check()
 
         print("[INFO]: Success logout.")
 
     @classmethod
+    @timed("AccountLive.get_data")
     @decorator_validate_mt5_connection
     def get_data(cls) -> MqlAccountInfo:
         """Get updated account data
@@ -0,0 +1,208 @@
+import threading
+
+from AlgorithmicTrading.terminal import mt5
+from AlgorithmicTrading.models.metatrader import MqlAccountInfo
+from AlgorithmicTrading.account.account import AccountLive
+from AlgorithmicTrading.utils.metatrader import (
+    get_connection_supervisor,
+    set_connection_supervisor,
+)
+
+
+class ConnectionSupervisor:
+    """Keep the terminal connection of a live account alive
+
+    A background thread checks the terminal every heartbeat and, after a
+    disconnection, runs AccountLive.login again with an exponential backoff until it
+    succeeds. The connection state is cached, so the functions validating the
+    connection read an attribute instead of calling the terminal. During an outage
+    they fail fast or wait for the reconnection, as wait_timeout says.
+
+    >>> supervisor = ConnectionSupervisor(login=1234, server="Broker", password="")
+    >>> with supervisor:
+    ...     supervisor.wait_connected(timeout=60)
+    ...     trade = Trade(supervisor.account_data)
+
+    Args:
+        login (int): Trading account number
+        server (str): Trade server name
+        password (str): Trading account password
+        timeout (int, optional): Login timeout in milliseconds. Defaults to 60_000.
+        portable (bool, optional): Terminal launched in portable mode. Defaults to
+        False.
+        path (str, optional): Terminal executable path. Defaults to "".
+        heartbeat (float, optional): Seconds between checks. Defaults to 1.0.
+        backoff (float, optional): Seconds before the first login retry, doubled on
+        each failure. Defaults to 0.5.
+        max_backoff (float, optional): Maximum seconds between login retries.
+        Defaults to 30.0.
+        wait_timeout (float, optional): Seconds the callers wait for the
+        reconnection, 0 fails fast and None waits forever. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        login: int,
+        server: str,
+        password: str,
+        timeout: int = 60_000,
+        portable: bool = False,
+        path: str = "",
+        heartbeat: float = 1.0,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        wait_timeout: float = 0,
+    ) -> None:
+        self.credentials = dict(
+            login=login,
+            server=server,
+            password=password,
+            timeout=timeout,
+            portable=portable,
+            path=path,
+        )
+        self.heartbeat = heartbeat
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.wait_timeout = wait_timeout
+
+        # Cached state, read on every validated call
+        self.connected = False
+        self.connected_event = threading.Event()
+        self.account_data: MqlAccountInfo = None
+        self.reconnections = 0
+        self.last_error: Exception = None
+
+        self.stopped = threading.Event()
+        self.thread: threading.Thread = None
+
+    # Connection state ----------------------------------------------------------------
+    def check(self) -> bool:
+        """Check the terminal connection to the trade server
+
+        Returns:
+            bool: Connection alive
+        """
+        terminal_info = mt5.terminal_info()
+        if terminal_info is None or not terminal_info.connected:
+            return False
+
+        # The account is still logged in
+        return mt5.account_info() is not None
+
+    def mark_disconnected(self, error: Exception = None) -> None:
+        """Mark the connection as lost, the next heartbeat reconnects
+
+        Args:
+            error (Exception, optional): Disconnection cause. Defaults to None.
+        """
+        self.connected = False
+        self.connected_event.clear()
+
+        if error is not None:
+            self.last_error = error
+
+    def wait_connected(self, timeout: float = -1) -> None:
+        """Wait for the connection
+
+        Args:
+            timeout (float, optional): Seconds to wait, 0 fails fast and None waits
+            forever. Defaults to the supervisor wait_timeout.
+
+        Raises:
+            ConnectionError: Connection is not established
+        """
+        if self.connected:
+            return
+
+        # The supervisor thread is logging in, its own calls go through
+        if threading.current_thread() is self.thread:
+            return
+
+        timeout = self.wait_timeout if timeout == -1 else timeout
+        if timeout != 0 and self.connected_event.wait(timeout):
+            return
+
+        raise ConnectionError(
+            f"[ERROR]: Connection is not established, reconnecting: {self.last_error}"
+        )
+
+    # Supervision ---------------------------------------------------------------------
+    def connect(self) -> bool:
+        """Login once
+
+        Returns:
+            bool: Connection established
+        """
+        # Any error, e.g. an account parsed while the terminal reconnects, is retried
+        try:
+            account_data = AccountLive.login(**self.credentials)
+        except Exception as e:
+            self.last_error = e
+            return False
+
+        self.account_data = account_data
+        self.connected = True
+        self.connected_event.set()
+
+        return True
+
+    def __run(self) -> None:
+        """Background thread, check and reconnect until closed"""
+        delay = self.backoff
+
+        while not self.stopped.is_set():
+            if self.connected:
+                try:
+                    alive = self.check()
+                except Exception as e:
+                    alive = False
+                    self.last_error = e
+
+                if not alive:
+                    self.mark_disconnected()
+                    continue
+
+                self.stopped.wait(self.heartbeat)
+                continue
+
+            # Logged in before, this is a reconnection
+            reconnection = self.account_data is not None
+
+            if self.connect():
+                self.reconnections += reconnection
+                delay = self.backoff
+            else:
+                self.stopped.wait(delay)
+                delay = min(2 * delay, self.max_backoff)
+
+    def start(self) -> "ConnectionSupervisor":
+        """Start the supervision, the validated calls use its connection state
+
+        Returns:
+            ConnectionSupervisor: Self
+        """
+        if self.thread is None:
+            self.stopped.clear()
+            self.thread = threading.Thread(target=self.__run, daemon=True)
+            set_connection_supervisor(self)
+            self.thread.start()
+
+        return self
+
+    def close(self) -> None:
+        """Stop the supervision"""
+        self.stopped.set()
+
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+        if get_connection_supervisor() is self:
+            set_connection_supervisor(None)
+
+    def __enter__(self) -> "ConnectionSupervisor":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -664,7 +664,7 @@ def __backtest_close_position(
 
 def decorator_backtest_open_position(func: Callable):
     def check_backtest_account(*args, **kwargs):
-        if args[0].account_data.is_backtest_account:
+        if args[0].is_backtest_account:
             __backtest_open_position(*args, **kwargs)
             return True
         else:
@@ -675,7 +675,7 @@ def decorator_backtest_open_position(func: Callable):
 
 def decorator_backtest_open_pending_order(func: Callable):
     def check_backtest_account(*args, **kwargs):
-        if args[0].account_data.is_backtest_account:
+        if args[0].is_backtest_account:
             __backtest_open_pending_order(*args, **kwargs)
             return True
         else:
@@ -686,7 +686,7 @@ def decorator_backtest_open_pending_order(func: Callable):
 
 def decorator_backtest_modify_position(func: Callable):
     def check_backtest_account(*args, **kwargs):
-        if args[0].account_data.is_backtest_account:
+        if args[0].is_backtest_account:
             __backtest_modify_position(*args, **kwargs)
             return True
         else:
@@ -697,7 +697,7 @@ def decorator_backtest_modify_position(func: Callable):
 
 def decorator_backtest_modify_pending_order(func: Callable):
     def check_backtest_account(*args, **kwargs):
-        if args[0].account_data.is_backtest_account:
+        if args[0].is_backtest_account:
             __backtest_modify_pending_order(*args, **kwargs)
             return True
         else:
@@ -708,7 +708,7 @@ def decorator_backtest_modify_pending_order(func: Callable):
 
 def decorator_backtest_close_position(func: Callable):
     def check_backtest_account(*args, **kwargs):
-        if args[0].account_data.is_backtest_account:
+        if args[0].is_backtest_account:
             __backtest_close_position(*args, **kwargs)
             return True
         else:
@@ -3,14 +3,20 @@ from AlgorithmicTrading.account import AccountBacktest
 from AlgorithmicTrading.models.metatrader import (
     ENUM_ACCOUNT_MARGIN_MODE,
     ENUM_POSITION_TYPE,
+    ENUM_DEAL_ENTRY,
+    ENUM_DEAL_TYPE,
 )
 from AlgorithmicTrading.utils.trades import compute_profit, get_last_tick
 from AlgorithmicTrading.ta.support_and_resistance import fit_trendlines_high_low
 from AlgorithmicTrading.rates.rates import Rates
 
+import copy
 import numpy as np
 from pandas import DataFrame
 from .canva import CandleStickWindow
+from .snapshot import EnvSnapshot
+from AlgorithmicTrading.backtest.ledger import DealLedger, DealLogWriter
+from AlgorithmicTrading.backtest.metrics import PerformanceTracker
 from gym.spaces import Dict, Discrete, Box
 
 
@@ -28,9 +34,13 @@ class TradingEnv:
         margin_mode: ENUM_ACCOUNT_MARGIN_MODE = ENUM_ACCOUNT_MARGIN_MODE.ACCOUNT_MARGIN_MODE_RETAIL_NETTING,
         allow_multiple_positions: bool = False,
         stop_out_level: float = 70,
+        deal_log_file: str = None,
+        deal_log_memory: int = 1_000,
+        reward_mode: str = "profit",
+        periods_per_year: int = 252,
     ) -> None:
         # Validate parameters
-        self.validate_parameters(df, render_mode)
+        self.validate_parameters(df, render_mode, reward_mode)
 
         # Environment attributes
         self.observation_space = Dict(
@@ -60,9 +70,24 @@ class TradingEnv:
         self.allow_multiple_positions = allow_multiple_positions
         self.stop_out_level = stop_out_level
 
+        # Reward and metrics attributes
+        self.reward_mode = reward_mode
+        self.periods_per_year = periods_per_year
+
+        # Deal log attributes
+        self.deal_log_file = deal_log_file
+        self.deal_log_memory = deal_log_memory
+
+        # Episode attributes
+        self.np_random = None
+        self.observation = None
+        self.metrics = None
+        self.deals_tracked = 0
+
         # Visualization attributes
         self.render_range = render_range  # render range in visualization
-        self.visualization = CandleStickWindow(self)
+        # Window created on the first human render, it needs a display
+        self.visualization = None
 
     def _get_obs(self):
         # Trend slope observation
@@ -79,9 +104,9 @@ class TradingEnv:
         )
 
         # Support and resistance trend lines
-        self.trend_line_interval_values = self.df.set_index("Datetime").iloc[
+        self.trend_line_interval_values = self.df.iloc[
             self.current_step - self.trend_line_interval : self.current_step + 1
-        ]
+        ].set_index("Datetime")
         self.support_coefs_c, self.resist_coefs_c = fit_trendlines_high_low(
             self.trend_line_interval_values["High"],
             self.trend_line_interval_values["Low"],
@@ -103,8 +128,16 @@ class TradingEnv:
     def _is_truncated(self):
         return (self.account.equity * 100 / self.initial_balance) < self.stop_out_level
 
-    def reset(self):
-        """Reset trading environment"""
+    def reset(self, seed: int = None):
+        """Reset trading environment
+
+        Args:
+            seed (int, optional): Random generator seed. Defaults to None.
+        """
+
+        # Seed the random generator on the first reset or when requested
+        if seed is not None or self.np_random is None:
+            self.np_random = np.random.default_rng(seed)
 
         # Reset step back to start
         self.current_step = self.start_trading_step
@@ -116,15 +149,28 @@ class TradingEnv:
             balance=self.initial_balance, margin_mode=self.margin_mode
         )
 
+        # Stream the episode deals to the deal log
+        if self.deal_log_file:
+            self.close()
+            self.account.history_deals = DealLedger(
+                writer=DealLogWriter(self.deal_log_file),
+                deals=self.account.history_deals,
+                max_in_memory=self.deal_log_memory,
+            )
+
         # Create a new trade object linked with new backtest account
         self.trade = Trade(account_data=self.account, backtest_env=self)
 
-        # Reset net worth
+        # Reset net worth and metrics
         self.net_worth = np.zeros(len(self.df))
+        self.metrics = PerformanceTracker(periods_per_year=self.periods_per_year)
+        self.deals_tracked = self.__count_deals()
+        self.__update_metrics()
 
         # Get observation and trade info
         observation = self._get_obs()
         info = self._get_info()
+        self.observation = observation
 
         # Render if its human render mode
         if self.render_mode == "human":
@@ -132,6 +178,77 @@ class TradingEnv:
 
         return observation, info
 
+    def snapshot(self) -> EnvSnapshot:
+        """Take a snapshot of the current episode state
+
+        Returns:
+            EnvSnapshot: Episode state
+        """
+        return EnvSnapshot.capture(self)
+
+    def restore(self, snapshot: EnvSnapshot) -> dict:
+        """Restore the episode to a snapshot state
+
+        Args:
+            snapshot (EnvSnapshot): Episode state
+
+        Returns:
+            dict: Observation at the snapshot step
+        """
+
+        # Restore the step and the episode flags
+        self.current_step = snapshot.current_step
+        self.terminated = snapshot.terminated
+        self.truncated = snapshot.truncated
+
+        # Restore the account and link it with the trade object
+        self.account = snapshot.build_account()
+        self.trade = Trade(account_data=self.account, backtest_env=self)
+
+        # Restore the net worth curve in place
+        self.net_worth[: len(snapshot.net_worth)] = snapshot.net_worth
+        self.net_worth[len(snapshot.net_worth) :] = 0
+
+        # Restore the random generator
+        self.np_random = snapshot.build_rng()
+
+        # Restore the metrics
+        self.metrics = snapshot.metrics.copy()
+        self.deals_tracked = snapshot.deals_tracked
+
+        self.observation = snapshot.observation
+
+        return self.observation
+
+    def fork(self, snapshot: EnvSnapshot = None) -> "TradingEnv":
+        """Create a new environment branch
+
+        The branch shares the financial data and the symbol information with this
+        environment, the episode state is copied and the branch gets its own spaces
+        and render window.
+
+        Args:
+            snapshot (EnvSnapshot, optional): Branch state. Defaults to the current state.
+
+        Returns:
+            TradingEnv: Environment branch
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+
+        # Shallow copy shares the read only attributes
+        branch = copy.copy(self)
+        branch.net_worth = np.zeros(len(self.df))
+        branch.restore(snapshot)
+
+        # The spaces sample with their own generator and the window draws its
+        # environment, the branch gets its own
+        branch.observation_space = copy.deepcopy(self.observation_space)
+        branch.action_space = copy.deepcopy(self.action_space)
+        branch.visualization = None
+
+        return branch
+
     def step(
         self,
         action,
@@ -199,10 +316,12 @@ class TradingEnv:
 
         # Update position data
         self.__update_positions()
+        self.__update_metrics()
 
         # Get observation and trade info
         observation = self._get_obs()
         info = self._get_info()
+        self.observation = observation
         self.terminated = self.df.iloc[self.current_step].name == self.df.iloc[-1].name
         self.truncated = self._is_truncated()
         reward = self.__compute_reward()
@@ -213,12 +332,61 @@ class TradingEnv:
 
         return observation, reward, self.terminated, self.truncated, info
 
+    def __count_deals(self) -> int:
+        """Count the account deals, including the ones spilled to the deal log
+
+        Returns:
+            int: Deals count
+        """
+        history_deals = self.account.history_deals
+
+        return getattr(history_deals, "total_count", len(history_deals))
+
+    def __update_metrics(self) -> None:
+        """Update net worth and performance metrics with the current step"""
+
+        # Fill the net worth curve
+        self.net_worth[self.current_step] = self.account.equity
+
+        # Closed trades since the last update
+        deals_count = self.__count_deals()
+        new_deals = deals_count - self.deals_tracked
+        if new_deals:
+            for deal in self.account.history_deals[-new_deals:]:
+                if deal.type != ENUM_DEAL_TYPE.DEAL_TYPE_BALANCE and deal.entry in (
+                    ENUM_DEAL_ENTRY.DEAL_ENTRY_OUT,
+                    ENUM_DEAL_ENTRY.DEAL_ENTRY_INOUT,
+                    ENUM_DEAL_ENTRY.DEAL_ENTRY_OUT_BY,
+                ):
+                    self.metrics.add_trade(
+                        profit=deal.profit + deal.commission + deal.swap + deal.fee,
+                        position_id=deal.position_id,
+                    )
+            self.deals_tracked = deals_count
+
+        # Opened positions excursions
+        for position in self.account.positions:
+            self.metrics.update_position(position.ticket, position.profit)
+
+        if len(self.metrics.excursions) > len(self.account.positions):
+            self.metrics.retain_positions(
+                [position.ticket for position in self.account.positions]
+            )
+
+        self.metrics.update_equity(
+            self.account.equity, exposed=bool(self.account.positions)
+        )
+
     def __compute_reward(self) -> float:
         """Compute step reward
 
         Returns:
             float: Step reward
         """
+        # Risk adjusted equity return
+        if self.reward_mode == "risk_adjusted":
+            return self.metrics.risk_adjusted_return()
+
         # Check if a position was openned
         if not self.account.positions:
             return 0
@@ -326,6 +494,8 @@ class TradingEnv:
     def render(self):
         if self.render_mode == "human":
             # Render the environment to the screen
+            if self.visualization is None:
+                self.visualization = CandleStickWindow(self)
             self.visualization.show()
 
         elif self.render == "ansi":
@@ -335,9 +505,17 @@ class TradingEnv:
 
     # Close render environment
     def render_close(self):
-        self.visualization.close()
+        if self.visualization is not None:
+            self.visualization.close()
+
+    def close(self) -> None:
+        """Write the pending deals and close the episode deal log"""
+        history_deals = getattr(getattr(self, "account", None), "history_deals", None)
 
-    def validate_parameters(self, df: DataFrame, render_mode: str):
+        if isinstance(history_deals, DealLedger):
+            history_deals.close()
+
+    def validate_parameters(self, df: DataFrame, render_mode: str, reward_mode: str):
         # Validate dataframe
         assert set(
             ["Open", "High", "Low", "Close", "Adj Close", "Volume", "Datetime"]
@@ -346,6 +524,9 @@ class TradingEnv:
         # Validate render mode
         assert render_mode is None or render_mode in self.metadata["render_modes"]
 
+        # Validate reward mode
+        assert reward_mode in ("profit", "risk_adjusted")
+
     # Rename df column
     @classmethod
     def set_col_names(
@@ -358,7 +539,9 @@ class TradingEnv:
         adj_close_col_name: str = "Adj Close",
         volume_col_name: str = "Volume",
         datetime_col_name: str = "Datetime",
+        copy: bool = True,
     ):
+        # copy=False keeps the columns as views, e.g. of a memory mapped file
         return DataFrame(
             {
                 "Open": df[open_col_name],
@@ -368,5 +551,6 @@ class TradingEnv:
                 "Adj Close": df[adj_close_col_name],
                 "Volume": df[volume_col_name],
                 "Datetime": df[datetime_col_name],
-            }
+            },
+            copy=copy,
         )
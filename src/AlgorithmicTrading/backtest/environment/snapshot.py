@@ -0,0 +1,171 @@
+import pickle
+import numpy as np
+from typing import List
+
+from AlgorithmicTrading.backtest.ledger import DealLedger
+from AlgorithmicTrading.backtest.metrics import PerformanceTracker
+from AlgorithmicTrading.models.metatrader import (
+    MqlAccountInfo,
+    MqlPositionInfo,
+    MqlTradeDeal,
+    MqlTradeOrder,
+)
+
+
+class EnvSnapshot:
+    """Trading environment state at a given step
+
+    The snapshot keeps everything that changes while an episode runs: the step
+    index, the episode flags, the backtest account (balance, positions, pending
+    orders and deals ledger), the filled part of the net worth curve and the
+    random generator state.
+
+    Positions and orders are copied because the environment updates them in place
+    on every step. The deals ledger is append only, so the snapshot keeps a
+    reference to the ledger list and the number of deals it had when taken; the
+    deals are only copied when the snapshot is restored or serialized.
+
+    Args:
+        current_step (int): Environment step
+        terminated (bool): Episode terminated flag
+        truncated (bool): Episode truncated flag
+        account (MqlAccountInfo): Account data without positions, orders and deals
+        positions (List[MqlPositionInfo]): Opened positions copies
+        orders (List[MqlTradeOrder]): Pending orders copies
+        history_deals (List[MqlTradeDeal]): Account deals ledger
+        history_deals_count (int): Number of deals in the ledger at snapshot time
+        net_worth (np.ndarray): Net worth values up to the current step
+        rng_state (dict): Random generator bit generator state
+        observation (dict): Last observation returned by the environment
+        metrics (PerformanceTracker): Performance metrics state
+        deals_tracked (int): Deals already added to the metrics
+    """
+
+    def __init__(
+        self,
+        current_step: int,
+        terminated: bool,
+        truncated: bool,
+        account: MqlAccountInfo,
+        positions: List[MqlPositionInfo],
+        orders: List[MqlTradeOrder],
+        history_deals: List[MqlTradeDeal],
+        history_deals_count: int,
+        net_worth: np.ndarray,
+        rng_state: dict = None,
+        observation: dict = None,
+        metrics: PerformanceTracker = None,
+        deals_tracked: int = 0,
+    ) -> None:
+        self.current_step = current_step
+        self.terminated = terminated
+        self.truncated = truncated
+        self.account = account
+        self.positions = positions
+        self.orders = orders
+        self.history_deals = history_deals
+        self.history_deals_count = history_deals_count
+        self.net_worth = net_worth
+        self.rng_state = rng_state
+        self.observation = observation
+        self.metrics = metrics
+        self.deals_tracked = deals_tracked
+
+    @classmethod
+    def capture(cls, env) -> "EnvSnapshot":
+        """Take a snapshot of a trading environment
+
+        Args:
+            env (TradingEnv): Environment already reset
+
+        Returns:
+            EnvSnapshot: Environment state
+        """
+        account: MqlAccountInfo = env.account
+
+        # Spilled deals can not be restored
+        if isinstance(account.history_deals, DealLedger):
+            raise ValueError(
+                "[ERROR]: Snapshots are not available while the deals are streamed to a deal log"
+            )
+
+        return cls(
+            current_step=env.current_step,
+            terminated=env.terminated,
+            truncated=env.truncated,
+            # Shallow copy, the lists are stored apart
+            account=account.copy(
+                update={"positions": [], "orders": [], "history_deals": []}
+            ),
+            positions=[position.copy() for position in account.positions],
+            orders=[order.copy() for order in account.orders],
+            history_deals=account.history_deals,
+            history_deals_count=len(account.history_deals),
+            net_worth=env.net_worth[: env.current_step + 1].copy(),
+            rng_state=env.np_random.bit_generator.state,
+            observation=dict(env.observation) if env.observation else None,
+            metrics=env.metrics.copy(),
+            deals_tracked=env.deals_tracked,
+        )
+
+    def build_account(self) -> MqlAccountInfo:
+        """Build a new account object from the snapshot
+
+        Each call returns an independent account, so the same snapshot can be
+        restored many times and every branch evolves on its own.
+
+        Returns:
+            MqlAccountInfo: Account data
+        """
+        return self.account.copy(
+            update={
+                "positions": [position.copy() for position in self.positions],
+                "orders": [order.copy() for order in self.orders],
+                "history_deals": self.history_deals[: self.history_deals_count],
+            }
+        )
+
+    def build_rng(self) -> np.random.Generator:
+        """Build a random generator in the snapshot state
+
+        Returns:
+            np.random.Generator: Random generator
+        """
+        rng = np.random.default_rng()
+        if self.rng_state is not None:
+            rng.bit_generator.state = self.rng_state
+
+        return rng
+
+    def to_bytes(self) -> bytes:
+        """Serialize the snapshot
+
+        Returns:
+            bytes: Binary snapshot
+        """
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "EnvSnapshot":
+        """Load a serialized snapshot
+
+        Args:
+            data (bytes): Binary snapshot
+
+        Returns:
+            EnvSnapshot: Environment state
+        """
+        snapshot = pickle.loads(data)
+
+        if not isinstance(snapshot, cls):
+            raise TypeError(f"[ERROR]: Expected {cls.__name__} data")
+
+        return snapshot
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+
+        # Only serialize the deals that belong to the snapshot
+        state["history_deals"] = self.history_deals[: self.history_deals_count]
+
+        return state
@@ -0,0 +1,204 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+from typing import Iterable, List
+
+from AlgorithmicTrading.models.metatrader import MqlTradeDeal
+
+# Deal log columns
+DEAL_LOG_SCHEMA = pa.schema(
+    [
+        ("ticket", pa.int64()),
+        ("order", pa.int64()),
+        ("time", pa.timestamp("us", tz="UTC")),
+        ("time_msc", pa.timestamp("us", tz="UTC")),
+        ("type", pa.int16()),
+        ("entry", pa.int16()),
+        ("magic", pa.int64()),
+        ("position_id", pa.int64()),
+        ("reason", pa.int16()),
+        ("volume", pa.float64()),
+        ("price", pa.float64()),
+        ("commission", pa.float64()),
+        ("swap", pa.float64()),
+        ("profit", pa.float64()),
+        ("fee", pa.float64()),
+        ("symbol", pa.string()),
+        ("comment", pa.string()),
+        ("external_id", pa.string()),
+    ]
+)
+
+
+def deals_to_record_batch(deals: List[MqlTradeDeal]) -> pa.RecordBatch:
+    """Convert deals to an Arrow record batch
+
+    Args:
+        deals (List[MqlTradeDeal]): Deals
+
+    Returns:
+        pa.RecordBatch: Deals columns
+    """
+    columns = [
+        pa.array([getattr(deal, field.name) for deal in deals], type=field.type)
+        for field in DEAL_LOG_SCHEMA
+    ]
+
+    return pa.RecordBatch.from_arrays(columns, schema=DEAL_LOG_SCHEMA)
+
+
+class DealLogWriter:
+    """Append only deal log file
+
+    Deals are written as Arrow IPC stream batches (".arrows" files). Each batch is
+    flushed to disk when written, so the complete batches can be read by other
+    processes while the backtest is still running.
+
+    Args:
+        file_name (str): Deal log file
+    """
+
+    def __init__(self, file_name: str) -> None:
+        self.file_name = file_name
+        self.deals_written = 0
+
+        # Open the stream
+        self.sink = pa.OSFile(file_name, "wb")
+        self.writer = ipc.new_stream(self.sink, DEAL_LOG_SCHEMA)
+
+    def write(self, deals: List[MqlTradeDeal]) -> None:
+        """Write a batch of deals
+
+        Args:
+            deals (List[MqlTradeDeal]): Deals
+        """
+        if not deals:
+            return
+
+        self.writer.write_batch(deals_to_record_batch(deals))
+        self.sink.flush()
+
+        self.deals_written += len(deals)
+
+    def close(self) -> None:
+        """Close the deal log"""
+        if self.sink.closed:
+            return
+
+        self.writer.close()
+        self.sink.close()
+
+    @classmethod
+    def read(cls, file_name: str) -> pd.DataFrame:
+        """Read a deal log
+
+        The file can be read while it is being written, a batch not completely
+        written yet is ignored.
+
+        Args:
+            file_name (str): Deal log file
+
+        Returns:
+            pd.DataFrame: Deals
+        """
+        batches = []
+
+        with pa.OSFile(file_name, "rb") as source:
+            reader = ipc.open_stream(source)
+
+            try:
+                for batch in reader:
+                    batches.append(batch)
+            # Batch being written
+            except (pa.ArrowInvalid, OSError):
+                pass
+
+        return pa.Table.from_batches(batches, schema=DEAL_LOG_SCHEMA).to_pandas()
+
+    def __enter__(self) -> "DealLogWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class DealLedger(list):
+    """Account deals list with a bounded memory
+
+    Works as the account "history_deals" list but only keeps the most recent deals
+    in memory. Once the list grows over "max_in_memory" + "batch_size" deals the
+    oldest "batch_size" deals are written to the deal log and removed from memory.
+
+    Args:
+        writer (DealLogWriter): Deal log writer
+        deals (Iterable[MqlTradeDeal], optional): Initial deals. Defaults to ().
+        max_in_memory (int, optional): Deals kept in memory. Defaults to 1_000.
+        batch_size (int, optional): Deals written per batch. Defaults to 10_000.
+    """
+
+    def __init__(
+        self,
+        writer: DealLogWriter,
+        deals: Iterable[MqlTradeDeal] = (),
+        max_in_memory: int = 1_000,
+        batch_size: int = 10_000,
+    ) -> None:
+        super().__init__(deals)
+
+        if max_in_memory < 1 or batch_size < 1:
+            raise ValueError(
+                "[ERROR]: The memory and batch sizes must be higher than zero"
+            )
+
+        self.writer = writer
+        self.max_in_memory = max_in_memory
+        self.batch_size = batch_size
+        self.spilled_count = 0
+        self.written_in_memory = 0
+
+    def append(self, deal: MqlTradeDeal) -> None:
+        super().append(deal)
+
+        # Spill the oldest deals
+        if len(self) >= self.max_in_memory + self.batch_size:
+            self.spill()
+
+    def spill(self) -> None:
+        """Write the oldest batch of deals and remove it from memory"""
+        batch = self[: self.batch_size]
+
+        # Skip the deals already written by a flush
+        self.writer.write(batch[self.written_in_memory :])
+        self.written_in_memory = max(self.written_in_memory - len(batch), 0)
+
+        del self[: self.batch_size]
+        self.spilled_count += len(batch)
+
+    def flush(self) -> None:
+        """Write the deals in memory not written yet
+
+        The deals are kept in memory, call it before reading the deal log to get
+        the complete ledger.
+        """
+        self.writer.write(self[self.written_in_memory :])
+        self.written_in_memory = len(self)
+
+    def close(self) -> None:
+        """Write the pending deals and close the deal log"""
+        self.flush()
+        self.writer.close()
+
+    @property
+    def total_count(self) -> int:
+        """Number of deals in the ledger, including the spilled ones"""
+        return self.spilled_count + len(self)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Get the complete ledger
+
+        Returns:
+            pd.DataFrame: Deals
+        """
+        self.flush()
+
+        return DealLogWriter.read(self.writer.file_name)
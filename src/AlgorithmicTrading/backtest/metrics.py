@@ -0,0 +1,325 @@
+import math
+import numpy as np
+from typing import Dict, List
+
+
+def _profit_factor(gross_profit: float, gross_loss: float) -> float:
+    """Compute the profit factor
+
+    Args:
+        gross_profit (float): Sum of the winning trades
+        gross_loss (float): Absolute sum of the losing trades
+
+    Returns:
+        float: Profit factor
+    """
+    if gross_loss:
+        return gross_profit / gross_loss
+
+    return math.inf if gross_profit else math.nan
+
+
+def _ratio(mean: float, deviation: float, periods_per_year: int) -> float:
+    """Compute an annualized return over risk ratio
+
+    Args:
+        mean (float): Mean return
+        deviation (float): Return deviation
+        periods_per_year (int): Periods in one year
+
+    Returns:
+        float: Annualized ratio
+    """
+    if not deviation:
+        return math.nan
+
+    return mean / deviation * math.sqrt(periods_per_year)
+
+
+class PerformanceTracker:
+    """Incremental performance metrics
+
+    Each update costs O(1) time and memory, so the metrics of many runs can be
+    tracked without storing their equity curves. The returns moments are computed
+    with the Welford algorithm.
+
+    Args:
+        periods_per_year (int, optional): Equity updates in one year, used to annualize the ratios. Defaults to 252.
+    """
+
+    def __init__(self, periods_per_year: int = 252) -> None:
+        self.periods_per_year = periods_per_year
+
+        # Equity curve
+        self.initial_equity = None
+        self.equity = None
+        self.peak = None
+        self.max_drawdown = 0.0
+        self.last_return = 0.0
+        self.periods = 0
+        self.exposed_periods = 0
+
+        # Returns moments
+        self.returns_count = 0
+        self.returns_mean = 0.0
+        self.returns_m2 = 0.0
+        self.downside_sum_squares = 0.0
+
+        # Closed trades
+        self.trades = 0
+        self.wins = 0
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0
+
+        # Maximum adverse and favorable excursions of the opened positions
+        self.excursions: Dict[int, list] = {}
+
+        # Maximum adverse and favorable excursions of the closed positions
+        self.excursions_count = 0
+        self.adverse_sum = 0.0
+        self.favorable_sum = 0.0
+
+    def update_equity(self, equity: float, exposed: bool = False) -> None:
+        """Add an equity value
+
+        Args:
+            equity (float): Account equity
+            exposed (bool, optional): There are opened positions. Defaults to False.
+        """
+        self.periods += 1
+        self.exposed_periods += bool(exposed)
+
+        # First value
+        if self.equity is None:
+            self.initial_equity = self.equity = self.peak = equity
+            return
+
+        # Period return
+        period_return = (equity - self.equity) / self.equity if self.equity else 0.0
+        self.last_return = period_return
+        self.equity = equity
+
+        # Welford moments
+        self.returns_count += 1
+        delta = period_return - self.returns_mean
+        self.returns_mean += delta / self.returns_count
+        self.returns_m2 += delta * (period_return - self.returns_mean)
+
+        if period_return < 0:
+            self.downside_sum_squares += period_return * period_return
+
+        # Drawdown
+        if equity > self.peak:
+            self.peak = equity
+        elif self.peak > 0:
+            self.max_drawdown = max(self.max_drawdown, (self.peak - equity) / self.peak)
+
+    def update_position(self, position_id: int, profit: float) -> None:
+        """Update the excursions of an opened position
+
+        Args:
+            position_id (int): Position identifier
+            profit (float): Position floating profit
+        """
+        excursion = self.excursions.get(position_id)
+
+        if excursion is None:
+            self.excursions[position_id] = [profit, profit]
+        elif profit < excursion[0]:
+            excursion[0] = profit
+        elif profit > excursion[1]:
+            excursion[1] = profit
+
+    def retain_positions(self, position_ids: List[int]) -> None:
+        """Forget the excursions of positions no longer opened
+
+        Args:
+            position_ids (List[int]): Opened positions identifiers
+        """
+        position_ids = set(position_ids)
+
+        self.excursions = {
+            position_id: excursion
+            for position_id, excursion in self.excursions.items()
+            if position_id in position_ids
+        }
+
+    def add_trade(self, profit: float, position_id: int = None) -> None:
+        """Add a closed trade
+
+        Args:
+            profit (float): Trade net profit
+            position_id (int, optional): Closed position identifier. Defaults to None.
+        """
+        self.trades += 1
+
+        if profit > 0:
+            self.wins += 1
+            self.gross_profit += profit
+        else:
+            self.gross_loss -= profit
+
+        # Close the position excursions
+        if position_id is not None and position_id in self.excursions:
+            adverse, favorable = self.excursions.pop(position_id)
+            self.excursions_count += 1
+            self.adverse_sum += min(adverse, profit)
+            self.favorable_sum += max(favorable, profit)
+
+    @property
+    def std(self) -> float:
+        """Returns sample standard deviation"""
+        if self.returns_count < 2:
+            return 0.0
+
+        return math.sqrt(self.returns_m2 / (self.returns_count - 1))
+
+    @property
+    def downside_deviation(self) -> float:
+        """Returns downside deviation"""
+        if not self.returns_count:
+            return 0.0
+
+        return math.sqrt(self.downside_sum_squares / self.returns_count)
+
+    def risk_adjusted_return(self) -> float:
+        """Last return divided by the returns standard deviation
+
+        Returns:
+            float: Risk adjusted return, zero while the deviation is unknown
+        """
+        std = self.std
+
+        return self.last_return / std if std else 0.0
+
+    def metrics(self) -> dict:
+        """Get the current metrics
+
+        Returns:
+            dict: Metrics values
+        """
+        return {
+            "periods": self.periods,
+            "total_return": (
+                self.equity / self.initial_equity - 1 if self.initial_equity else 0.0
+            ),
+            "max_drawdown": self.max_drawdown,
+            "sharpe_ratio": _ratio(self.returns_mean, self.std, self.periods_per_year),
+            "sortino_ratio": _ratio(
+                self.returns_mean, self.downside_deviation, self.periods_per_year
+            ),
+            "exposure": self.exposed_periods / self.periods if self.periods else 0.0,
+            "trades": self.trades,
+            "win_rate": self.wins / self.trades if self.trades else 0.0,
+            "profit_factor": _profit_factor(self.gross_profit, self.gross_loss),
+            "average_trade": (
+                (self.gross_profit - self.gross_loss) / self.trades
+                if self.trades
+                else 0.0
+            ),
+            "average_mae": (
+                self.adverse_sum / self.excursions_count if self.excursions_count else 0.0
+            ),
+            "average_mfe": (
+                self.favorable_sum / self.excursions_count
+                if self.excursions_count
+                else 0.0
+            ),
+        }
+
+    def copy(self) -> "PerformanceTracker":
+        """Copy the tracker state
+
+        Returns:
+            PerformanceTracker: Independent tracker
+        """
+        tracker = PerformanceTracker.__new__(PerformanceTracker)
+        tracker.__dict__.update(self.__dict__)
+
+        # Mutable attributes
+        tracker.excursions = {key: list(value) for key, value in self.excursions.items()}
+
+        return tracker
+
+
+def compute_metrics(
+    equity: np.ndarray,
+    trade_profits: np.ndarray = None,
+    exposure: np.ndarray = None,
+    trade_mae: np.ndarray = None,
+    trade_mfe: np.ndarray = None,
+    periods_per_year: int = 252,
+) -> dict:
+    """Compute the performance metrics of a whole equity curve
+
+    Vectorized version of the PerformanceTracker, both return the same metrics.
+
+    Args:
+        equity (np.ndarray): Equity curve
+        trade_profits (np.ndarray, optional): Closed trades net profits. Defaults to None.
+        exposure (np.ndarray, optional): Flags of the periods with opened positions. Defaults to None.
+        trade_mae (np.ndarray, optional): Closed trades maximum adverse excursions. Defaults to None.
+        trade_mfe (np.ndarray, optional): Closed trades maximum favorable excursions. Defaults to None.
+        periods_per_year (int, optional): Equity values in one year. Defaults to 252.
+
+    Returns:
+        dict: Metrics values
+    """
+    equity = np.asarray(equity, dtype=np.float64)
+    trade_profits = (
+        np.empty(0) if trade_profits is None else np.asarray(trade_profits, np.float64)
+    )
+
+    if not len(equity):
+        raise ValueError("[ERROR]: The equity curve is empty")
+
+    # Period returns
+    previous = equity[:-1]
+    returns = np.divide(
+        np.diff(equity), previous, out=np.zeros(len(previous)), where=previous != 0
+    )
+
+    # Drawdown
+    peaks = np.maximum.accumulate(equity)
+    drawdowns = np.divide(
+        peaks - equity, peaks, out=np.zeros(len(equity)), where=peaks > 0
+    )
+
+    # Returns deviations
+    std = float(np.std(returns, ddof=1)) if len(returns) > 1 else 0.0
+    downside = np.minimum(returns, 0)
+    downside_deviation = (
+        math.sqrt(float(np.dot(downside, downside)) / len(returns))
+        if len(returns)
+        else 0.0
+    )
+    mean = float(returns.mean()) if len(returns) else 0.0
+
+    # Closed trades
+    trades = len(trade_profits)
+    wins = trade_profits[trade_profits > 0]
+    gross_profit = float(wins.sum())
+    gross_loss = -float(trade_profits[trade_profits <= 0].sum())
+
+    return {
+        "periods": len(equity),
+        "total_return": float(equity[-1] / equity[0] - 1) if equity[0] else 0.0,
+        "max_drawdown": float(drawdowns.max()),
+        "sharpe_ratio": _ratio(mean, std, periods_per_year),
+        "sortino_ratio": _ratio(mean, downside_deviation, periods_per_year),
+        "exposure": (
+            float(np.count_nonzero(exposure)) / len(equity)
+            if exposure is not None
+            else 0.0
+        ),
+        "trades": trades,
+        "win_rate": len(wins) / trades if trades else 0.0,
+        "profit_factor": _profit_factor(gross_profit, gross_loss),
+        "average_trade": (gross_profit - gross_loss) / trades if trades else 0.0,
+        "average_mae": (
+            float(np.mean(trade_mae)) if trade_mae is not None and len(trade_mae) else 0.0
+        ),
+        "average_mfe": (
+            float(np.mean(trade_mfe)) if trade_mfe is not None and len(trade_mfe) else 0.0
+        ),
+    }
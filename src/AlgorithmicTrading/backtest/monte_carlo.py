@@ -0,0 +1,206 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Tuple
+
+from AlgorithmicTrading.models.metatrader import (
+    MqlTradeDeal,
+    ENUM_DEAL_ENTRY,
+    ENUM_DEAL_TYPE,
+)
+
+# Maximum number of equity values computed at once by each chunk
+CHUNK_ELEMENTS = 5_000_000
+
+
+def get_trade_profits(history_deals: Iterable[MqlTradeDeal]) -> np.ndarray:
+    """Get the net profit of each closed trade of a deals ledger
+
+    Args:
+        history_deals (Iterable[MqlTradeDeal]): Account deals
+
+    Returns:
+        np.ndarray: Trades net profits
+    """
+    return np.array(
+        [
+            deal.profit + deal.commission + deal.swap + deal.fee
+            for deal in history_deals
+            if deal.type != ENUM_DEAL_TYPE.DEAL_TYPE_BALANCE
+            and deal.entry
+            in (
+                ENUM_DEAL_ENTRY.DEAL_ENTRY_OUT,
+                ENUM_DEAL_ENTRY.DEAL_ENTRY_INOUT,
+                ENUM_DEAL_ENTRY.DEAL_ENTRY_OUT_BY,
+            )
+        ],
+        dtype=np.float64,
+    )
+
+
+def _simulate_chunk(
+    profits: np.ndarray,
+    initial_balance: float,
+    n_simulations: int,
+    method: str,
+    ruin_equity: float,
+    seed: np.random.SeedSequence,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Simulate a chunk of equity paths
+
+    Args:
+        profits (np.ndarray): Trades net profits
+        initial_balance (float): Account initial balance
+        n_simulations (int): Number of paths
+        method (str): "bootstrap" or "shuffle"
+        ruin_equity (float): Equity considered as ruin
+        seed (np.random.SeedSequence): Chunk seed
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Final equity, max drawdown and ruin flag of each path
+    """
+    rng = np.random.default_rng(seed)
+    n_trades = len(profits)
+
+    # Resampled trades indexes, one path per row
+    if method == "bootstrap":
+        indexes = rng.integers(0, n_trades, size=(n_simulations, n_trades))
+    else:
+        indexes = np.tile(np.arange(n_trades), (n_simulations, 1))
+        rng.permuted(indexes, axis=1, out=indexes)
+
+    # Equity paths
+    paths = profits[indexes]
+    np.cumsum(paths, axis=1, out=paths)
+    paths += initial_balance
+
+    final_equity = paths[:, -1].copy()
+    ruined = paths.min(axis=1) <= ruin_equity
+
+    # Drawdown from the running peak, the initial balance is the first peak
+    peaks = np.maximum.accumulate(paths, axis=1)
+    np.maximum(peaks, initial_balance, out=peaks)
+    np.divide(paths, peaks, out=paths)
+    max_drawdown = 1 - paths.min(axis=1)
+
+    return final_equity, max_drawdown, ruined
+
+
+class MonteCarloResult:
+    """Monte Carlo simulation distributions
+
+    Args:
+        final_equity (np.ndarray): Final equity of each path
+        max_drawdown (np.ndarray): Maximum drawdown of each path
+        ruined (np.ndarray): Paths where the equity reached the ruin level
+    """
+
+    def __init__(
+        self, final_equity: np.ndarray, max_drawdown: np.ndarray, ruined: np.ndarray
+    ) -> None:
+        self.final_equity = final_equity
+        self.max_drawdown = max_drawdown
+        self.ruined = ruined
+
+    @property
+    def risk_of_ruin(self) -> float:
+        """Fraction of the paths that reached the ruin level"""
+        return float(self.ruined.mean())
+
+    def summary(self, percentiles: Iterable[float] = (5, 50, 95)) -> dict:
+        """Summarize the distributions
+
+        Args:
+            percentiles (Iterable[float], optional): Percentiles computed. Defaults to (5, 50, 95).
+
+        Returns:
+            dict: Percentiles of each distribution and risk of ruin
+        """
+        percentiles = list(percentiles)
+
+        return {
+            "simulations": len(self.final_equity),
+            "final_equity": dict(
+                zip(percentiles, np.percentile(self.final_equity, percentiles))
+            ),
+            "max_drawdown": dict(
+                zip(percentiles, np.percentile(self.max_drawdown, percentiles))
+            ),
+            "risk_of_ruin": self.risk_of_ruin,
+        }
+
+
+def simulate(
+    profits: np.ndarray,
+    initial_balance: float,
+    n_simulations: int = 10_000,
+    method: str = "bootstrap",
+    ruin_level: float = 0.5,
+    seed: int = None,
+    n_jobs: int = 1,
+) -> MonteCarloResult:
+    """Resample a trades sequence
+
+    Each path is a row of a trades index matrix, the equity of every path in a chunk
+    is computed with a single cumulative sum. Chunks are sized to keep the memory
+    bounded and can run in parallel processes; the result only depends on the seed,
+    not on the number of processes.
+
+    Args:
+        profits (np.ndarray): Trades net profits
+        initial_balance (float): Account initial balance
+        n_simulations (int, optional): Number of paths. Defaults to 10_000.
+        method (str, optional): "bootstrap" draws with replacement, "shuffle" permutes the trades. Defaults to "bootstrap".
+        ruin_level (float, optional): Fraction of the initial balance considered as ruin. Defaults to 0.5.
+        seed (int, optional): Random seed. Defaults to None.
+        n_jobs (int, optional): Number of processes. Defaults to 1.
+
+    Raises:
+        ValueError: Invalid method
+        ValueError: Invalid number of simulations
+        ValueError: No trades to resample
+
+    Returns:
+        MonteCarloResult: Simulation distributions
+    """
+    # Validate parameters
+    if method not in ("bootstrap", "shuffle"):
+        raise ValueError("[ERROR]: The method must be 'bootstrap' or 'shuffle'")
+
+    if n_simulations < 1:
+        raise ValueError("[ERROR]: The number of simulations must be higher than zero")
+
+    profits = np.asarray(profits, dtype=np.float64)
+    if not len(profits):
+        raise ValueError("[ERROR]: There are no trades to resample")
+
+    # Split the simulations in chunks
+    chunk_size = max(1, CHUNK_ELEMENTS // len(profits))
+    chunks: List[int] = [
+        min(chunk_size, n_simulations - start)
+        for start in range(0, n_simulations, chunk_size)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+
+    arguments = (
+        [profits] * len(chunks),
+        [initial_balance] * len(chunks),
+        chunks,
+        [method] * len(chunks),
+        [initial_balance * ruin_level] * len(chunks),
+        seeds,
+    )
+
+    # Run the chunks
+    if n_jobs > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(_simulate_chunk, *arguments))
+    else:
+        results = list(map(_simulate_chunk, *arguments))
+
+    final_equity, max_drawdown, ruined = zip(*results)
+
+    return MonteCarloResult(
+        final_equity=np.concatenate(final_equity),
+        max_drawdown=np.concatenate(max_drawdown),
+        ruined=np.concatenate(ruined),
+    )
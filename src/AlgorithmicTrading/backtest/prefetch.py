@@ -0,0 +1,171 @@
+import queue
+import threading
+import pandas as pd
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterable, Iterator, List
+
+from AlgorithmicTrading.utils.files import read_dataset
+
+# End of the source, or error raised by the loading thread
+_END = object()
+
+
+class Prefetcher:
+    """Load the next data chunks on a background thread
+
+    The source is iterated on a background thread, up to depth chunks ahead of the
+    consumer: with depth=1 one chunk is simulated while the next one is loaded
+    (double buffering), a higher depth absorbs slower reads. The reads, decoding
+    and transforms run while the simulation computes, the Parquet and Arrow
+    readers release the GIL.
+
+    >>> for df in Prefetcher.from_dataset(root, "EURUSD", "M5", date_from, date_to):
+    ...     env = TradingEnv(TradingEnv.set_col_names(df, ...))
+
+    Args:
+        source (Iterable): Chunks source, e.g. read_file_chunks(...)
+        depth (int, optional): Chunks loaded ahead. Defaults to 2.
+        transform (Callable, optional): Function applied to each chunk on the
+        background thread, e.g. the features computation. Defaults to None.
+
+    Raises:
+        ValueError: The depth is lower than 1
+    """
+
+    def __init__(
+        self, source: Iterable, depth: int = 2, transform: Callable = None
+    ) -> None:
+        if depth < 1:
+            raise ValueError("[ERROR]: The read ahead depth must be at least 1")
+
+        self.source = source
+        self.depth = depth
+        self.transform = transform
+
+        self.queue = queue.Queue(maxsize=depth)
+        self.stopped = threading.Event()
+        self.thread = None
+
+    @classmethod
+    def from_dataset(
+        cls,
+        root: str,
+        symbol: str,
+        timeframe,
+        date_from: datetime,
+        date_to: datetime,
+        window: timedelta = timedelta(days=7),
+        columns: List[str] = None,
+        **kwargs,
+    ) -> "Prefetcher":
+        """Prefetch a dataset range, window by window
+
+        Args:
+            root (str): Dataset directory
+            symbol (str): Symbol
+            timeframe (ENUM_TIMEFRAME | str): Timeframe, "ticks" for ticks
+            date_from (datetime): From date, included
+            date_to (datetime): To date, excluded
+            window (timedelta, optional): Chunks length. Defaults to 7 days.
+            columns (List[str], optional): Columns read. Defaults to all columns.
+            **kwargs: Prefetcher parameters
+
+        Returns:
+            Prefetcher: Dataset windows prefetcher
+        """
+
+        def read_windows() -> Iterator[pd.DataFrame]:
+            window_from = date_from
+
+            while window_from < date_to:
+                window_to = min(window_from + window, date_to)
+
+                yield read_dataset(
+                    root,
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    date_from=window_from,
+                    date_to=window_to,
+                    columns=columns,
+                )
+
+                window_from = window_to
+
+        return cls(read_windows(), **kwargs)
+
+    def __put(self, item: Any) -> bool:
+        """Put an item in the queue, unless the consumer stopped
+
+        Args:
+            item (Any): Chunk or end marker
+
+        Returns:
+            bool: The item was queued
+        """
+        while not self.stopped.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def __load(self) -> None:
+        """Background thread, load the chunks ahead"""
+        try:
+            for chunk in self.source:
+                if self.transform is not None:
+                    chunk = self.transform(chunk)
+
+                if not self.__put(chunk):
+                    return
+
+        except Exception as e:
+            # Raised again by the consumer
+            self.__put((_END, e))
+            return
+
+        self.__put((_END, None))
+
+    def start(self) -> "Prefetcher":
+        """Start loading the chunks
+
+        Returns:
+            Prefetcher: Self
+        """
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.__load, daemon=True)
+            self.thread.start()
+
+        return self
+
+    def close(self) -> None:
+        """Stop the background thread"""
+        self.stopped.set()
+
+        if self.thread is not None:
+            self.thread.join()
+
+    def __iter__(self) -> Iterator:
+        self.start()
+
+        try:
+            while True:
+                item = self.queue.get()
+
+                if isinstance(item, tuple) and len(item) == 2 and item[0] is _END:
+                    if item[1] is not None:
+                        raise item[1]
+                    return
+
+                yield item
+        finally:
+            # Also when the consumer stops early
+            self.close()
+
+    def __enter__(self) -> "Prefetcher":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -4,12 +4,14 @@ from AlgorithmicTrading.utils.metatrader import (
 from AlgorithmicTrading.utils.exceptions import NotExpectedParseType
 from AlgorithmicTrading.utils.dates import get_timestamp_ms
 
-import MetaTrader5 as mt5
+from AlgorithmicTrading.terminal import mt5, get_backend
+from AlgorithmicTrading.terminal.metrics import timed
 from pydantic import BaseModel, validator, root_validator
-from typing import Optional, List
+from typing import ClassVar, Optional, List
 from enum import IntEnum, Enum, auto
 from datetime import datetime, timezone, timedelta
 import pytz
+import threading
 import numpy as np
 import pandas as pd
 
@@ -464,6 +466,21 @@ class ENUM_CHECK_CODE(IntEnum):
     CHECK_RETCODE_RETRY: int = auto()
 
 
+class ENUM_REFRESH_POLICY(IntEnum):
+    """Live account refresh around the trade operations
+
+    Args:
+        REFRESH_POLICY_FULL (int): Reload the account (info, positions, orders and
+        deals) before and after each operation.
+        REFRESH_POLICY_POSITIONS_ORDERS (int): Reload the positions and orders only.
+        REFRESH_POLICY_LAZY (int): Invalidate the account, it is reloaded when read.
+    """
+
+    REFRESH_POLICY_FULL: int = auto()
+    REFRESH_POLICY_POSITIONS_ORDERS: int = auto()
+    REFRESH_POLICY_LAZY: int = auto()
+
+
 class ENUM_ACCOUNT_TRADE_MODE(IntEnum):
     """Account Trade Mode
 
@@ -623,7 +640,7 @@ class MqlSymbolInfo(BaseModel):
     name: str
 
     @classmethod
-    def parse_symbol(cls, symbol: mt5.SymbolInfo) -> "MqlSymbolInfo":
+    def parse_symbol(cls, symbol: "mt5.SymbolInfo") -> "MqlSymbolInfo":
         """Parse a mt5.SymbolInfo object to MqlSymbolInfo
 
         Args:
@@ -758,6 +775,11 @@ class MqlTradeRequest(BaseModel):
                 request.update({"comment": self.comment})
             if self.magic:
                 request.update({"magic": self.magic})
+            # Position closed by the deal, in hedging accounts
+            if self.position:
+                request.update({"position": self.position})
+            if self.position_by:
+                request.update({"position_by": self.position_by})
 
         elif self.action == ENUM_TRADE_REQUEST_ACTIONS.TRADE_ACTION_PENDING:
             request.update(
@@ -857,7 +879,7 @@ class MqlTradeRequest(BaseModel):
         return request
 
     @classmethod
-    def parse_request(cls, request: mt5.TradeRequest) -> "MqlTradeRequest":
+    def parse_request(cls, request: "mt5.TradeRequest") -> "MqlTradeRequest":
         """Parse a mt5.TradeRequest to MqlTradeRequest
 
         Args:
@@ -1152,6 +1174,8 @@ class MqlTradeResult(BaseModel):
         request_id (int): Request ID set by the terminal during the dispatch
         retcode_external (int): Return code of an external trading system
         request (MqlTradeRequest): The request that generate this result.
+        attempts (int): Requests sent, retries included
+        latency (float): Seconds from the first request to this result
     """
 
     retcode: ENUM_TRADE_RETCODE
@@ -1164,16 +1188,23 @@ class MqlTradeResult(BaseModel):
     comment: str
     request_id: int
     retcode_external: int
+    # Utils attributes
+    attempts: Optional[int] = 1
+    latency: Optional[float] = 0
 
     class Config:
         validate_assignment = True
 
     @classmethod
-    def parse_result(cls, result: mt5.OrderSendResult) -> "MqlTradeResult":
+    def parse_result(
+        cls, result: "mt5.OrderSendResult", validate: bool = True
+    ) -> "MqlTradeResult":
         """Parse a mt5.OrderSendResult object to MqlTradeResult
 
         Args:
             result (mt5.OrderSendResult): mt5 result object
+            validate (bool, optional): Validate the fields, the terminal results
+            already have the right types. Defaults to True.
 
         Raises:
             NotExpectedParseType: Type not expected
@@ -1203,6 +1234,10 @@ class MqlTradeResult(BaseModel):
             raise NotExpectedParseType(
                 f"{cls.__name__} expected mt5.OrderSendResult not {result.__class__.__name__}"
             )
+
+        if not validate:
+            return cls.construct(**dict_result)
+
         return cls(**dict_result)
 
 
@@ -1257,7 +1292,7 @@ class MqlPositionInfo(BaseModel):
         self.__dict__.update(kwargs)
 
     @classmethod
-    def parse_position(cls, position: mt5.TradePosition) -> "MqlPositionInfo":
+    def parse_position(cls, position: "mt5.TradePosition") -> "MqlPositionInfo":
         """Parse a mt5.TradePosition to MqlPositionInfo
 
         Args:
@@ -1415,7 +1450,7 @@ class MqlTradeOrder(BaseModel):
         self.__dict__.update(kwargs)
 
     @classmethod
-    def parse_order(cls, order: mt5.TradeOrder) -> "MqlTradeOrder":
+    def parse_order(cls, order: "mt5.TradeOrder") -> "MqlTradeOrder":
         """Parse a mt5.TradeOrder to MqlTradeOrder
 
         Args:
@@ -1584,7 +1619,7 @@ class MqlTradeDeal(BaseModel):
     external_id: Optional[str] = ""
 
     @classmethod
-    def parse_deal(cls, deal: mt5.TradeDeal) -> "MqlTradeDeal":
+    def parse_deal(cls, deal: "mt5.TradeDeal") -> "MqlTradeDeal":
         """Parse a mt5.TradeDeal to MqlTradeDeal
 
         Args:
@@ -1730,6 +1765,96 @@ class MqlTick(BaseModel):
         return value
 
 
+class HistoryDealsSync:
+    """Incremental synchronization of the account history deals
+
+    The first sync downloads the whole history, the next ones request only the
+    deals after the last synced one and parse only the tickets not synced yet, so
+    a refresh costs the new activity instead of the account age. The deals times
+    are in the server time zone, so each request starts one day before the last
+    deal. A change of backend, login or server restarts the history. The sync is
+    shared by the refreshes of every thread, it is guarded by a lock.
+    """
+
+    # Deals types of the account history
+    DEAL_TYPES = (
+        ENUM_DEAL_TYPE.DEAL_TYPE_BUY,
+        ENUM_DEAL_TYPE.DEAL_TYPE_SELL,
+        ENUM_DEAL_TYPE.DEAL_TYPE_BALANCE,
+    )
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.reset()
+
+    def reset(self, account_key: tuple = None) -> None:
+        """Forget the synced deals
+
+        Args:
+            account_key (tuple, optional): Backend, login and server of the new
+            history. Defaults to None.
+        """
+        with self.lock:
+            self.account_key = account_key
+            self.deals: List[MqlTradeDeal] = []
+            self.tickets = set()
+            self.last_time = None
+            # Sum of the synced deals profits, without commissions, swaps and fees
+            self.deals_profit = 0.0
+
+    def sync(self, login: int = None, server: str = None) -> List[MqlTradeDeal]:
+        """Append the new deals of the account history
+
+        Args:
+            login (int, optional): Account login. Defaults to None.
+            server (str, optional): Account server. Defaults to None.
+
+        Returns:
+            List[MqlTradeDeal]: Every synced deal, in the history order
+        """
+        with self.lock:
+            return self.__sync(login, server)
+
+    def __sync(self, login: int, server: str) -> List[MqlTradeDeal]:
+        """Append the new deals of the account history, with the lock held
+
+        Args:
+            login (int): Account login
+            server (str): Account server
+
+        Returns:
+            List[MqlTradeDeal]: Copy of the synced deals
+        """
+        backend = get_backend()
+        if (
+            self.account_key is None
+            or self.account_key[0] is not backend
+            or self.account_key[1:] != (login, server)
+        ):
+            self.reset((backend, login, server))
+
+        date_from = (
+            datetime(1970, 1, 2, tzinfo=timezone.utc)
+            if self.last_time is None
+            else datetime.fromtimestamp(self.last_time - 86_400, timezone.utc)
+        )
+
+        for deal in mt5.history_deals_get(
+            date_from,
+            # Cannot get the server time zone, so set the now() time to one day later
+            datetime.now(timezone.utc) + timedelta(days=1),
+        ):
+            if deal.ticket in self.tickets or deal.type not in self.DEAL_TYPES:
+                continue
+
+            self.deals.append(MqlTradeDeal.parse_deal(deal))
+            self.tickets.add(deal.ticket)
+            self.last_time = max(self.last_time or 0, int(deal.time))
+            self.deals_profit += deal.profit
+
+        return list(self.deals)
+
+
 class MqlAccountInfo(BaseModel):
     """Account Info
 
@@ -1803,9 +1928,11 @@ class MqlAccountInfo(BaseModel):
     positions: Optional[List[MqlPositionInfo]] = []
     history_deals: Optional[List[MqlTradeDeal]] = []
     is_backtest_account: Optional[bool] = False
+    # Live history deals, shared by the refreshes
+    history_deals_sync: ClassVar[HistoryDealsSync] = HistoryDealsSync()
 
     @classmethod
-    def parse_account(cls, account: mt5.AccountInfo) -> "MqlAccountInfo":
+    def parse_account(cls, account: "mt5.AccountInfo") -> "MqlAccountInfo":
         """Parse a mt5.AccountInfo to MqlAccountInfo
 
         Args:
@@ -1860,7 +1987,6 @@ class MqlAccountInfo(BaseModel):
                     "is_backtest_account": False,
                     "orders": cls.get_orders(),
                     "positions": cls.get_positions(),
-                    "history_deals": cls.get_history_deals(),
                 }
             )
 
@@ -1868,9 +1994,16 @@ class MqlAccountInfo(BaseModel):
             raise NotExpectedParseType(
                 f"{cls.__name__} expected mt5.AccountInfo not {account.__class__.__name__}"
             )
-        return cls(**dict_account)
+
+        account_info = cls(**dict_account)
+
+        # The synced deals are already parsed, they are not validated again
+        account_info.history_deals = cls.get_history_deals(account.login, account.server)
+
+        return account_info
 
     @classmethod
+    @timed("MqlAccountInfo.get_positions")
     def get_positions(cls):
         # Get open positions on MetaTrader5
         positions = [
@@ -1880,6 +2013,7 @@ class MqlAccountInfo(BaseModel):
         return positions
 
     @classmethod
+    @timed("MqlAccountInfo.get_orders")
     def get_orders(cls):
         # Get positioned orders on MetaTrader5
         orders = [MqlTradeOrder.parse_order(orders) for orders in mt5.orders_get()]
@@ -1887,23 +2021,10 @@ class MqlAccountInfo(BaseModel):
         return orders
 
     @classmethod
-    def get_history_deals(cls):
-        deals = [
-            MqlTradeDeal.parse_deal(deal)
-            for deal in mt5.history_deals_get(
-                datetime(1970, 1, 2, tzinfo=timezone.utc),
-                # Cannot get the server time zone, so set the now() time to one day later
-                datetime.now(timezone.utc) + timedelta(days=1),
-            )
-            if deal.type
-            in (
-                ENUM_DEAL_TYPE.DEAL_TYPE_BUY,
-                ENUM_DEAL_TYPE.DEAL_TYPE_SELL,
-                ENUM_DEAL_TYPE.DEAL_TYPE_BALANCE,
-            )
-        ]
-
-        return deals
+    @timed("MqlAccountInfo.get_history_deals")
+    def get_history_deals(cls, login: int = None, server: str = None):
+        # Sync the new deals only
+        return cls.history_deals_sync.sync(login, server)
 
     def update_positions(self) -> None:
         # Get open positions on MetaTrader5
@@ -1915,7 +2036,7 @@ class MqlAccountInfo(BaseModel):
 
     def update_history_deals(self) -> None:
         # Get history deals on MetaTrader5
-        self.history_deals = self.get_history_deals()
+        self.history_deals = self.get_history_deals(self.login, self.server)
 
     @validator("is_backtest_account", pre=True)
     def __validate_create_balance_deal(cls, value: bool, values: dict):
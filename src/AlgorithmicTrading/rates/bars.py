@@ -0,0 +1,190 @@
+import numpy as np
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List
+
+from AlgorithmicTrading.terminal.structures import RATES_DTYPE
+from AlgorithmicTrading.rates.resample import (
+    _aggregate,
+    _get_tick_arrays,
+    get_bars_open_time,
+)
+from AlgorithmicTrading.rates.stream import TickBuffer
+from AlgorithmicTrading.utils.dates import get_broker_timestamp
+
+# Bar close callback, receives the timeframe and the closed bar
+BarCallback = Callable[[object, np.void], None]
+
+
+class LiveBarBuilder:
+    """Build the bars of many timeframes from the incoming ticks
+
+    Each timeframe keeps its forming bar and a window of the last closed bars in
+    a preallocated ring buffer. The ticks are aggregated as resample_ticks does, so
+    the live bars match the resampled history. A bar closes when the first tick of
+    a later bar arrives, or on close_expired. The ticks times are in the broker
+    time zone, so close_expired shifts the clock by its offset.
+
+    >>> builder = LiveBarBuilder([ENUM_TIMEFRAME.TIMEFRAME_M1], point=0.00001)
+    >>> builder.on_bar_close(lambda timeframe, bar: ...)
+    >>> stream.subscribe("EURUSD", callback=lambda symbol, ticks: builder.update(ticks))
+
+    Args:
+        timeframes (Iterable): Bars timeframes, ENUM_TIMEFRAME or timedelta
+        point (float): Symbol point, the spread unit
+        price (str, optional): Bars price. Defaults to "bid".
+        capacity (int, optional): Closed bars kept by timeframe. Defaults to 10_000.
+        time_offset (int, optional): Broker time zone offset from UTC in seconds,
+        e.g. 7_200 for UTC+2. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        timeframes: Iterable,
+        point: float,
+        price: str = "bid",
+        capacity: int = 10_000,
+        time_offset: int = 0,
+    ) -> None:
+        self.timeframes = list(timeframes)
+        self.time_offset = time_offset
+        self.point = point
+        self.price = price
+
+        self.bars: Dict[object, TickBuffer] = {
+            timeframe: TickBuffer(capacity, dtype=RATES_DTYPE)
+            for timeframe in self.timeframes
+        }
+        self.forming: Dict[object, np.ndarray] = {
+            timeframe: None for timeframe in self.timeframes
+        }
+        self.callbacks: List[BarCallback] = []
+
+    def on_bar_close(self, callback: BarCallback) -> BarCallback:
+        """Register a bar close callback
+
+        Args:
+            callback (BarCallback): Called with the timeframe and each closed bar
+
+        Returns:
+            BarCallback: The callback, so the method can decorate it
+        """
+        self.callbacks.append(callback)
+
+        return callback
+
+    def __close(self, timeframe, closed: np.ndarray) -> None:
+        """Store the closed bars and notify the callbacks
+
+        Args:
+            timeframe (ENUM_TIMEFRAME | timedelta): Bars timeframe
+            closed (np.ndarray): Closed bars
+        """
+        if not len(closed):
+            return
+
+        self.bars[timeframe].append(closed)
+
+        for bar in closed:
+            for callback in self.callbacks:
+                callback(timeframe, bar)
+
+    def update(self, ticks) -> Dict[object, np.ndarray]:
+        """Add new ticks to the bars of every timeframe
+
+        Args:
+            ticks (np.ndarray | pd.DataFrame): New ticks, sorted, after the ticks
+            already added
+
+        Returns:
+            Dict[object, np.ndarray]: Bars closed by these ticks, by timeframe
+        """
+        time_msc, prices, spread, volume = _get_tick_arrays(ticks, self.price)
+        closed_bars = {}
+
+        if not len(prices):
+            return closed_bars
+
+        for timeframe in self.timeframes:
+            open_time = get_bars_open_time(time_msc // 1_000, timeframe)
+            starts = np.flatnonzero(np.diff(open_time, prepend=open_time[:1] - 1))
+            bars = _aggregate(
+                starts, open_time[starts], prices, spread, volume, self.point
+            )
+
+            forming = self.forming[timeframe]
+            closed = bars[:-1]
+
+            if forming is not None:
+                if forming["time"][0] == bars["time"][0]:
+                    # The first ticks continue the forming bar
+                    first = bars[0]
+                    first["open"] = forming["open"][0]
+                    first["high"] = max(first["high"], forming["high"][0])
+                    first["low"] = min(first["low"], forming["low"][0])
+                    first["tick_volume"] += forming["tick_volume"][0]
+                    first["spread"] = min(first["spread"], forming["spread"][0])
+                    first["real_volume"] += forming["real_volume"][0]
+                else:
+                    closed = np.concatenate([forming, closed])
+
+            self.forming[timeframe] = bars[-1:].copy()
+            self.__close(timeframe, closed)
+            closed_bars[timeframe] = closed
+
+        return closed_bars
+
+    def close_expired(self, date: datetime = None) -> Dict[object, np.ndarray]:
+        """Close the forming bars whose period ended, without waiting a new tick
+
+        Args:
+            date (datetime, optional): Current broker time, as the ticks times.
+            Defaults to the clock shifted by the broker offset.
+
+        Returns:
+            Dict[object, np.ndarray]: Closed bars, by timeframe
+        """
+        if date is None:
+            now = get_broker_timestamp(self.time_offset)
+        else:
+            if date.tzinfo is None:
+                date = date.replace(tzinfo=timezone.utc)
+            now = int(date.timestamp())
+        closed_bars = {}
+
+        for timeframe, forming in self.forming.items():
+            if forming is None:
+                continue
+
+            # The next bar open time, also for the calendar months
+            next_open = get_bars_open_time([now], timeframe)[0]
+            if next_open > forming["time"][0]:
+                self.forming[timeframe] = None
+                self.__close(timeframe, forming)
+                closed_bars[timeframe] = forming
+
+        return closed_bars
+
+    def get_forming(self, timeframe) -> np.void:
+        """Get the forming bar of a timeframe
+
+        Args:
+            timeframe (ENUM_TIMEFRAME | timedelta): Bars timeframe
+
+        Returns:
+            np.void: Forming bar, None before the first tick
+        """
+        forming = self.forming[timeframe]
+
+        return None if forming is None else forming[0]
+
+    def window(self, timeframe, n_bars: int = None) -> np.ndarray:
+        """Get the last closed bars of a timeframe, as a read only view
+
+        Args:
+            timeframe (ENUM_TIMEFRAME | timedelta): Bars timeframe
+            n_bars (int, optional): Bars count. Defaults to every bar kept.
+
+        Returns:
+            np.ndarray: Closed bars, with the copy_rates_* dtype, oldest first
+        """
+        return self.bars[timeframe].window(n_bars)
@@ -0,0 +1,327 @@
+import threading
+import numpy as np
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Tuple
+
+from AlgorithmicTrading.terminal import mt5
+from AlgorithmicTrading.terminal.structures import RATES_DTYPE
+from AlgorithmicTrading.utils.dates import get_broker_timestamp, get_timeframe_seconds
+
+SATURDAY = 5
+
+
+def _timestamp(date: datetime) -> int:
+    """Get a datetime timestamp in seconds, naive datetimes are UTC
+
+    Args:
+        date (datetime): Datetime
+
+    Returns:
+        int: Timestamp in seconds
+    """
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return int(date.timestamp())
+
+
+class CandleCache:
+    """Candles cache by symbol and timeframe, with the intervals already known
+
+    The coverage of a symbol and timeframe is a list of merged [from, to] intervals
+    (timestamps in seconds, both included): every candle opened inside them is in
+    the cache, so an interval with no candles (weekend, holiday) is requested
+    once. A request only downloads the uncovered intervals holding at least one
+    candle open time, and skips the closed days of the market.
+
+    The last candle is still open until its timeframe ends, so the coverage stops
+    before it and each poll downloads only that candle and the new ones. The
+    candles times are in the broker time zone, so the clock is shifted by its
+    offset. The terminal requests are sent without holding the lock.
+
+    Args:
+        max_bars (int, optional): Candles kept by symbol and timeframe, the oldest
+        are dropped. Defaults to 1_000_000.
+        closed_days (Iterable[int], optional): Week days without candles, in broker
+        time, Monday is 0. Defaults to (SATURDAY,).
+        time_offset (int, optional): Broker time zone offset from UTC in seconds.
+        Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        max_bars: int = 1_000_000,
+        closed_days: Iterable[int] = (SATURDAY,),
+        time_offset: int = 0,
+    ) -> None:
+        self.max_bars = max_bars
+        self.closed_days = frozenset(closed_days)
+        self.time_offset = time_offset
+        self.rates: Dict[Tuple[str, int], np.ndarray] = {}
+        self.coverage: Dict[Tuple[str, int], List[List[int]]] = {}
+        self.lock = threading.RLock()
+
+    def __contains__(self, key: Tuple[str, int]) -> bool:
+        return key in self.rates
+
+    def clear(self) -> None:
+        """Remove every cached candle"""
+        with self.lock:
+            self.rates.clear()
+            self.coverage.clear()
+
+    # Coverage ------------------------------------------------------------------------
+    def get_gaps(
+        self, symbol: str, timeframe: int, time_from: int, time_to: int
+    ) -> List[Tuple[int, int]]:
+        """Get the intervals of a range that must be downloaded
+
+        Args:
+            symbol (str): Symbol
+            timeframe (int): Timeframe
+            time_from (int): From timestamp, included
+            time_to (int): To timestamp, included
+
+        Returns:
+            List[Tuple[int, int]]: Uncovered intervals, both ends included
+        """
+        gaps = []
+        start = time_from
+
+        for covered_from, covered_to in self.coverage.get((symbol, timeframe), []):
+            if covered_to < start:
+                continue
+            if covered_from > time_to:
+                break
+            if covered_from > start:
+                gaps.append((start, covered_from - 1))
+            start = max(start, covered_to + 1)
+
+        if start <= time_to:
+            gaps.append((start, time_to))
+
+        return [
+            gap
+            for gap in gaps
+            if self.has_candles(timeframe, *gap, closed_days=self.closed_days)
+        ]
+
+    @staticmethod
+    def has_candles(
+        timeframe: int,
+        time_from: int,
+        time_to: int,
+        closed_days: Iterable[int] = (SATURDAY,),
+    ) -> bool:
+        """Check if an interval can hold a candle open time
+
+        Args:
+            timeframe (int): Timeframe
+            time_from (int): From timestamp, included
+            time_to (int): To timestamp, included
+            closed_days (Iterable[int], optional): Week days without candles,
+            Monday is 0. Defaults to (SATURDAY,).
+
+        Returns:
+            bool: The interval must be requested
+        """
+        # Inside one closed day, the timestamp 0 is a Thursday
+        day_from, day_to = time_from // 86_400, time_to // 86_400
+        if day_from == day_to and (day_from + 3) % 7 in closed_days:
+            return False
+
+        try:
+            seconds = get_timeframe_seconds(timeframe)
+        except ValueError:
+            # Monthly candles
+            return True
+
+        # First candle open time inside the interval
+        weekly_offset = 3 * 86_400 if seconds % 604_800 == 0 else 0
+        first_open = -(-(time_from - weekly_offset) // seconds) * seconds
+        first_open += weekly_offset
+
+        return first_open <= time_to
+
+    def add(
+        self,
+        symbol: str,
+        timeframe: int,
+        rates: np.ndarray,
+        time_from: int,
+        time_to: int,
+        now: int = None,
+    ) -> None:
+        """Add the candles downloaded for an interval
+
+        Args:
+            symbol (str): Symbol
+            timeframe (int): Timeframe
+            rates (np.ndarray): Candles, with the copy_rates_* dtype
+            time_from (int): Requested from timestamp
+            time_to (int): Requested to timestamp
+            now (int, optional): Current broker timestamp. Defaults to the clock.
+        """
+        key = (symbol, timeframe)
+        now = get_broker_timestamp(self.time_offset) if now is None else now
+
+        # The open candle is not final, it is requested again
+        if len(rates):
+            try:
+                close_time = rates["time"][-1] + get_timeframe_seconds(timeframe)
+                open_candle = close_time > now
+            except ValueError:
+                open_candle = True
+
+            if open_candle:
+                time_to = min(time_to, int(rates["time"][-1]) - 1)
+
+        time_to = min(time_to, now)
+
+        with self.lock:
+            # Merge, the new candles replace the cached ones
+            cached = self.rates.get(key, np.zeros(0, dtype=RATES_DTYPE))
+            merged = np.concatenate([rates.astype(RATES_DTYPE, copy=False), cached])
+            _, unique = np.unique(merged["time"], return_index=True)
+            merged = merged[unique]
+
+            coverage = self.coverage.get(key, [])
+            if time_from <= time_to:
+                coverage = self.merge_intervals(coverage + [[time_from, time_to]])
+
+            # Drop the oldest candles and their coverage
+            if len(merged) > self.max_bars:
+                merged = merged[-self.max_bars :]
+                oldest = int(merged["time"][0])
+                coverage = [
+                    [max(start, oldest), end]
+                    for start, end in coverage
+                    if end >= oldest
+                ]
+
+            self.rates[key] = merged
+            self.coverage[key] = coverage
+
+    @staticmethod
+    def merge_intervals(intervals: List[List[int]]) -> List[List[int]]:
+        """Merge the overlapping and adjacent intervals
+
+        Args:
+            intervals (List[List[int]]): Intervals, both ends included
+
+        Returns:
+            List[List[int]]: Sorted merged intervals
+        """
+        merged = []
+
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        return merged
+
+    # Requests ------------------------------------------------------------------------
+    def get_range(
+        self, symbol: str, timeframe: int, date_from: datetime, date_to: datetime
+    ) -> np.ndarray:
+        """Get the candles of a range, downloading the uncovered intervals only
+
+        Args:
+            symbol (str): Symbol
+            timeframe (int): Timeframe
+            date_from (datetime): From date, included
+            date_to (datetime): To date, included
+
+        Raises:
+            TypeError: Request error
+
+        Returns:
+            np.ndarray: Candles, with the copy_rates_* dtype
+        """
+        time_from, time_to = _timestamp(date_from), _timestamp(date_to)
+
+        with self.lock:
+            gaps = self.get_gaps(symbol, timeframe, time_from, time_to)
+
+        # Concurrent requests of one gap are merged by add
+        for gap_from, gap_to in gaps:
+            rates = mt5.copy_rates_range(
+                symbol,
+                timeframe,
+                datetime.fromtimestamp(gap_from, timezone.utc),
+                datetime.fromtimestamp(gap_to, timezone.utc),
+            )
+
+            if rates is None:
+                raise TypeError(
+                    "[ERROR]: Request error, please check the request format"
+                )
+
+            self.add(symbol, timeframe, rates, gap_from, gap_to)
+
+        with self.lock:
+            rates = self.rates.get((symbol, timeframe), np.zeros(0, dtype=RATES_DTYPE))
+            start, end = np.searchsorted(rates["time"], [time_from, time_to + 1])
+
+            return rates[start:end].copy()
+
+    def get_before(
+        self, symbol: str, timeframe: int, date_to: datetime, n_candles: int
+    ) -> np.ndarray:
+        """Get the last candles before a date
+
+        When the cache holds enough contiguous candles before the date, only the
+        candles after the cached ones are downloaded.
+
+        Args:
+            symbol (str): Symbol
+            timeframe (int): Timeframe
+            date_to (datetime): To date, included
+            n_candles (int): Candles count
+
+        Raises:
+            TypeError: Request error
+
+        Returns:
+            np.ndarray: Candles, with the copy_rates_* dtype
+        """
+        key, time_to = (symbol, timeframe), _timestamp(date_to)
+        first_candle = None
+
+        with self.lock:
+            rates = self.rates.get(key, np.zeros(0, dtype=RATES_DTYPE))
+            intervals = [
+                interval
+                for interval in self.coverage.get(key, [])
+                if interval[0] <= time_to
+            ]
+
+            if intervals:
+                # Cached candles of the last covered interval before the date
+                covered_from, covered_to = intervals[-1]
+                start, end = np.searchsorted(
+                    rates["time"], [covered_from, min(covered_to, time_to) + 1]
+                )
+
+                if end - start >= n_candles:
+                    first_candle = int(rates["time"][end - n_candles])
+
+        if first_candle is not None:
+            return self.get_range(
+                symbol,
+                timeframe,
+                datetime.fromtimestamp(first_candle, timezone.utc),
+                date_to,
+            )[-n_candles:]
+
+        rates = mt5.copy_rates_from(symbol, timeframe, date_to, n_candles)
+
+        if rates is None:
+            raise TypeError("[ERROR]: Request error, please check the request format")
+
+        if len(rates):
+            self.add(symbol, timeframe, rates, int(rates["time"][0]), time_to)
+
+        return rates
@@ -0,0 +1,306 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List
+
+from AlgorithmicTrading.terminal import mt5
+from AlgorithmicTrading.models.metatrader import ENUM_TIMEFRAME
+from AlgorithmicTrading.rates.resample import rates_to_frame
+from AlgorithmicTrading.utils.dates import get_broker_timestamp, get_timeframe_seconds
+from AlgorithmicTrading.utils.files import get_timeframe_name, write_dataset
+from AlgorithmicTrading.utils.metatrader import decorator_validate_mt5_connection
+
+# Dataset timeframe of the ticks
+TICKS = "ticks"
+# Longest month, used to size the monthly chunks
+MONTH_SECONDS = 31 * 86_400
+
+
+class DownloadManager:
+    """Download the candles and ticks of many symbols into the dataset store
+
+    A job (symbols x timeframes x date range) is split in chunks under the terminal
+    max bars, downloaded by a pool of workers and written straight to the dataset.
+    Each finished chunk is recorded in a manifest, so an interrupted job resumes
+    where it stopped, and each chunk always writes the same files, so a chunk
+    downloaded twice is not duplicated. The chunks ending after the current broker
+    time are partial, they are written but downloaded again by the next run.
+
+    Args:
+        root (str): Dataset directory
+        workers (int, optional): Concurrent downloads. Defaults to 4.
+        max_retries (int, optional): Retries of a failed chunk. Defaults to 3.
+        backoff (float, optional): First retry delay in seconds, doubled on each
+        retry. Defaults to 1.0.
+        max_backoff (float, optional): Longest retry delay in seconds. Defaults to
+        30.0.
+        chunk_bars (int, optional): Candles per chunk. Defaults to the terminal max
+        bars.
+        ticks_chunk (timedelta, optional): Ticks chunk length. Defaults to 1 day.
+        manifest_file (str, optional): Checkpoint manifest. Defaults to
+        "<root>/_manifest.json".
+        time_offset (int, optional): Broker time zone offset from UTC in seconds.
+        Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        workers: int = 4,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        chunk_bars: int = None,
+        ticks_chunk: timedelta = timedelta(days=1),
+        manifest_file: str = None,
+        time_offset: int = 0,
+    ) -> None:
+        self.root = root
+        self.workers = workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.chunk_bars = chunk_bars
+        self.ticks_chunk = ticks_chunk
+        # Files starting with "_" are ignored by the dataset reader
+        self.manifest_file = manifest_file or os.path.join(root, "_manifest.json")
+        self.time_offset = time_offset
+
+        self.lock = threading.Lock()
+        self.manifest = self.load_manifest()
+
+    # Manifest ------------------------------------------------------------------------
+    def load_manifest(self) -> Dict[str, dict]:
+        """Load the finished chunks of the previous runs
+
+        Returns:
+            Dict[str, dict]: Finished chunks, by key
+        """
+        if not os.path.exists(self.manifest_file):
+            return {}
+
+        with open(self.manifest_file, "r", encoding="utf-8") as file:
+            return json.load(file)["chunks"]
+
+    def save_manifest(self) -> None:
+        """Write the manifest, replacing the previous one atomically"""
+        os.makedirs(os.path.dirname(self.manifest_file) or ".", exist_ok=True)
+        temporary_file = self.manifest_file + ".tmp"
+
+        with open(temporary_file, "w", encoding="utf-8") as file:
+            json.dump({"chunks": self.manifest}, file, indent=1)
+
+        os.replace(temporary_file, self.manifest_file)
+
+    # Chunks --------------------------------------------------------------------------
+    def get_chunk_length(self, timeframe) -> timedelta:
+        """Get the length of the chunks of a timeframe
+
+        Args:
+            timeframe (ENUM_TIMEFRAME | str): Candles timeframe or "ticks"
+
+        Returns:
+            timedelta: Chunk length
+        """
+        if timeframe == TICKS:
+            return self.ticks_chunk
+
+        if self.chunk_bars is None:
+            # Keep one bar of margin, the range includes both ends
+            self.chunk_bars = mt5.terminal_info().maxbars - 1
+
+        try:
+            seconds = get_timeframe_seconds(timeframe)
+        except ValueError:
+            seconds = MONTH_SECONDS
+
+        return timedelta(seconds=seconds * self.chunk_bars)
+
+    def plan(
+        self,
+        symbols: Iterable[str],
+        date_from: datetime,
+        date_to: datetime,
+        timeframes: Iterable = (ENUM_TIMEFRAME.TIMEFRAME_M5,),
+    ) -> List[dict]:
+        """Split a job in chunks, without the chunks finished by previous runs
+
+        Args:
+            symbols (Iterable[str]): Symbols
+            date_from (datetime): From date, included
+            date_to (datetime): To date, excluded
+            timeframes (Iterable, optional): Candles timeframes, "ticks" for ticks.
+            Defaults to (TIMEFRAME_M5,).
+
+        Returns:
+            List[dict]: Pending chunks
+        """
+        chunks = []
+
+        for symbol in symbols:
+            for timeframe in timeframes:
+                length = self.get_chunk_length(timeframe)
+                chunk_from = date_from
+
+                while chunk_from < date_to:
+                    chunk_to = min(chunk_from + length, date_to)
+                    key = "/".join(
+                        [
+                            symbol,
+                            get_timeframe_name(timeframe),
+                            str(int(chunk_from.timestamp())),
+                            str(int(chunk_to.timestamp())),
+                        ]
+                    )
+
+                    if key not in self.manifest:
+                        chunks.append(
+                            {
+                                "key": key,
+                                "symbol": symbol,
+                                "timeframe": timeframe,
+                                "date_from": chunk_from,
+                                "date_to": chunk_to,
+                            }
+                        )
+
+                    chunk_from = chunk_to
+
+        return chunks
+
+    def request_chunk(self, chunk: dict):
+        """Request a chunk data to the terminal
+
+        Args:
+            chunk (dict): Chunk
+
+        Raises:
+            ConnectionError: The terminal request failed
+
+        Returns:
+            np.ndarray: Chunk data, without the chunk end
+        """
+        symbol, date_from, date_to = (
+            chunk["symbol"],
+            chunk["date_from"],
+            chunk["date_to"],
+        )
+
+        if chunk["timeframe"] == TICKS:
+            data = mt5.copy_ticks_range(symbol, date_from, date_to, mt5.COPY_TICKS_ALL)
+        else:
+            data = mt5.copy_rates_range(symbol, chunk["timeframe"], date_from, date_to)
+
+        if data is None:
+            raise ConnectionError(
+                f"[ERROR]: Download of {chunk['key']} failed: {mt5.last_error()}"
+            )
+
+        # The ranges include the end date on some requests, it is the next chunk start
+        return data[data["time"] < int(date_to.timestamp())]
+
+    def download_chunk(self, chunk: dict) -> int:
+        """Download a chunk into the dataset, retrying on errors
+
+        Args:
+            chunk (dict): Chunk
+
+        Raises:
+            ConnectionError: The chunk failed after every retry
+
+        Returns:
+            int: Rows written
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                data = self.request_chunk(chunk)
+                break
+            except ConnectionError:
+                if attempt == self.max_retries:
+                    raise
+
+                time.sleep(min(self.max_backoff, self.backoff * 2**attempt))
+
+        if len(data):
+            write_dataset(
+                rates_to_frame(data),
+                self.root,
+                chunk["symbol"],
+                chunk["timeframe"],
+                # Same files on every download of the chunk
+                basename=hashlib.sha1(chunk["key"].encode()).hexdigest(),
+            )
+
+        # Only the finished chunks are checkpointed, the open ones get new data
+        if int(chunk["date_to"].timestamp()) >= get_broker_timestamp(self.time_offset):
+            return len(data)
+
+        with self.lock:
+            self.manifest[chunk["key"]] = {
+                "rows": len(data),
+                "finished": datetime.now(timezone.utc).isoformat(),
+            }
+            self.save_manifest()
+
+        return len(data)
+
+    @decorator_validate_mt5_connection
+    def run(
+        self,
+        symbols: Iterable[str],
+        date_from: datetime,
+        date_to: datetime,
+        timeframes: Iterable = (ENUM_TIMEFRAME.TIMEFRAME_M5,),
+    ) -> dict:
+        """Download a job, resuming the previous runs
+
+        The symbols are validated once for the whole job instead of on every request.
+
+        Args:
+            symbols (Iterable[str]): Symbols
+            date_from (datetime): From date, included
+            date_to (datetime): To date, excluded
+            timeframes (Iterable, optional): Candles timeframes, "ticks" for ticks.
+            Defaults to (TIMEFRAME_M5,).
+
+        Raises:
+            ValueError: A symbol is not in the symbols list
+            ValueError: Invalid date range
+
+        Returns:
+            dict: Downloaded chunks, rows and failed chunks keys with their errors
+        """
+        symbols = list(symbols)
+        symbols_names = {symbol.name for symbol in mt5.symbols_get()}
+
+        unknown_symbols = [symbol for symbol in symbols if symbol not in symbols_names]
+        if unknown_symbols:
+            raise ValueError(
+                f"[ERROR]: The symbols {unknown_symbols} are not in the symbols list"
+            )
+
+        if date_from >= date_to:
+            raise ValueError("[ERROR]: Invalid date range")
+
+        chunks = self.plan(symbols, date_from, date_to, timeframes)
+        summary = {"chunks": 0, "rows": 0, "failed": {}}
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(self.download_chunk, chunk): chunk["key"]
+                for chunk in chunks
+            }
+
+            for future in as_completed(futures):
+                try:
+                    summary["rows"] += future.result()
+                    summary["chunks"] += 1
+                except Exception as e:
+                    # The other chunks go on, the next run retries this one
+                    summary["failed"][futures[future]] = str(e)
+
+        return summary
@@ -0,0 +1,206 @@
+import numpy as np
+import pandas as pd
+from typing import List
+
+from AlgorithmicTrading.models.metatrader import MqlSymbolInfo
+
+# Columns of the rates and ticks frames, with the TradingEnv names
+PRICE_COLUMNS = ("open", "high", "low", "close", "bid", "ask", "last")
+PRICE_COLUMNS += ("Open", "High", "Low", "Close", "Adj Close")
+VOLUME_COLUMNS = ("tick_volume", "real_volume", "volume", "Volume")
+TIME_COLUMNS = ("time", "Datetime")
+
+POINTS_DTYPE = np.int32
+VOLUME_DTYPE = np.uint32
+FEATURE_DTYPE = np.float32
+
+# Normalization parameters, stored in the frame attributes for the round trip
+NORMALIZATION_ATTRIBUTE = "normalization"
+
+
+def prices_to_points(prices: np.ndarray, tick_size: float) -> np.ndarray:
+    """Convert prices to integer points
+
+    Args:
+        prices (np.ndarray): Prices
+        tick_size (float): Symbol minimal price change
+
+    Raises:
+        ValueError: The points do not fit in 32 bits
+
+    Returns:
+        np.ndarray: Prices in int32 points
+    """
+    points = np.rint(np.asarray(prices, dtype=np.float64) / tick_size)
+
+    if points.size and np.abs(points).max() > np.iinfo(POINTS_DTYPE).max:
+        raise ValueError(
+            "[ERROR]: The prices in points do not fit in 32 bits, "
+            "keep this symbol prices as floats"
+        )
+
+    return points.astype(POINTS_DTYPE)
+
+
+def points_to_prices(points: np.ndarray, tick_size: float, digits: int) -> np.ndarray:
+    """Convert integer points back to prices
+
+    The result is rounded to the symbol digits, so the prices of a symbol are the
+    same before and after the round trip.
+
+    Args:
+        points (np.ndarray): Prices in points
+        tick_size (float): Symbol minimal price change
+        digits (int): Symbol digits after the decimal point
+
+    Returns:
+        np.ndarray: Prices
+    """
+    return np.round(np.asarray(points, dtype=np.float64) * tick_size, digits)
+
+
+def datetimes_to_ms(datetimes) -> np.ndarray:
+    """Convert datetimes to int64 ms timestamps
+
+    Args:
+        datetimes (pd.Series | pd.Index): Datetimes, naive datetimes are UTC
+
+    Returns:
+        np.ndarray: Timestamps in ms
+    """
+    datetimes = pd.DatetimeIndex(pd.to_datetime(datetimes, utc=True))
+
+    return datetimes.as_unit("ms").asi8
+
+
+def ms_to_datetimes(timestamps: np.ndarray) -> pd.DatetimeIndex:
+    """Convert int64 ms timestamps back to UTC datetimes
+
+    Args:
+        timestamps (np.ndarray): Timestamps in ms
+
+    Returns:
+        pd.DatetimeIndex: UTC datetimes
+    """
+    return pd.to_datetime(np.asarray(timestamps), unit="ms", utc=True)
+
+
+def normalize_frame(
+    df: pd.DataFrame,
+    symbol_data: MqlSymbolInfo = None,
+    features: bool = True,
+) -> pd.DataFrame:
+    """Cast a candles, ticks or features frame to compact dtypes
+
+    - Prices: int32 points (price / trade_tick_size), when the symbol data is given
+    - Volumes: uint32
+    - Times (columns and datetime index): int64 ms timestamps
+    - Other float columns (features): float32
+
+    The parameters are stored in df.attrs, denormalize_frame reverts the prices,
+    volumes and times without loss.
+
+    Args:
+        df (pd.DataFrame): Frame returned by Rates or a features frame
+        symbol_data (MqlSymbolInfo, optional): Symbol data, the prices stay floats
+        without it. Defaults to None.
+        features (bool, optional): Cast the features to float32. Defaults to True.
+
+    Raises:
+        ValueError: A volume does not fit in 32 bits
+
+    Returns:
+        pd.DataFrame: Normalized copy of the frame
+    """
+    df = df.copy(deep=False)
+    normalization = {
+        "tick_size": None,
+        "digits": None,
+        "prices": [],
+        "volumes": {},
+        "times": [],
+        "index": False,
+    }
+
+    for column in df.columns:
+        if column in PRICE_COLUMNS and symbol_data is not None:
+            df[column] = prices_to_points(
+                df[column].to_numpy(), symbol_data.trade_tick_size
+            )
+            normalization["prices"].append(column)
+
+        elif column in VOLUME_COLUMNS:
+            if len(df) and df[column].max() > np.iinfo(VOLUME_DTYPE).max:
+                raise ValueError(
+                    f"[ERROR]: The '{column}' volumes do not fit in 32 bits"
+                )
+
+            normalization["volumes"][column] = str(df[column].dtype)
+            df[column] = df[column].astype(VOLUME_DTYPE)
+
+        elif column in TIME_COLUMNS:
+            df[column] = datetimes_to_ms(df[column])
+            normalization["times"].append(column)
+
+        elif features and pd.api.types.is_float_dtype(df[column].dtype):
+            df[column] = df[column].astype(FEATURE_DTYPE)
+
+    # Datetime index, as returned by Rates.get_last_n_candles
+    if isinstance(df.index, pd.DatetimeIndex):
+        df.index = pd.Index(datetimes_to_ms(df.index), name=df.index.name)
+        normalization["index"] = True
+
+    if normalization["prices"]:
+        normalization["tick_size"] = symbol_data.trade_tick_size
+        normalization["digits"] = symbol_data.digits
+
+    df.attrs[NORMALIZATION_ATTRIBUTE] = normalization
+
+    return df
+
+
+def denormalize_frame(df: pd.DataFrame, columns: List[str] = None) -> pd.DataFrame:
+    """Revert normalize_frame on the prices, volumes and times
+
+    The features stay float32, their extra precision is not recovered.
+
+    Args:
+        df (pd.DataFrame): Frame returned by normalize_frame
+        columns (List[str], optional): Columns reverted. Defaults to all columns.
+
+    Raises:
+        ValueError: The frame was not normalized
+
+    Returns:
+        pd.DataFrame: Copy of the frame with float prices and UTC datetimes
+    """
+    normalization = df.attrs.get(NORMALIZATION_ATTRIBUTE)
+
+    if normalization is None:
+        raise ValueError("[ERROR]: The frame was not normalized")
+
+    df = df.copy(deep=False)
+    columns = df.columns if columns is None else columns
+
+    for column in normalization["prices"]:
+        if column in columns:
+            df[column] = points_to_prices(
+                df[column].to_numpy(),
+                normalization["tick_size"],
+                normalization["digits"],
+            )
+
+    for column, dtype in normalization["volumes"].items():
+        if column in columns:
+            df[column] = df[column].astype(dtype)
+
+    for column in normalization["times"]:
+        if column in columns:
+            df[column] = ms_to_datetimes(df[column].to_numpy())
+
+    if normalization["index"]:
+        df.index = ms_to_datetimes(df.index.to_numpy()).rename(df.index.name)
+
+    del df.attrs[NORMALIZATION_ATTRIBUTE]
+
+    return df
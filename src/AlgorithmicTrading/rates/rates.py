@@ -1,4 +1,4 @@
-import MetaTrader5 as mt5
+from AlgorithmicTrading.terminal import mt5
 import pandas as pd
 from AlgorithmicTrading.models.metatrader import (
     ENUM_TIMEFRAME,
@@ -6,6 +6,7 @@ from AlgorithmicTrading.models.metatrader import (
     MqlTick,
     MqlSymbolInfo,
 )
+from AlgorithmicTrading.rates.cache import CandleCache
 from AlgorithmicTrading.utils.metatrader import (
     decorator_validate_mt5_connection,
     validate_mt5_ulong_size,
@@ -18,6 +19,9 @@ from typing import List
 class Rates:
     """Get symbol, rates and ticks data"""
 
+    # Candles requested with use_cache=True
+    cache = CandleCache()
+
     # Get symbol data -----------------------------------------------------------------
     @classmethod
     @decorator_validate_mt5_connection
@@ -101,6 +105,7 @@ class Rates:
         timeframe: ENUM_TIMEFRAME = ENUM_TIMEFRAME.TIMEFRAME_M5,
         date_to: datetime = datetime.now(timezone.utc),
         n_candles: int = 10_000,
+        use_cache: bool = False,
     ) -> pd.DataFrame:
         """Get candles from a specified datetime
 
@@ -109,18 +114,23 @@ class Rates:
             timeframe (ENUM_TIMEFRAME, optional): Requested timeframe. Defaults to ENUM_TIMEFRAME.TIMEFRAME_M5.
             date_to (datetime, optional): To date. Defaults to datetime.now(timezone.utc).
             n_candles (int, optional): Requested number of candles. Defaults to 10_000.
+            use_cache (bool, optional): Download only the candles missing in the cache. Defaults to False.
 
         Returns:
             pd.DataFrame: Requested OHLC data
         """
-        # Validate parameters
-        cls.validate_symbol(symbol)
+        # Validate parameters, the cached symbols are already valid
+        if not use_cache or (symbol, timeframe) not in cls.cache:
+            cls.validate_symbol(symbol)
         validate_mt5_ulong_size(n_candles)
         cls.validate_count_candles(n_candles)
         cls.validate_date(date_to)
 
         # Request OHLC data
-        requested_data = mt5.copy_rates_from(symbol, timeframe, date_to, n_candles)
+        if use_cache:
+            requested_data = cls.cache.get_before(symbol, timeframe, date_to, n_candles)
+        else:
+            requested_data = mt5.copy_rates_from(symbol, timeframe, date_to, n_candles)
 
         # Validate request result
         cls.validate_request_result(requested_data)
@@ -141,6 +151,7 @@ class Rates:
         date_from: datetime,
         date_to: datetime = datetime.now(timezone.utc),
         timeframe: ENUM_TIMEFRAME = ENUM_TIMEFRAME.TIMEFRAME_M5,
+        use_cache: bool = False,
     ) -> pd.DataFrame:
         """Get candles from a specified datetime
 
@@ -149,19 +160,24 @@ class Rates:
             date_from (datetime): From date.
             date_to (datetime, optional): To date. Defaults to datetime.now(timezone.utc).
             timeframe (ENUM_TIMEFRAME, optional): Requested timeframe. Defaults to ENUM_TIMEFRAME.TIMEFRAME_M5.
+            use_cache (bool, optional): Download only the intervals missing in the cache. Defaults to False.
 
         Returns:
             pd.DataFrame: Requested OHLC data
         """
 
-        # Validate parameters
-        cls.validate_symbol(symbol)
+        # Validate parameters, the cached symbols are already valid
+        if not use_cache or (symbol, timeframe) not in cls.cache:
+            cls.validate_symbol(symbol)
         cls.validate_date(date_from)
         cls.validate_date(date_to)
         cls.validate_date_range(date_from, date_to)
 
         # Request OHLC data
-        requested_data = mt5.copy_rates_range(symbol, timeframe, date_from, date_to)
+        if use_cache:
+            requested_data = cls.cache.get_range(symbol, timeframe, date_from, date_to)
+        else:
+            requested_data = mt5.copy_rates_range(symbol, timeframe, date_from, date_to)
 
         # Validate request result
         cls.validate_request_result(requested_data)
@@ -0,0 +1,363 @@
+import os
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta, timezone
+from typing import Tuple
+
+from AlgorithmicTrading.terminal.structures import RATES_DTYPE
+from AlgorithmicTrading.utils.dates import get_timeframe_seconds, get_utc_date
+from AlgorithmicTrading.utils.files import (
+    get_dataset_files,
+    read_dataset,
+    write_dataset,
+)
+
+# The weekly bars open on Sunday, 3 days after the epoch (Thursday)
+WEEK_OFFSET_SECONDS = 3 * 86_400
+DAY_SECONDS = 86_400
+
+
+def _get_tick_arrays(ticks, price: str) -> Tuple[np.ndarray, ...]:
+    """Get the ticks columns used by the bars
+
+    Args:
+        ticks (np.ndarray | pd.DataFrame): Ticks, as returned by copy_ticks_range
+        or stored in the dataset
+        price (str): Bars price, "bid", "ask" or "last"
+
+    Returns:
+        Tuple[np.ndarray, ...]: Time in ms, price, spread and volume of the ticks
+        with a price
+    """
+    if isinstance(ticks, pd.DataFrame):
+        ticks = {column: ticks[column].to_numpy() for column in ticks.columns}
+
+    time_msc = np.asarray(ticks["time_msc"], dtype=np.int64)
+    prices = np.asarray(ticks[price], dtype=np.float64)
+    spread = np.asarray(ticks["ask"], dtype=np.float64) - np.asarray(
+        ticks["bid"], dtype=np.float64
+    )
+
+    # Real volume when the symbol has it, e.g. exchange symbols
+    volume = np.asarray(ticks["volume_real"], dtype=np.float64)
+    if not volume.any():
+        volume = np.asarray(ticks["volume"], dtype=np.float64)
+
+    # Skip the ticks without this price, e.g. ask only ticks
+    priced = prices > 0
+
+    return time_msc[priced], prices[priced], spread[priced], volume[priced]
+
+
+def _aggregate(
+    starts: np.ndarray,
+    time: np.ndarray,
+    prices: np.ndarray,
+    spread: np.ndarray,
+    volume: np.ndarray,
+    point: float,
+) -> np.ndarray:
+    """Aggregate the ticks segments into bars
+
+    Args:
+        starts (np.ndarray): First tick index of each bar, sorted
+        time (np.ndarray): Bars open time in seconds
+        prices (np.ndarray): Ticks prices
+        spread (np.ndarray): Ticks spread in price
+        volume (np.ndarray): Ticks volume
+        point (float): Symbol point
+
+    Returns:
+        np.ndarray: Bars, with the copy_rates_* dtype
+    """
+    rates = np.zeros(len(starts), dtype=RATES_DTYPE)
+
+    if not len(starts):
+        return rates
+
+    ends = np.append(starts[1:], len(prices))
+
+    rates["time"] = time
+    rates["open"] = prices[starts]
+    rates["high"] = np.maximum.reduceat(prices, starts)
+    rates["low"] = np.minimum.reduceat(prices, starts)
+    rates["close"] = prices[ends - 1]
+    rates["tick_volume"] = ends - starts
+    rates["spread"] = np.rint(np.minimum.reduceat(spread, starts) / point)
+    rates["real_volume"] = np.rint(np.add.reduceat(volume, starts))
+
+    return rates
+
+
+def get_bars_open_time(time: np.ndarray, timeframe) -> np.ndarray:
+    """Get the open time of the bar of each time
+
+    Args:
+        time (np.ndarray): Times in seconds
+        timeframe (ENUM_TIMEFRAME | timedelta): Bars timeframe
+
+    Returns:
+        np.ndarray: Bars open times in seconds
+    """
+    time = np.asarray(time, dtype=np.int64)
+
+    # Calendar months
+    if not isinstance(timeframe, timedelta) and int(timeframe) & 0xC000 == 0xC000:
+        months = time.astype("datetime64[s]").astype("datetime64[M]").astype(np.int64)
+        months -= months % (int(timeframe) & 0x3FFF)
+
+        return months.astype("datetime64[M]").astype("datetime64[s]").astype(np.int64)
+
+    seconds = get_timeframe_seconds(timeframe)
+
+    # Intraday bars not dividing a day (e.g. 7 minutes) restart at midnight
+    if seconds < DAY_SECONDS and DAY_SECONDS % seconds:
+        day = time // DAY_SECONDS * DAY_SECONDS
+
+        return day + (time - day) // seconds * seconds
+
+    offset = WEEK_OFFSET_SECONDS if seconds % 604_800 == 0 else 0
+
+    return (time - offset) // seconds * seconds + offset
+
+
+def resample_ticks(ticks, timeframe, point: float, price: str = "bid") -> np.ndarray:
+    """Build time bars from ticks
+
+    The ticks are sorted, so each bar is a contiguous segment: the segments start
+    where the bar open time changes and are reduced with ufunc.reduceat.
+
+    Args:
+        ticks (np.ndarray | pd.DataFrame): Ticks, as returned by copy_ticks_range
+        timeframe (ENUM_TIMEFRAME | timedelta): Bars timeframe, any length
+        point (float): Symbol point, the spread unit
+        price (str, optional): Bars price. Defaults to "bid".
+
+    Returns:
+        np.ndarray: Bars, with the copy_rates_* dtype
+    """
+    time_msc, prices, spread, volume = _get_tick_arrays(ticks, price)
+
+    open_time = get_bars_open_time(time_msc // 1_000, timeframe)
+    starts = np.flatnonzero(np.diff(open_time, prepend=open_time[:1] - 1))
+
+    return _aggregate(starts, open_time[starts], prices, spread, volume, point)
+
+
+def _resample_threshold(
+    time_msc: np.ndarray,
+    prices: np.ndarray,
+    spread: np.ndarray,
+    volume: np.ndarray,
+    values: np.ndarray,
+    threshold: float,
+    point: float,
+) -> np.ndarray:
+    """Build bars closing each time the cumulative values reach a threshold
+
+    Args:
+        time_msc (np.ndarray): Ticks time in ms
+        prices (np.ndarray): Ticks prices
+        spread (np.ndarray): Ticks spread in price
+        volume (np.ndarray): Ticks volume
+        values (np.ndarray): Ticks values accumulated
+        threshold (float): Bars value
+        point (float): Symbol point
+
+    Returns:
+        np.ndarray: Bars, with the copy_rates_* dtype
+    """
+    cumulative = np.cumsum(values)
+
+    if not len(cumulative):
+        starts = np.array([], dtype=np.int64)
+
+        return _aggregate(starts, starts, prices, spread, volume, point)
+
+    # Tick reaching each threshold multiple, the next bar starts after it
+    closes = np.searchsorted(
+        cumulative, np.arange(threshold, cumulative[-1] + threshold, threshold)
+    )
+    starts = np.unique(np.append(0, closes + 1))
+    starts = starts[starts < len(prices)]
+
+    return _aggregate(starts, time_msc[starts] // 1_000, prices, spread, volume, point)
+
+
+def resample_tick_bars(
+    ticks, n_ticks: int, point: float, price: str = "bid"
+) -> np.ndarray:
+    """Build bars of a fixed number of ticks
+
+    Args:
+        ticks (np.ndarray | pd.DataFrame): Ticks, as returned by copy_ticks_range
+        n_ticks (int): Ticks per bar
+        point (float): Symbol point, the spread unit
+        price (str, optional): Bars price. Defaults to "bid".
+
+    Returns:
+        np.ndarray: Bars, with the copy_rates_* dtype, the time is the first tick time
+    """
+    time_msc, prices, spread, volume = _get_tick_arrays(ticks, price)
+    starts = np.arange(0, len(prices), n_ticks)
+
+    return _aggregate(starts, time_msc[starts] // 1_000, prices, spread, volume, point)
+
+
+def resample_volume_bars(
+    ticks, bar_volume: float, point: float, price: str = "bid"
+) -> np.ndarray:
+    """Build bars of a fixed traded volume
+
+    Args:
+        ticks (np.ndarray | pd.DataFrame): Ticks, as returned by copy_ticks_range
+        bar_volume (float): Volume per bar
+        point (float): Symbol point, the spread unit
+        price (str, optional): Bars price. Defaults to "bid".
+
+    Returns:
+        np.ndarray: Bars, with the copy_rates_* dtype, the time is the first tick time
+    """
+    time_msc, prices, spread, volume = _get_tick_arrays(ticks, price)
+
+    return _resample_threshold(
+        time_msc, prices, spread, volume, volume, bar_volume, point
+    )
+
+
+def resample_dollar_bars(
+    ticks, bar_value: float, point: float, price: str = "last"
+) -> np.ndarray:
+    """Build bars of a fixed traded value (price x volume)
+
+    Args:
+        ticks (np.ndarray | pd.DataFrame): Ticks, as returned by copy_ticks_range
+        bar_value (float): Traded value per bar
+        point (float): Symbol point, the spread unit
+        price (str, optional): Bars price. Defaults to "last".
+
+    Returns:
+        np.ndarray: Bars, with the copy_rates_* dtype, the time is the first tick time
+    """
+    time_msc, prices, spread, volume = _get_tick_arrays(ticks, price)
+
+    return _resample_threshold(
+        time_msc, prices, spread, volume, prices * volume, bar_value, point
+    )
+
+
+def rates_to_frame(rates: np.ndarray) -> pd.DataFrame:
+    """Convert bars to a frame, as returned by Rates.get_candles_range
+
+    Args:
+        rates (np.ndarray): Bars, with the copy_rates_* dtype
+
+    Returns:
+        pd.DataFrame: Bars with UTC datetimes
+    """
+    df = pd.DataFrame(rates)
+    df["time"] = pd.to_datetime(df["time"], unit="s", utc=True)
+
+    return df
+
+
+def get_resampled_candles(
+    root: str,
+    symbol: str,
+    timeframe,
+    date_from: datetime,
+    date_to: datetime,
+    point: float,
+    price: str = "bid",
+) -> pd.DataFrame:
+    """Get candles from the dataset, resampling the stored ticks when missing
+
+    The candles are stored with the downloaded candles of the timeframe, so each
+    day is resampled once. A day is resampled again when ticks were added after
+    its candles, e.g. a day downloaded in chunks, and the current UTC day is never
+    stored as it is still open. Only the intraday timeframes are cached, their
+    bars never use the ticks of other days.
+
+    Args:
+        root (str): Dataset directory
+        symbol (str): Symbol
+        timeframe (ENUM_TIMEFRAME | timedelta): Candles timeframe
+        date_from (datetime): From date, included
+        date_to (datetime): To date, excluded
+        point (float): Symbol point, the spread unit
+        price (str, optional): Bars price. Defaults to "bid".
+
+    Raises:
+        ValueError: The timeframe is longer than a day
+
+    Returns:
+        pd.DataFrame: Candles with UTC datetimes
+    """
+    seconds = get_timeframe_seconds(timeframe)
+
+    if seconds > DAY_SECONDS:
+        raise ValueError(
+            "[ERROR]: Only the intraday timeframes can be cached, "
+            "use resample_ticks instead"
+        )
+
+    # Dataset name of the non standard timeframes, e.g. "M7"
+    bars_timeframe = timedelta(seconds=seconds)
+    if isinstance(timeframe, timedelta):
+        timeframe = f"M{seconds // 60}" if seconds % 60 == 0 else f"S{seconds}"
+
+    # Files modification times, by day
+    ticks_modified = {
+        day: max(os.path.getmtime(path) for path in paths)
+        for day, paths in get_dataset_files(root, symbol, "ticks").items()
+        if get_utc_date(date_from) <= day <= get_utc_date(date_to)
+    }
+    candles_files = get_dataset_files(root, symbol, timeframe)
+
+    # Days without candles, with ticks newer than their candles or still open
+    today = datetime.now(timezone.utc).date()
+    missing = {
+        day
+        for day, modified in ticks_modified.items()
+        if day >= today
+        or day not in candles_files
+        or modified > min(os.path.getmtime(path) for path in candles_files[day])
+    }
+    open_candles = None
+
+    if missing:
+        ticks = read_dataset(
+            root,
+            symbol=symbol,
+            timeframe="ticks",
+            date_from=datetime.combine(min(missing), datetime.min.time(), timezone.utc),
+            date_to=datetime.combine(
+                max(missing) + timedelta(days=1), datetime.min.time(), timezone.utc
+            ),
+        )
+        ticks = ticks[ticks["time"].dt.date.isin(missing)]
+        candles = rates_to_frame(resample_ticks(ticks, bars_timeframe, point, price))
+
+        # The outdated candles are replaced
+        for day in missing:
+            for path in candles_files.get(day, []):
+                os.remove(path)
+
+        is_open = candles["time"].dt.date >= today
+        open_candles = candles[is_open]
+        if not is_open.all():
+            write_dataset(candles[~is_open], root, symbol, timeframe)
+
+    candles = read_dataset(
+        root, symbol=symbol, timeframe=timeframe, date_from=date_from, date_to=date_to
+    )
+    if open_candles is None or not len(open_candles):
+        return candles
+
+    # The open day candles, in memory only
+    open_candles = open_candles[
+        (open_candles["time"] >= date_from) & (open_candles["time"] < date_to)
+    ]
+
+    return pd.concat([candles, open_candles], ignore_index=True)
+
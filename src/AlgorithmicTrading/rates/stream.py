@@ -0,0 +1,339 @@
+import asyncio
+import threading
+import numpy as np
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+from AlgorithmicTrading.terminal import mt5
+from AlgorithmicTrading.terminal.structures import TICKS_DTYPE
+from AlgorithmicTrading.rates.rates import Rates
+
+# Subscriber callback, receives the symbol and its new ticks
+TickCallback = Callable[[str, np.ndarray], None]
+
+
+class TickBuffer:
+    """Fixed size ring buffer of the last ticks of a symbol
+
+    Each tick is written twice, at its position and one capacity after it, so the
+    last n ticks are always a contiguous slice and the windows are views, without
+    copies. A window is overwritten once capacity newer ticks arrive, copy it to
+    keep it longer.
+
+    Args:
+        capacity (int): Ticks kept
+        dtype (np.dtype, optional): Ticks dtype. Defaults to TICKS_DTYPE.
+    """
+
+    def __init__(self, capacity: int, dtype: np.dtype = TICKS_DTYPE) -> None:
+        if capacity < 1:
+            raise ValueError("[ERROR]: The buffer capacity must be at least 1")
+
+        self.capacity = capacity
+        self.data = np.zeros(2 * capacity, dtype=dtype)
+        # Ticks appended since the creation
+        self.count = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, ticks: np.ndarray) -> None:
+        """Append new ticks, dropping the oldest
+
+        Args:
+            ticks (np.ndarray): Ticks, sorted by time
+        """
+        if len(ticks) > self.capacity:
+            self.count += len(ticks) - self.capacity
+            ticks = ticks[-self.capacity :]
+
+        start = self.count % self.capacity
+        first = min(len(ticks), self.capacity - start)
+
+        # Until the buffer end, then from its start
+        for position, part in ((start, ticks[:first]), (0, ticks[first:])):
+            self.data[position : position + len(part)] = part
+            position += self.capacity
+            self.data[position : position + len(part)] = part
+
+        self.count += len(ticks)
+
+    def window(self, n_ticks: int = None) -> np.ndarray:
+        """Get the last ticks, as a read only view
+
+        Args:
+            n_ticks (int, optional): Ticks count. Defaults to every tick kept.
+
+        Returns:
+            np.ndarray: Last ticks, oldest first
+        """
+        n_ticks = len(self) if n_ticks is None else min(n_ticks, len(self))
+        end = self.count % self.capacity + self.capacity
+
+        window = self.data[end - n_ticks : end]
+        window.flags.writeable = False
+
+        return window
+
+
+class TickStream:
+    """Live ticks feed shared by many subscribers
+
+    One background thread polls the terminal for the new ticks of every subscribed
+    symbol since its last tick, writes them in the symbol TickBuffer and notifies
+    the subscribers. The terminal is requested once per symbol, whatever the number
+    of subscribers, and the symbols are validated once, on subscription.
+
+    >>> stream = TickStream()
+    >>> buffer = stream.subscribe("EURUSD", callback=on_ticks)
+    >>> with stream:
+    ...     ticks = buffer.window(100)
+
+    Args:
+        interval (float, optional): Seconds between polls. Defaults to 0.05.
+        capacity (int, optional): Ticks kept by symbol. Defaults to 100_000.
+        max_ticks (int, optional): Ticks requested at once. Defaults to 10_000.
+        flags (int, optional): Ticks requested, COPY_TICKS_*. Defaults to
+        COPY_TICKS_ALL.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.05,
+        capacity: int = 100_000,
+        max_ticks: int = 10_000,
+        flags: int = mt5.COPY_TICKS_ALL,
+    ) -> None:
+        self.interval = interval
+        self.capacity = capacity
+        self.max_ticks = max_ticks
+        self.flags = flags
+
+        self.buffers: Dict[str, TickBuffer] = {}
+        self.subscribers: Dict[str, List[TickCallback]] = {}
+        # Last tick time in ms and ticks already read at that time, by symbol
+        self.cursors: Dict[str, List[int]] = {}
+        self.lock = threading.RLock()
+
+        self.stopped = threading.Event()
+        self.thread = None
+        self.last_error = None
+
+    # Subscriptions -------------------------------------------------------------------
+    def subscribe(
+        self, symbol: str, callback: TickCallback = None, date_from: datetime = None
+    ) -> TickBuffer:
+        """Subscribe to the ticks of a symbol
+
+        Args:
+            symbol (str): Symbol
+            callback (TickCallback, optional): Called on the stream thread with the
+            symbol and its new ticks. Defaults to None.
+            date_from (datetime, optional): First ticks time, for the first
+            subscription of the symbol. Defaults to now.
+
+        Raises:
+            ValueError: The symbol is not in the symbols list
+
+        Returns:
+            TickBuffer: Symbol ticks buffer
+        """
+        with self.lock:
+            if symbol not in self.buffers:
+                Rates.validate_symbol(symbol)
+
+                date_from = date_from or datetime.now(timezone.utc)
+                if date_from.tzinfo is None:
+                    date_from = date_from.replace(tzinfo=timezone.utc)
+
+                self.buffers[symbol] = TickBuffer(self.capacity)
+                self.subscribers[symbol] = []
+                self.cursors[symbol] = [int(date_from.timestamp() * 1_000), 0]
+
+            if callback is not None:
+                self.subscribers[symbol].append(callback)
+
+            return self.buffers[symbol]
+
+    def subscribe_queue(
+        self, symbol: str, maxsize: int = 1_000, date_from: datetime = None
+    ) -> asyncio.Queue:
+        """Subscribe to the ticks of a symbol with an asyncio queue
+
+        Must be called from the event loop. When the queue is full, the oldest
+        ticks are dropped.
+
+        Args:
+            symbol (str): Symbol
+            maxsize (int, optional): Queued ticks arrays. Defaults to 1_000.
+            date_from (datetime, optional): First ticks time, for the first
+            subscription of the symbol. Defaults to now.
+
+        Returns:
+            asyncio.Queue: Queue of the new ticks arrays
+        """
+        loop = asyncio.get_running_loop()
+        ticks_queue = asyncio.Queue(maxsize=maxsize)
+
+        def put(ticks: np.ndarray) -> None:
+            if ticks_queue.full():
+                ticks_queue.get_nowait()
+            ticks_queue.put_nowait(ticks)
+
+        def callback(symbol: str, ticks: np.ndarray) -> None:
+            loop.call_soon_threadsafe(put, ticks)
+
+        # Allows the unsubscription by queue
+        callback.queue = ticks_queue
+        self.subscribe(symbol, callback=callback, date_from=date_from)
+
+        return ticks_queue
+
+    def unsubscribe(self, symbol: str, subscriber=None) -> None:
+        """Remove a subscriber, or the symbol when no subscriber is given
+
+        Args:
+            symbol (str): Symbol
+            subscriber (TickCallback | asyncio.Queue, optional): Callback or queue.
+            Defaults to None.
+        """
+        with self.lock:
+            if symbol not in self.buffers:
+                return
+
+            if subscriber is None:
+                del self.buffers[symbol], self.subscribers[symbol], self.cursors[symbol]
+                return
+
+            self.subscribers[symbol] = [
+                callback
+                for callback in self.subscribers[symbol]
+                if callback is not subscriber
+                and getattr(callback, "queue", None) is not subscriber
+            ]
+
+    # Polling -------------------------------------------------------------------------
+    def fetch(self, symbol: str) -> np.ndarray:
+        """Request the ticks of a symbol after its last tick
+
+        Args:
+            symbol (str): Symbol
+
+        Raises:
+            TypeError: Request error
+
+        Returns:
+            np.ndarray: New ticks
+        """
+        last_msc, read_at_last = self.cursors[symbol]
+        new_ticks = []
+
+        while True:
+            ticks = mt5.copy_ticks_from(
+                symbol,
+                datetime.fromtimestamp(last_msc // 1_000, timezone.utc),
+                self.max_ticks,
+                self.flags,
+            )
+
+            if ticks is None:
+                raise TypeError(
+                    f"[ERROR]: Ticks request of {symbol} failed: {mt5.last_error()}"
+                )
+
+            # Skip the ticks already read, many ticks can share a ms
+            time_msc = ticks["time_msc"]
+            start, end = np.searchsorted(time_msc, [last_msc, last_msc + 1])
+            ticks = ticks[min(start + read_at_last, end) :]
+
+            if len(ticks):
+                new_last_msc = int(ticks["time_msc"][-1])
+                at_last = len(ticks) - int(
+                    np.searchsorted(ticks["time_msc"], new_last_msc)
+                )
+                read_at_last = (
+                    read_at_last + at_last if new_last_msc == last_msc else at_last
+                )
+                last_msc = new_last_msc
+                new_ticks.append(ticks)
+
+            # More ticks than a request
+            if len(time_msc) < self.max_ticks or not len(ticks):
+                break
+
+        self.cursors[symbol] = [last_msc, read_at_last]
+
+        if len(new_ticks) == 1:
+            return new_ticks[0]
+
+        return np.concatenate(new_ticks) if new_ticks else ticks[:0]
+
+    def poll(self) -> int:
+        """Poll the new ticks of every symbol and notify the subscribers
+
+        Returns:
+            int: New ticks count
+        """
+        n_ticks = 0
+
+        with self.lock:
+            symbols = list(self.buffers)
+
+        for symbol in symbols:
+            with self.lock:
+                if symbol not in self.buffers:
+                    continue
+
+                ticks = self.fetch(symbol)
+                if not len(ticks):
+                    continue
+
+                self.buffers[symbol].append(ticks)
+                subscribers = list(self.subscribers[symbol])
+
+            # Notified outside the lock, a callback may subscribe
+            ticks.flags.writeable = False
+            for callback in subscribers:
+                callback(symbol, ticks)
+
+            n_ticks += len(ticks)
+
+        return n_ticks
+
+    def __run(self) -> None:
+        """Background thread, poll until closed"""
+        while not self.stopped.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                # Kept for the caller, the next poll retries
+                self.last_error = e
+
+            self.stopped.wait(self.interval)
+
+    def start(self) -> "TickStream":
+        """Start polling on a background thread
+
+        Returns:
+            TickStream: Self
+        """
+        if self.thread is None:
+            self.stopped.clear()
+            self.thread = threading.Thread(target=self.__run, daemon=True)
+            self.thread.start()
+
+        return self
+
+    def close(self) -> None:
+        """Stop the background thread"""
+        self.stopped.set()
+
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def __enter__(self) -> "TickStream":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.close()
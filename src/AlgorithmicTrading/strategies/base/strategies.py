@@ -1,5 +1,5 @@
 import pandas as pd
-from typing import List
+from typing import Iterable, List
 from datetime import datetime
 
 from AlgorithmicTrading.models.metatrader import MqlAccountInfo
@@ -15,18 +15,49 @@ class BaseStrategy:
         self.account_data = account_data
         self.symbols = symbols
 
-    def initialize_run(self, symbol: str, date_from: datetime, date_to: datetime) -> tuple:
-        finantial_data = Rates.get_candles_range(
-            symbol=symbol,
-            date_from=date_from,
-            date_to=date_to,
-        )
+    def initialize_run(
+        self,
+        symbol: str = None,
+        date_from: datetime = None,
+        date_to: datetime = None,
+        finantial_data: pd.DataFrame = None,
+    ) -> tuple:
+        """Get the candles and the trade class of a run
+
+        Args:
+            symbol (str, optional): Symbol, required to download the candles.
+            Defaults to None.
+            date_from (datetime, optional): Candles start, required to download the
+            candles. Defaults to None.
+            date_to (datetime, optional): Candles end, required to download the
+            candles. Defaults to None.
+            finantial_data (pd.DataFrame, optional): Candles of the run, e.g. a
+            memory mapped file. Defaults to downloading the candles.
+
+        Raises:
+            Exception: The candles are not given and can not be downloaded
+
+        Returns:
+            tuple: Candles and trade class
+        """
+        # Download the candles, unless they are given (e.g. a memory mapped file)
+        if finantial_data is None:
+            if symbol is None or date_from is None or date_to is None:
+                raise Exception(
+                    "[ERROR]: Error in initialize_run()! The symbol, date_from and "
+                    "date_to are required without finantial_data"
+                )
+
+            finantial_data = Rates.get_candles_range(
+                symbol=symbol,
+                date_from=date_from,
+                date_to=date_to,
+            )
 
         # Create a trade class
         trade = Trade(
             account_data=self.account_data,
             magic_number=self.magic_number,
-            backtest_financial_data=finantial_data,
         )
 
         # Return the copy and the trade class
@@ -45,3 +76,28 @@ class BaseStrategy:
 
         # Run the strategy for each candle
         finantial_data.apply(lambda row: execute_backtest(row), axis=1)
+
+    def backtest_run_stream(
+        self, finantial_data_chunks: Iterable[pd.DataFrame], history: int = 0
+    ) -> None:
+        """Run the strategy over consecutive data chunks, e.g. from a Prefetcher
+
+        Args:
+            finantial_data_chunks (Iterable[pd.DataFrame]): Consecutive data chunks
+            history (int, optional): Rows of the previous chunks kept before each
+            chunk, for the strategy lookback. Defaults to 0.
+        """
+        previous_data = None
+
+        for chunk in finantial_data_chunks:
+            # Prepend the previous rows, they are not run again
+            if history and previous_data is not None:
+                finantial_data = pd.concat([previous_data.iloc[-history:], chunk])
+            else:
+                finantial_data = chunk
+
+            first_row = len(finantial_data) - len(chunk)
+            for row_index in range(first_row, len(finantial_data)):
+                self.run(finantial_data=finantial_data.iloc[: row_index + 1])
+
+            previous_data = finantial_data
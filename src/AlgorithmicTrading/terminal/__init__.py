@@ -0,0 +1,5 @@
+from .terminal import mt5, get_backend, set_backend, use_backend
+from .backend import TerminalBackend, MetaTraderBackend
+from .replay import ReplayBackend
+from .metrics import TerminalMetrics, enable_metrics, disable_metrics, get_metrics
+from .gateway import TerminalGateway, enable_gateway, disable_gateway, get_gateway
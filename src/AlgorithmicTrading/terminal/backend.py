@@ -0,0 +1,138 @@
+from AlgorithmicTrading.terminal import structures
+from typing import Any, Tuple
+
+# Terminal functions used by the package
+TERMINAL_FUNCTIONS = (
+    "initialize",
+    "shutdown",
+    "last_error",
+    "terminal_info",
+    "account_info",
+    "symbols_get",
+    "symbol_info",
+    "copy_rates_from",
+    "copy_rates_from_pos",
+    "copy_rates_range",
+    "copy_ticks_from",
+    "copy_ticks_range",
+    "order_send",
+    "positions_get",
+    "orders_get",
+    "history_deals_get",
+)
+
+# Terminal result structures
+TERMINAL_STRUCTURES = (
+    "SymbolInfo",
+    "AccountInfo",
+    "TerminalInfo",
+    "TradeRequest",
+    "OrderSendResult",
+    "TradePosition",
+    "TradeOrder",
+    "TradeDeal",
+)
+
+
+class TerminalBackend:
+    """Terminal backend interface
+
+    A backend implements the MetaTrader5 package functions used by the package and
+    exposes the result structures it returns, the models check the results types
+    against them.
+    """
+
+    SymbolInfo = structures.SymbolInfo
+    AccountInfo = structures.AccountInfo
+    TerminalInfo = structures.TerminalInfo
+    TradeRequest = structures.TradeRequest
+    OrderSendResult = structures.OrderSendResult
+    TradePosition = structures.TradePosition
+    TradeOrder = structures.TradeOrder
+    TradeDeal = structures.TradeDeal
+
+    def __not_implemented(self, name: str) -> NotImplementedError:
+        return NotImplementedError(
+            f"[ERROR]: {self.__class__.__name__} does not implement {name}()"
+        )
+
+    def initialize(self, *args, **kwargs) -> bool:
+        raise self.__not_implemented("initialize")
+
+    def shutdown(self) -> None:
+        raise self.__not_implemented("shutdown")
+
+    def last_error(self) -> Tuple[int, str]:
+        raise self.__not_implemented("last_error")
+
+    def terminal_info(self) -> Any:
+        raise self.__not_implemented("terminal_info")
+
+    def account_info(self) -> Any:
+        raise self.__not_implemented("account_info")
+
+    def symbols_get(self, *args, **kwargs) -> tuple:
+        raise self.__not_implemented("symbols_get")
+
+    def symbol_info(self, symbol: str) -> Any:
+        raise self.__not_implemented("symbol_info")
+
+    def copy_rates_from(self, symbol, timeframe, date_from, count):
+        raise self.__not_implemented("copy_rates_from")
+
+    def copy_rates_from_pos(self, symbol, timeframe, start_pos, count):
+        raise self.__not_implemented("copy_rates_from_pos")
+
+    def copy_rates_range(self, symbol, timeframe, date_from, date_to):
+        raise self.__not_implemented("copy_rates_range")
+
+    def copy_ticks_from(self, symbol, date_from, count, flags):
+        raise self.__not_implemented("copy_ticks_from")
+
+    def copy_ticks_range(self, symbol, date_from, date_to, flags):
+        raise self.__not_implemented("copy_ticks_range")
+
+    def order_send(self, request: dict) -> Any:
+        raise self.__not_implemented("order_send")
+
+    def positions_get(self, *args, **kwargs) -> tuple:
+        raise self.__not_implemented("positions_get")
+
+    def orders_get(self, *args, **kwargs) -> tuple:
+        raise self.__not_implemented("orders_get")
+
+    def history_deals_get(self, *args, **kwargs) -> tuple:
+        raise self.__not_implemented("history_deals_get")
+
+
+class MetaTraderBackend(TerminalBackend):
+    """MetaTrader 5 terminal, through the MetaTrader5 package (Windows only)
+
+    The package functions and structures are bound to the instance, so the calls
+    have no extra cost.
+
+    Raises:
+        ImportError: The MetaTrader5 package is not installed
+    """
+
+    def __init__(self) -> None:
+        try:
+            import MetaTrader5
+        except ImportError as e:
+            raise ImportError(
+                "[ERROR]: The MetaTrader5 package is not available, "
+                "set a replay backend to run without the terminal"
+            ) from e
+
+        self.module = MetaTrader5
+        self.__dict__.update(
+            {
+                name: getattr(MetaTrader5, name)
+                for name in TERMINAL_FUNCTIONS + TERMINAL_STRUCTURES
+                if hasattr(MetaTrader5, name)
+            }
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        # Functions not used by the package
+        return getattr(self.module, name)
@@ -0,0 +1,317 @@
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+
+# Request priorities, the lowest first
+PRIORITY_ORDER = 0
+PRIORITY_DATA = 1
+# Order traffic, served before the data requests
+ORDER_FUNCTIONS = ("order_send",)
+# Read only requests, identical concurrent calls share one terminal call
+COALESCED_FUNCTIONS = (
+    "terminal_info",
+    "symbols_get",
+    "symbol_info",
+    "copy_rates_from",
+    "copy_rates_from_pos",
+    "copy_rates_range",
+    "copy_ticks_from",
+    "copy_ticks_range",
+)
+# Account state requests, never shared: a call started before an order is filled
+# would return the state without it to the caller of the order
+ACCOUNT_FUNCTIONS = (
+    "account_info",
+    "positions_get",
+    "orders_get",
+    "history_deals_get",
+)
+# Requests routed through the gateway, the others go straight to the terminal
+ROUTED_FUNCTIONS = frozenset(ORDER_FUNCTIONS + COALESCED_FUNCTIONS + ACCOUNT_FUNCTIONS)
+
+# Active gateway, None when the terminal is called directly
+_gateway: "TerminalGateway" = None
+
+
+class TokenBucket:
+    """Thread safe token bucket, with priority for the order requests
+
+    The bucket holds up to burst tokens and refills rate tokens per second. While an
+    order request waits for a token, the data requests wait behind it.
+
+    Args:
+        rate (float): Tokens per second
+        burst (int, optional): Maximum tokens. Defaults to the rate, at least 1.
+    """
+
+    def __init__(self, rate: float, burst: int = None) -> None:
+        if rate <= 0:
+            raise ValueError("[ERROR]: The bucket rate must be higher than zero")
+
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+        self.condition = threading.Condition()
+        # Waiting requests, by priority
+        self.waiting = [0, 0]
+
+    def __refill(self) -> None:
+        """Add the tokens of the time elapsed since the last refill"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, priority: int = PRIORITY_DATA) -> float:
+        """Take a token, waiting for it
+
+        Args:
+            priority (int, optional): PRIORITY_ORDER or PRIORITY_DATA. Defaults to
+            PRIORITY_DATA.
+
+        Returns:
+            float: Seconds waited
+        """
+        start = time.monotonic()
+
+        with self.condition:
+            self.waiting[priority] += 1
+
+            try:
+                while True:
+                    self.__refill()
+
+                    # The data requests let the waiting orders go first
+                    blocked = priority == PRIORITY_DATA and self.waiting[PRIORITY_ORDER]
+
+                    if not blocked and self.tokens >= 1:
+                        self.tokens -= 1
+                        return time.monotonic() - start
+
+                    # Until the next token, or a notification when blocked
+                    timeout = None if blocked else (1 - self.tokens) / self.rate
+                    self.condition.wait(timeout)
+            finally:
+                self.waiting[priority] -= 1
+                self.condition.notify_all()
+
+
+class Flight:
+    """Terminal call in progress, shared by the identical requests"""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error: Exception = None
+        # Requests waiting for this call
+        self.followers = 0
+
+
+class TerminalGateway:
+    """Shared gateway of the terminal requests of every strategy of the process
+
+    Once enabled, the mt5 proxy routes the requests through it:
+
+    - Single flight: identical read requests made while one of them is in progress
+      wait for it and receive its result, so the terminal load grows with the
+      distinct requests, not with the callers. The account state requests are
+      only limited, each caller gets a state read after its call.
+    - Token buckets: each endpoint can be limited, and a total limit is shared by
+      every routed request.
+    - Priority: the order requests skip the data requests waiting for the total
+      limit tokens.
+
+    >>> enable_gateway(
+    ...     limits={"copy_ticks_from": (50, 10), "symbol_info": (200, 50)},
+    ...     total_limit=(500, 100),
+    ... )
+
+    Args:
+        limits (Dict[str, Tuple[float, int]], optional): Rate and burst of the
+        endpoints, by function name. Defaults to no endpoint limit.
+        total_limit (Tuple[float, int], optional): Rate and burst of every routed
+        request. Defaults to no total limit.
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, Tuple[float, int]] = None,
+        total_limit: Tuple[float, int] = None,
+    ) -> None:
+        self.buckets: Dict[str, TokenBucket] = {
+            name: TokenBucket(*limit) for name, limit in (limits or {}).items()
+        }
+        self.total_bucket = TokenBucket(*total_limit) if total_limit else None
+
+        self.flights: Dict[tuple, Flight] = {}
+        self.lock = threading.Lock()
+
+        # Requests received and requests served by another call
+        self.requests = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def get_key(name: str, args: tuple, kwargs: dict) -> tuple:
+        """Get the key of a request, identical requests share it
+
+        Args:
+            name (str): Function name
+            args (tuple): Positional arguments
+            kwargs (dict): Keyword arguments
+
+        Returns:
+            tuple: Request key, None when the arguments are not hashable
+        """
+        key = (name, args, tuple(sorted(kwargs.items())))
+
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    def limit(self, name: str) -> None:
+        """Wait for the tokens of a request
+
+        Args:
+            name (str): Function name
+        """
+        priority = PRIORITY_ORDER if name in ORDER_FUNCTIONS else PRIORITY_DATA
+
+        bucket = self.buckets.get(name)
+        if bucket is not None:
+            bucket.acquire(priority)
+
+        if self.total_bucket is not None:
+            self.total_bucket.acquire(priority)
+
+    def call(self, name: str, function: Callable, *args, **kwargs) -> Any:
+        """Call a terminal function through the gateway
+
+        Args:
+            name (str): Function name
+            function (Callable): Backend function
+
+        Returns:
+            Any: Function result
+        """
+        with self.lock:
+            self.requests += 1
+
+        key = self.get_key(name, args, kwargs) if name in COALESCED_FUNCTIONS else None
+
+        # Orders, account state and unhashable requests are never shared
+        if key is None:
+            self.limit(name)
+            return function(*args, **kwargs)
+
+        with self.lock:
+            flight = self.flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.flights[key] = Flight()
+            else:
+                flight.followers += 1
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+
+            return self.__share(flight)
+
+        try:
+            self.limit(name)
+            flight.result = function(*args, **kwargs)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            # The next identical request makes a new call
+            with self.lock:
+                del self.flights[key]
+            flight.done.set()
+
+        return self.__share(flight) if flight.followers else flight.result
+
+    @staticmethod
+    def __share(flight: Flight) -> Any:
+        """Get the result of a shared call
+
+        Args:
+            flight (Flight): Finished call
+
+        Returns:
+            Any: Call result, the arrays are copied as the callers may modify them
+        """
+        if isinstance(flight.result, np.ndarray):
+            return flight.result.copy()
+
+        return flight.result
+
+    def wrap(self, name: str, function: Callable) -> Callable:
+        """Route a terminal function through the gateway
+
+        Args:
+            name (str): Function name
+            function (Callable): Backend function
+
+        Returns:
+            Callable: Routed function
+        """
+
+        @wraps(function)
+        def routed(*args, **kwargs):
+            return self.call(name, function, *args, **kwargs)
+
+        return routed
+
+
+def enable_gateway(
+    limits: Dict[str, Tuple[float, int]] = None,
+    total_limit: Tuple[float, int] = None,
+) -> TerminalGateway:
+    """Route the terminal requests through a shared gateway
+
+    Args:
+        limits (Dict[str, Tuple[float, int]], optional): Rate and burst of the
+        endpoints, by function name. Defaults to no endpoint limit.
+        total_limit (Tuple[float, int], optional): Rate and burst of every routed
+        request. Defaults to no total limit.
+
+    Returns:
+        TerminalGateway: Active gateway
+    """
+    global _gateway
+
+    _gateway = TerminalGateway(limits=limits, total_limit=total_limit)
+
+    return _gateway
+
+
+def disable_gateway() -> TerminalGateway:
+    """Call the terminal directly again
+
+    Returns:
+        TerminalGateway: Previous gateway
+    """
+    global _gateway
+
+    gateway, _gateway = _gateway, None
+
+    return gateway
+
+
+def get_gateway() -> TerminalGateway:
+    """Get the active gateway
+
+    Returns:
+        TerminalGateway: Active gateway, None when disabled
+    """
+    return _gateway
@@ -0,0 +1,410 @@
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+# Histogram precision, 2**SUB_BUCKET_BITS buckets per power of 2 (about 6% wide)
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+# Prometheus histogram buckets, in seconds
+PROMETHEUS_BUCKETS = (
+    0.00001,
+    0.00005,
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+)
+# Metrics kinds: terminal functions and package operations (spans)
+TERMINAL = "terminal"
+SPAN = "span"
+
+# Active metrics, None when the instrumentation is disabled
+_metrics: "TerminalMetrics" = None
+
+
+class LatencyHistogram:
+    """Log-linear (HDR style) histogram of durations in ns
+
+    The values are counted in buckets of constant relative width, so the
+    percentiles keep the same precision from microseconds to seconds with a
+    fixed memory and an O(1) record.
+    """
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (64 * SUB_BUCKETS)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    @staticmethod
+    def get_index(value: int) -> int:
+        """Get the bucket of a value
+
+        Args:
+            value (int): Value, >= 0
+
+        Returns:
+            int: Bucket index
+        """
+        shift = value.bit_length() - SUB_BUCKET_BITS - 1
+        if shift <= 0:
+            return value
+
+        return shift * SUB_BUCKETS + (value >> shift)
+
+    @staticmethod
+    def get_bounds(index: int) -> Tuple[int, int]:
+        """Get the values range of a bucket
+
+        Args:
+            index (int): Bucket index
+
+        Returns:
+            Tuple[int, int]: Lowest and highest values, both included
+        """
+        if index < 2 * SUB_BUCKETS:
+            return index, index
+
+        shift = index // SUB_BUCKETS - 1
+        lowest = (index - shift * SUB_BUCKETS) << shift
+
+        return lowest, lowest + (1 << shift) - 1
+
+    def record(self, value: int) -> None:
+        """Record a value
+
+        Args:
+            value (int): Value, >= 0
+        """
+        self.counts[self.get_index(value)] += 1
+        self.count += 1
+        self.total += value
+
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, percent: float) -> int:
+        """Get a percentile
+
+        Args:
+            percent (float): Percentile, from 0 to 100
+
+        Returns:
+            int: Highest value of the percentile bucket, 0 without values
+        """
+        if not self.count:
+            return 0
+
+        rank = max(1, round(percent / 100 * self.count))
+        seen = 0
+
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.get_bounds(index)[1], self.max)
+
+        return self.max
+
+    def count_below(self, value: int) -> int:
+        """Count the values lower or equal to a value, by whole buckets
+
+        Args:
+            value (int): Value
+
+        Returns:
+            int: Values count
+        """
+        last_index = min(self.get_index(value), len(self.counts) - 1)
+
+        # The bucket of the value is counted when it is its highest value
+        if self.get_bounds(last_index)[1] > value:
+            last_index -= 1
+
+        return sum(self.counts[: last_index + 1])
+
+
+class CallStats:
+    """Statistics of a terminal function or a package operation"""
+
+    def __init__(self) -> None:
+        self.histogram = LatencyHistogram()
+        self.errors = 0
+        self.payload_items = 0
+        self.payload_bytes = 0
+
+    def snapshot(self) -> dict:
+        """Get the statistics, durations in seconds
+
+        Returns:
+            dict: Statistics
+        """
+        histogram = self.histogram
+
+        return {
+            "count": histogram.count,
+            "errors": self.errors,
+            "payload_items": self.payload_items,
+            "payload_bytes": self.payload_bytes,
+            "total_s": histogram.total / 1e9,
+            "min_s": (histogram.min or 0) / 1e9,
+            "max_s": (histogram.max or 0) / 1e9,
+            "p50_s": histogram.percentile(50) / 1e9,
+            "p90_s": histogram.percentile(90) / 1e9,
+            "p99_s": histogram.percentile(99) / 1e9,
+            "p999_s": histogram.percentile(99.9) / 1e9,
+        }
+
+
+class TerminalMetrics:
+    """Counts, durations and payloads of the terminal calls and operations
+
+    Once enabled, every terminal function called through the mt5 proxy is measured
+    (Rates, AccountLive, the models and Trade all call the terminal through it),
+    as are the package operations decorated with timed, such as the account
+    refresh. The time of a cycle not spent in them is Python time.
+
+    >>> metrics = enable_metrics()
+    >>> ...
+    >>> metrics.snapshot()["terminal"]["order_send"]["p99_s"]
+    >>> print(metrics.to_prometheus())
+    """
+
+    def __init__(self) -> None:
+        self.stats: Dict[Tuple[str, str], CallStats] = {}
+        self.lock = threading.Lock()
+
+    def record(
+        self,
+        kind: str,
+        name: str,
+        duration_ns: int,
+        result: Any = None,
+        error: bool = False,
+    ) -> None:
+        """Record a call
+
+        Args:
+            kind (str): "terminal" or "span"
+            name (str): Function or operation name
+            duration_ns (int): Call duration in ns
+            result (Any, optional): Call result, its length is the payload.
+            Defaults to None.
+            error (bool, optional): The call failed. Defaults to False.
+        """
+        with self.lock:
+            stats = self.stats.get((kind, name))
+            if stats is None:
+                stats = self.stats[(kind, name)] = CallStats()
+
+            stats.histogram.record(duration_ns)
+            stats.errors += error
+
+            # Arrays and tuples of structures, a structure is a single item
+            if hasattr(result, "_fields"):
+                stats.payload_items += 1
+            elif result is not None and hasattr(result, "__len__"):
+                stats.payload_items += len(result)
+                stats.payload_bytes += getattr(result, "nbytes", 0)
+
+    def wrap(self, name: str, function: Callable) -> Callable:
+        """Measure a terminal function
+
+        Args:
+            name (str): Function name
+            function (Callable): Backend function
+
+        Returns:
+            Callable: Measured function
+        """
+
+        @wraps(function)
+        def measured(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                result = function(*args, **kwargs)
+            except Exception:
+                self.record(TERMINAL, name, time.perf_counter_ns() - start, error=True)
+                raise
+
+            # The terminal functions return None on errors
+            self.record(
+                TERMINAL,
+                name,
+                time.perf_counter_ns() - start,
+                result=result,
+                error=result is None,
+            )
+
+            return result
+
+        return measured
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Measure a block of code
+
+        Args:
+            name (str): Operation name
+
+        Yields:
+            Iterator[None]: Measured block
+        """
+        start = time.perf_counter_ns()
+        error = True
+
+        try:
+            yield
+            error = False
+        finally:
+            self.record(SPAN, name, time.perf_counter_ns() - start, error=error)
+
+    def reset(self) -> None:
+        """Remove every statistic"""
+        with self.lock:
+            self.stats.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, dict]]:
+        """Get the statistics of every call
+
+        Returns:
+            Dict[str, Dict[str, dict]]: Statistics, by kind and name
+        """
+        snapshot = {TERMINAL: {}, SPAN: {}}
+
+        with self.lock:
+            for (kind, name), stats in sorted(self.stats.items()):
+                snapshot.setdefault(kind, {})[name] = stats.snapshot()
+
+        return snapshot
+
+    def to_prometheus(self, prefix: str = "algorithmictrading") -> str:
+        """Export the statistics in the Prometheus text format
+
+        Args:
+            prefix (str, optional): Metrics names prefix. Defaults to
+            "algorithmictrading".
+
+        Returns:
+            str: Prometheus exposition text
+        """
+        families = {
+            "calls_total": ("counter", "Calls count"),
+            "errors_total": ("counter", "Failed calls count"),
+            "payload_items_total": ("counter", "Items returned by the calls"),
+            "payload_bytes_total": ("counter", "Bytes of the arrays returned"),
+            "call_seconds": ("histogram", "Calls duration in seconds"),
+        }
+        samples = {family: [] for family in families}
+
+        with self.lock:
+            for (kind, name), stats in sorted(self.stats.items()):
+                labels = f'kind="{kind}",call="{name}"'
+                histogram = stats.histogram
+
+                samples["calls_total"].append(f"{{{labels}}} {histogram.count}")
+                samples["errors_total"].append(f"{{{labels}}} {stats.errors}")
+                samples["payload_items_total"].append(
+                    f"{{{labels}}} {stats.payload_items}"
+                )
+                samples["payload_bytes_total"].append(
+                    f"{{{labels}}} {stats.payload_bytes}"
+                )
+
+                for bucket in PROMETHEUS_BUCKETS:
+                    count = histogram.count_below(int(bucket * 1e9))
+                    samples["call_seconds"].append(
+                        f'_bucket{{{labels},le="{bucket}"}} {count}'
+                    )
+                samples["call_seconds"].extend(
+                    [
+                        f'_bucket{{{labels},le="+Inf"}} {histogram.count}',
+                        f"_sum{{{labels}}} {histogram.total / 1e9}",
+                        f"_count{{{labels}}} {histogram.count}",
+                    ]
+                )
+
+        lines = []
+        for family, (metric_type, description) in families.items():
+            name = f"{prefix}_{family}"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.extend(f"{name}{sample}" for sample in samples[family])
+
+        return "\n".join(lines) + "\n"
+
+
+def enable_metrics(metrics: TerminalMetrics = None) -> TerminalMetrics:
+    """Start measuring the terminal calls and operations
+
+    Args:
+        metrics (TerminalMetrics, optional): Metrics receiving the calls. Defaults
+        to new metrics.
+
+    Returns:
+        TerminalMetrics: Active metrics
+    """
+    global _metrics
+
+    _metrics = TerminalMetrics() if metrics is None else metrics
+
+    return _metrics
+
+
+def disable_metrics() -> TerminalMetrics:
+    """Stop measuring, the calls have no extra cost
+
+    Returns:
+        TerminalMetrics: Metrics measured until now
+    """
+    global _metrics
+
+    metrics, _metrics = _metrics, None
+
+    return metrics
+
+
+def get_metrics() -> TerminalMetrics:
+    """Get the active metrics
+
+    Returns:
+        TerminalMetrics: Active metrics, None when disabled
+    """
+    return _metrics
+
+
+def timed(name: str) -> Callable:
+    """Measure a package operation, when the metrics are enabled
+
+    Args:
+        name (str): Operation name
+
+    Returns:
+        Callable: Decorator
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def measured(*args, **kwargs):
+            metrics = _metrics
+
+            # Disabled, one global read
+            if metrics is None:
+                return function(*args, **kwargs)
+
+            with metrics.span(name):
+                return function(*args, **kwargs)
+
+        return measured
+
+    return decorator
@@ -0,0 +1,958 @@
+import os
+import threading
+import time
+import numpy as np
+import pandas as pd
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from AlgorithmicTrading.terminal import constants as mt5
+from AlgorithmicTrading.terminal.backend import MetaTraderBackend, TerminalBackend
+from AlgorithmicTrading.terminal.structures import (
+    RATES_DTYPE,
+    TICKS_DTYPE,
+    AccountInfo,
+    OrderSendResult,
+    SymbolInfo,
+    TerminalInfo,
+    TradeDeal,
+    TradeOrder,
+    TradePosition,
+    TradeRequest,
+)
+
+
+def _timestamp(date) -> int:
+    """Convert a request date to seconds, naive datetimes are UTC"""
+    if isinstance(date, datetime):
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+
+        return int(date.timestamp())
+
+    return int(date)
+
+
+def _frame_to_array(df: pd.DataFrame, dtype: np.dtype) -> np.ndarray:
+    """Convert a DataFrame to a terminal structured array"""
+    array = np.empty(len(df), dtype=dtype)
+    for name in dtype.names:
+        array[name] = df[name].to_numpy()
+
+    return array
+
+
+def terminal_call(function: Callable) -> Callable:
+    """Simulate the terminal inter process communication
+
+    Waits the simulated latency and runs the call holding the backend lock, so the
+    backend can be called from many threads.
+
+    Args:
+        function (Callable): Backend function
+
+    Returns:
+        Callable: Backend function with latency
+    """
+
+    @wraps(function)
+    def call(self: "ReplayBackend", *args, **kwargs):
+        self.wait()
+
+        with self.lock:
+            return function(self, *args, **kwargs)
+
+    return call
+
+
+class ReplayBackend(TerminalBackend):
+    """Terminal replay of recorded or synthetic data
+
+    Serves symbols, candles and ticks from memory and simulates the account: market
+    orders are filled at the current tick, pending orders are stored (they are not
+    triggered by the replay) and the positions are marked to the current tick.
+
+    The replay clock sets the current tick, the data after it is not visible. When
+    the clock is not set the last tick of each symbol is the current one.
+
+    Each call waits "latency" plus an exponentially distributed "jitter" delay, as
+    the inter process communication with the terminal.
+
+    Args:
+        latency (float, optional): Fixed delay of each call in seconds. Defaults to 0.
+        jitter (float, optional): Mean random delay of each call in seconds. Defaults to 0.
+        seed (int, optional): Jitter random seed. Defaults to None.
+        balance (float, optional): Account initial balance. Defaults to 10_000.
+        leverage (int, optional): Account leverage. Defaults to 100.
+        currency (str, optional): Account currency. Defaults to "USD".
+        margin_mode (int, optional): Account margin mode. Defaults to hedging.
+        max_bars (int, optional): Terminal chart max bars. Defaults to 100_000.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0,
+        jitter: float = 0,
+        seed: int = None,
+        balance: float = 10_000,
+        leverage: int = 100,
+        currency: str = "USD",
+        margin_mode: int = mt5.ACCOUNT_MARGIN_MODE_RETAIL_HEDGING,
+        max_bars: int = 100_000,
+    ) -> None:
+        # Inter process communication
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = np.random.default_rng(seed)
+        self.lock = threading.RLock()
+
+        # Market data
+        self.symbols: Dict[str, SymbolInfo] = {}
+        self.rates: Dict[Tuple[str, int], np.ndarray] = {}
+        self.ticks: Dict[str, np.ndarray] = {}
+        self.clock_msc: int = None
+
+        # Terminal
+        self.max_bars = max_bars
+        self.connected = False
+        self.login = 0
+        self.error = (1, "Success")
+
+        # Account
+        self.balance = balance
+        self.leverage = leverage
+        self.currency = currency
+        self.margin_mode = margin_mode
+        self.positions: Dict[int, dict] = {}
+        self.orders: Dict[int, dict] = {}
+        self.deals: List[TradeDeal] = []
+        self.last_ticket = 0
+        self.request_id = 0
+
+        # Initial deposit
+        now = datetime.now(timezone.utc)
+        self.deals.append(
+            TradeDeal(
+                ticket=self.new_ticket(),
+                time=int(now.timestamp()),
+                time_msc=int(now.timestamp() * 1_000),
+                type=mt5.DEAL_TYPE_BALANCE,
+                entry=mt5.DEAL_ENTRY_IN,
+                profit=float(balance),
+                comment="Initial deposit",
+            )
+        )
+
+    # Replay setup ----------------------------------------------------------------
+    def wait(self) -> None:
+        """Wait the simulated call latency"""
+        if not self.latency and not self.jitter:
+            return
+
+        delay = self.latency + (self.rng.exponential(self.jitter) if self.jitter else 0)
+        deadline = time.perf_counter() + delay
+
+        # Sleep is not precise under a few milliseconds, spin the remaining time
+        if delay > 0.002:
+            time.sleep(delay - 0.001)
+        while time.perf_counter() < deadline:
+            pass
+
+    def new_ticket(self) -> int:
+        """Get a new ticket number"""
+        self.last_ticket += 1
+
+        return self.last_ticket
+
+    def load_symbol(
+        self,
+        symbol: str,
+        ticks: np.ndarray = None,
+        rates: Dict[int, np.ndarray] = None,
+        **info,
+    ) -> None:
+        """Load the data of a symbol
+
+        Args:
+            symbol (str): Symbol name, the default currencies are the first and last three letters
+            ticks (np.ndarray, optional): Ticks structured array sorted by time. Defaults to None.
+            rates (Dict[int, np.ndarray], optional): Candles structured arrays by timeframe. Defaults to None.
+            **info: SymbolInfo fields, default to a 5 digits forex pair
+        """
+        digits = info.get("digits", 5)
+        point = info.get("point", 10.0**-digits)
+        contract_size = info.get("trade_contract_size", 100_000.0)
+
+        defaults = {
+            "select": True,
+            "visible": True,
+            "digits": digits,
+            "point": point,
+            "trade_mode": 4,
+            "volume_min": 0.01,
+            "volume_max": 500.0,
+            "volume_step": 0.01,
+            "trade_contract_size": contract_size,
+            "trade_tick_size": point,
+            "trade_tick_value": contract_size * point,
+            "trade_tick_value_profit": contract_size * point,
+            "trade_tick_value_loss": contract_size * point,
+            "currency_base": symbol[:3],
+            "currency_profit": symbol[-3:],
+            "currency_margin": symbol[:3],
+            "description": symbol,
+            "name": symbol,
+            "path": f"Replay\\{symbol}",
+        }
+        defaults.update(
+            {key: value for key, value in info.items() if key in SymbolInfo._fields}
+        )
+
+        with self.lock:
+            self.symbols[symbol] = SymbolInfo(**defaults)
+
+            if ticks is not None:
+                self.ticks[symbol] = np.asarray(ticks, dtype=TICKS_DTYPE)
+
+            for timeframe, candles in (rates or {}).items():
+                self.rates[(symbol, int(timeframe))] = np.asarray(
+                    candles, dtype=RATES_DTYPE
+                )
+
+    def set_time(self, date) -> None:
+        """Set the replay clock
+
+        Args:
+            date (datetime | int): Current time, seconds if int. None shows all the data.
+        """
+        with self.lock:
+            if date is None:
+                self.clock_msc = None
+            elif isinstance(date, datetime):
+                if date.tzinfo is None:
+                    date = date.replace(tzinfo=timezone.utc)
+                self.clock_msc = int(date.timestamp() * 1_000)
+            else:
+                self.clock_msc = int(date) * 1_000
+
+    @classmethod
+    def from_directory(cls, directory: str, **kwargs) -> "ReplayBackend":
+        """Load the recorded data of a directory
+
+        The directory layout is:
+            symbols.parquet                     One row of SymbolInfo fields per symbol
+            ticks/<symbol>.parquet              Ticks columns
+            rates/<symbol>/<timeframe>.parquet  Candles columns, timeframe as int
+
+        Args:
+            directory (str): Recorded data directory
+            **kwargs: ReplayBackend arguments
+
+        Returns:
+            ReplayBackend: Backend with the recorded data
+        """
+        backend = cls(**kwargs)
+        symbols = pd.read_parquet(os.path.join(directory, "symbols.parquet"))
+
+        for info in symbols.to_dict(orient="records"):
+            symbol = info["name"]
+
+            # Ticks
+            ticks = None
+            ticks_file = os.path.join(directory, "ticks", f"{symbol}.parquet")
+            if os.path.exists(ticks_file):
+                ticks = _frame_to_array(pd.read_parquet(ticks_file), TICKS_DTYPE)
+
+            # Candles of each timeframe
+            rates = {}
+            rates_directory = os.path.join(directory, "rates", symbol)
+            if os.path.isdir(rates_directory):
+                for file_name in os.listdir(rates_directory):
+                    timeframe, extension = os.path.splitext(file_name)
+                    if extension == ".parquet":
+                        rates[int(timeframe)] = _frame_to_array(
+                            pd.read_parquet(os.path.join(rates_directory, file_name)),
+                            RATES_DTYPE,
+                        )
+
+            backend.load_symbol(symbol, ticks=ticks, rates=rates, **info)
+
+        return backend
+
+    def save(self, directory: str) -> None:
+        """Save the market data with the from_directory layout
+
+        Args:
+            directory (str): Data directory
+        """
+        os.makedirs(os.path.join(directory, "ticks"), exist_ok=True)
+
+        pd.DataFrame([info._asdict() for info in self.symbols.values()]).to_parquet(
+            os.path.join(directory, "symbols.parquet"), index=False
+        )
+
+        for symbol, ticks in self.ticks.items():
+            pd.DataFrame(ticks).to_parquet(
+                os.path.join(directory, "ticks", f"{symbol}.parquet"), index=False
+            )
+
+        for (symbol, timeframe), candles in self.rates.items():
+            os.makedirs(os.path.join(directory, "rates", symbol), exist_ok=True)
+            pd.DataFrame(candles).to_parquet(
+                os.path.join(directory, "rates", symbol, f"{timeframe}.parquet"),
+                index=False,
+            )
+
+    @classmethod
+    def record(
+        cls,
+        directory: str,
+        symbols: Iterable[str],
+        date_from: datetime,
+        date_to: datetime,
+        timeframes: Iterable[int] = (mt5.TIMEFRAME_M1,),
+        source: TerminalBackend = None,
+    ) -> "ReplayBackend":
+        """Record terminal data to a directory
+
+        Args:
+            directory (str): Data directory
+            symbols (Iterable[str]): Recorded symbols
+            date_from (datetime): From date
+            date_to (datetime): To date
+            timeframes (Iterable[int], optional): Recorded timeframes. Defaults to (TIMEFRAME_M1,).
+            source (TerminalBackend, optional): Data source. Defaults to the MetaTrader 5 terminal.
+
+        Returns:
+            ReplayBackend: Backend with the recorded data
+        """
+        source = MetaTraderBackend() if source is None else source
+        backend = cls()
+
+        for symbol in symbols:
+            info = source.symbol_info(symbol)
+            if info is None:
+                raise ValueError(f"[ERROR]: Symbol {symbol} not found")
+
+            ticks = source.copy_ticks_range(
+                symbol, date_from, date_to, mt5.COPY_TICKS_ALL
+            )
+            rates = {
+                timeframe: source.copy_rates_range(
+                    symbol, timeframe, date_from, date_to
+                )
+                for timeframe in timeframes
+            }
+
+            backend.load_symbol(
+                symbol,
+                ticks=ticks,
+                rates={
+                    timeframe: candles
+                    for timeframe, candles in rates.items()
+                    if candles is not None
+                },
+                **info._asdict(),
+            )
+
+        backend.save(directory)
+
+        return backend
+
+    # Market data -------------------------------------------------------------------
+    def current_tick(self, symbol: str) -> np.void:
+        """Get the tick at the replay clock
+
+        Args:
+            symbol (str): Symbol name
+
+        Returns:
+            np.void: Current tick, None without ticks
+        """
+        ticks = self.ticks.get(symbol)
+        if ticks is None or not len(ticks):
+            return None
+
+        if self.clock_msc is None:
+            return ticks[-1]
+
+        index = np.searchsorted(ticks["time_msc"], self.clock_msc, side="right") - 1
+
+        return ticks[index] if index >= 0 else None
+
+    def __set_error(self, code: int, message: str) -> None:
+        self.error = (code, message)
+
+    def __get_rates(self, symbol: str, timeframe: int) -> np.ndarray:
+        """Get the candles visible at the replay clock"""
+        rates = self.rates.get((symbol, int(timeframe)))
+        if rates is None:
+            self.__set_error(-2, "Terminal: Invalid params")
+            return None
+
+        if self.clock_msc is not None:
+            rates = rates[: np.searchsorted(rates["time"], self.clock_msc // 1_000, "right")]
+
+        return rates
+
+    def __get_ticks(self, symbol: str, flags: int) -> np.ndarray:
+        """Get the ticks visible at the replay clock"""
+        ticks = self.ticks.get(symbol)
+        if ticks is None:
+            self.__set_error(-2, "Terminal: Invalid params")
+            return None
+
+        if self.clock_msc is not None:
+            ticks = ticks[: np.searchsorted(ticks["time_msc"], self.clock_msc, "right")]
+
+        # Quotes or trades only
+        if flags == mt5.COPY_TICKS_INFO:
+            ticks = ticks[(ticks["flags"] & (mt5.TICK_FLAG_BID | mt5.TICK_FLAG_ASK)) > 0]
+        elif flags == mt5.COPY_TICKS_TRADE:
+            ticks = ticks[
+                (ticks["flags"] & (mt5.TICK_FLAG_LAST | mt5.TICK_FLAG_VOLUME)) > 0
+            ]
+
+        return ticks
+
+    # Terminal ----------------------------------------------------------------------
+    @terminal_call
+    def initialize(self, *args, **kwargs) -> bool:
+        self.connected = True
+        self.login = kwargs.get("login", self.login)
+
+        return True
+
+    @terminal_call
+    def shutdown(self) -> None:
+        self.connected = False
+
+    def last_error(self) -> Tuple[int, str]:
+        return self.error
+
+    @terminal_call
+    def terminal_info(self) -> TerminalInfo:
+        return TerminalInfo(
+            connected=self.connected,
+            trade_allowed=True,
+            maxbars=self.max_bars,
+            name="Replay",
+            company="AlgorithmicTrading",
+        )
+
+    @terminal_call
+    def account_info(self) -> AccountInfo:
+        profit = 0.0
+        margin = 0.0
+
+        for position in self.positions.values():
+            marked = self.__mark_position(position)
+            profit += marked["profit"]
+            margin += (
+                marked["volume"]
+                * self.symbols[marked["symbol"]].trade_contract_size
+                * marked["price_open"]
+                / self.leverage
+            )
+
+        equity = self.balance + profit
+
+        return AccountInfo(
+            login=self.login,
+            trade_mode=mt5.ACCOUNT_TRADE_MODE_DEMO,
+            leverage=self.leverage,
+            limit_orders=200,
+            margin_so_mode=mt5.ACCOUNT_STOPOUT_MODE_PERCENT,
+            trade_allowed=True,
+            trade_expert=True,
+            margin_mode=self.margin_mode,
+            currency_digits=2,
+            balance=round(self.balance, 2),
+            profit=round(profit, 2),
+            equity=round(equity, 2),
+            margin=round(margin, 2),
+            margin_free=round(equity - margin, 2),
+            margin_level=round(equity / margin * 100, 2) if margin else 0.0,
+            margin_so_call=50.0,
+            margin_so_so=30.0,
+            name="Replay",
+            server="Replay",
+            currency=self.currency,
+            company="AlgorithmicTrading",
+        )
+
+    # Symbols and rates ---------------------------------------------------------------
+    @terminal_call
+    def symbols_get(self, *args, **kwargs) -> Tuple[SymbolInfo, ...]:
+        return tuple(self.symbols.values())
+
+    @terminal_call
+    def symbol_info(self, symbol: str) -> SymbolInfo:
+        info = self.symbols.get(symbol)
+        if info is None:
+            self.__set_error(-1, "Terminal: Symbol not found")
+            return None
+
+        # Current quote
+        tick = self.current_tick(symbol)
+        if tick is None:
+            return info
+
+        return info._replace(
+            time=int(tick["time"]),
+            bid=float(tick["bid"]),
+            ask=float(tick["ask"]),
+            spread=int(round((tick["ask"] - tick["bid"]) / info.point)),
+        )
+
+    @terminal_call
+    def copy_rates_from(self, symbol, timeframe, date_from, count) -> np.ndarray:
+        rates = self.__get_rates(symbol, timeframe)
+        if rates is None:
+            return None
+
+        end = np.searchsorted(rates["time"], _timestamp(date_from), side="right")
+
+        return rates[max(end - count, 0) : end].copy()
+
+    @terminal_call
+    def copy_rates_from_pos(self, symbol, timeframe, start_pos, count) -> np.ndarray:
+        rates = self.__get_rates(symbol, timeframe)
+        if rates is None:
+            return None
+
+        end = max(len(rates) - start_pos, 0)
+
+        return rates[max(end - count, 0) : end].copy()
+
+    @terminal_call
+    def copy_rates_range(self, symbol, timeframe, date_from, date_to) -> np.ndarray:
+        rates = self.__get_rates(symbol, timeframe)
+        if rates is None:
+            return None
+
+        # Both dates are included
+        start = np.searchsorted(rates["time"], _timestamp(date_from), side="left")
+        end = np.searchsorted(rates["time"], _timestamp(date_to), side="right")
+
+        return rates[start:end].copy()
+
+    @terminal_call
+    def copy_ticks_from(self, symbol, date_from, count, flags) -> np.ndarray:
+        ticks = self.__get_ticks(symbol, flags)
+        if ticks is None:
+            return None
+
+        start = np.searchsorted(ticks["time_msc"], _timestamp(date_from) * 1_000)
+
+        return ticks[start : start + count].copy()
+
+    @terminal_call
+    def copy_ticks_range(self, symbol, date_from, date_to, flags) -> np.ndarray:
+        ticks = self.__get_ticks(symbol, flags)
+        if ticks is None:
+            return None
+
+        # The end date is excluded, the range ticks belong to the candles inside it
+        start, end = np.searchsorted(
+            ticks["time_msc"],
+            [_timestamp(date_from) * 1_000, _timestamp(date_to) * 1_000],
+        )
+
+        return ticks[start:end].copy()
+
+    # Account -------------------------------------------------------------------------
+    def __mark_position(self, position: dict) -> dict:
+        """Get a position with the current price and profit"""
+        tick = self.current_tick(position["symbol"])
+        if tick is None:
+            return position
+
+        price = float(
+            tick["bid"] if position["type"] == mt5.POSITION_TYPE_BUY else tick["ask"]
+        )
+
+        return dict(
+            position,
+            price_current=price,
+            profit=self.__profit(
+                position["symbol"],
+                position["type"],
+                position["volume"],
+                position["price_open"],
+                price,
+            ),
+        )
+
+    def __profit(
+        self,
+        symbol: str,
+        position_type: int,
+        volume: float,
+        price_open: float,
+        price_close: float,
+    ) -> float:
+        """Compute a position profit in the account currency"""
+        info = self.symbols[symbol]
+        direction = 1 if position_type == mt5.POSITION_TYPE_BUY else -1
+        profit = direction * (price_close - price_open) * volume * info.trade_contract_size
+
+        # Profit currency is the pair quote, convert when the account is the base
+        if info.currency_profit != self.currency and info.currency_base == self.currency:
+            profit /= price_close
+
+        return round(profit, 2)
+
+    @terminal_call
+    def positions_get(self, symbol: str = None, group: str = None, ticket: int = None):
+        return tuple(
+            TradePosition(**self.__mark_position(position))
+            for position in self.positions.values()
+            if (symbol is None or position["symbol"] == symbol)
+            and (ticket is None or position["ticket"] == ticket)
+        )
+
+    @terminal_call
+    def orders_get(self, symbol: str = None, group: str = None, ticket: int = None):
+        return tuple(
+            TradeOrder(**order)
+            for order in self.orders.values()
+            if (symbol is None or order["symbol"] == symbol)
+            and (ticket is None or order["ticket"] == ticket)
+        )
+
+    @terminal_call
+    def history_deals_get(
+        self,
+        date_from=None,
+        date_to=None,
+        group: str = None,
+        ticket: int = None,
+        position: int = None,
+    ):
+        # Deals of an order or a position
+        if ticket is not None or position is not None:
+            return tuple(
+                deal
+                for deal in self.deals
+                if (ticket is None or deal.order == ticket)
+                and (position is None or deal.position_id == position)
+            )
+
+        time_from = _timestamp(date_from) if date_from is not None else 0
+        time_to = _timestamp(date_to) if date_to is not None else np.inf
+
+        return tuple(deal for deal in self.deals if time_from <= deal.time <= time_to)
+
+    # Trading -------------------------------------------------------------------------
+    def __result(
+        self, request: dict, retcode: int, comment: str, **kwargs
+    ) -> OrderSendResult:
+        """Build an order send result"""
+        self.request_id += 1
+
+        return OrderSendResult(
+            retcode=retcode,
+            comment=comment,
+            request_id=self.request_id,
+            request=TradeRequest(
+                **{
+                    key: value
+                    for key, value in request.items()
+                    if key in TradeRequest._fields
+                }
+            ),
+            **kwargs,
+        )
+
+    def __add_deal(
+        self,
+        order: int,
+        tick: np.void,
+        deal_type: int,
+        entry: int,
+        request: dict,
+        position_id: int,
+        volume: float,
+        price: float,
+        profit: float = 0.0,
+    ) -> int:
+        """Add a deal to the history and its profit to the balance"""
+        ticket = self.new_ticket()
+        self.deals.append(
+            TradeDeal(
+                ticket=ticket,
+                order=order,
+                time=int(tick["time"]),
+                time_msc=int(tick["time_msc"]),
+                type=deal_type,
+                entry=entry,
+                magic=request.get("magic", 0),
+                position_id=position_id,
+                reason=mt5.DEAL_REASON_EXPERT,
+                volume=volume,
+                price=price,
+                profit=profit,
+                symbol=request["symbol"],
+                comment=request.get("comment", ""),
+            )
+        )
+        self.balance += profit
+
+        return ticket
+
+    def __open_position(
+        self, order: int, tick: np.void, request: dict, volume: float, price: float
+    ) -> int:
+        """Open a new position"""
+        deal_type = int(request["type"])
+        deal = self.__add_deal(
+            order, tick, deal_type, mt5.DEAL_ENTRY_IN, request, order, volume, price
+        )
+
+        self.positions[order] = {
+            "ticket": order,
+            "time": int(tick["time"]),
+            "time_msc": int(tick["time_msc"]),
+            "time_update": int(tick["time"]),
+            "time_update_msc": int(tick["time_msc"]),
+            "type": deal_type,
+            "magic": request.get("magic", 0),
+            "identifier": order,
+            "reason": mt5.POSITION_REASON_EXPERT,
+            "volume": volume,
+            "price_open": price,
+            "sl": request.get("sl", 0.0),
+            "tp": request.get("tp", 0.0),
+            "price_current": price,
+            "swap": 0.0,
+            "profit": 0.0,
+            "symbol": request["symbol"],
+            "comment": request.get("comment", ""),
+            "external_id": "",
+        }
+
+        return deal
+
+    def __close_position(
+        self,
+        order: int,
+        tick: np.void,
+        request: dict,
+        position: dict,
+        volume: float,
+        price: float,
+        entry: int = mt5.DEAL_ENTRY_OUT,
+    ) -> int:
+        """Close a position volume"""
+        profit = self.__profit(
+            position["symbol"], position["type"], volume, position["price_open"], price
+        )
+        deal = self.__add_deal(
+            order,
+            tick,
+            int(request["type"]),
+            entry,
+            request,
+            position["ticket"],
+            volume,
+            price,
+            profit,
+        )
+
+        position["volume"] = round(position["volume"] - volume, 8)
+        position["time_update"] = int(tick["time"])
+        position["time_update_msc"] = int(tick["time_msc"])
+        if position["volume"] <= 0:
+            del self.positions[position["ticket"]]
+
+        return deal
+
+    def __market_deal(self, request: dict) -> OrderSendResult:
+        """Execute a market order"""
+        symbol = request.get("symbol")
+        info = self.symbols.get(symbol)
+        tick = self.current_tick(symbol) if info else None
+
+        if tick is None:
+            return self.__result(
+                request, mt5.TRADE_RETCODE_MARKET_CLOSED, "Market closed"
+            )
+
+        # Fill price and slippage check
+        is_buy = request["type"] == mt5.ORDER_TYPE_BUY
+        price = float(tick["ask"] if is_buy else tick["bid"])
+        requested_price = request.get("price", 0)
+        deviation = request.get("deviation", 0) * info.point
+        if requested_price and abs(requested_price - price) > deviation + 1e-12:
+            return self.__result(
+                request,
+                mt5.TRADE_RETCODE_REQUOTE,
+                "Requote",
+                bid=float(tick["bid"]),
+                ask=float(tick["ask"]),
+            )
+
+        volume = float(request.get("volume", 0))
+        if volume < info.volume_min or volume > info.volume_max:
+            return self.__result(
+                request, mt5.TRADE_RETCODE_INVALID_VOLUME, "Invalid volume"
+            )
+
+        order = self.new_ticket()
+
+        # Close a selected position
+        if request.get("position"):
+            position = self.positions.get(request["position"])
+            if position is None:
+                return self.__result(
+                    request, mt5.TRADE_RETCODE_POSITION_CLOSED, "Position closed"
+                )
+            deal = self.__close_position(
+                order, tick, request, position, min(volume, position["volume"]), price
+            )
+
+        # Netting, the symbol position is increased, reduced or reversed
+        elif self.margin_mode != mt5.ACCOUNT_MARGIN_MODE_RETAIL_HEDGING and (
+            position := next(
+                (p for p in self.positions.values() if p["symbol"] == symbol), None
+            )
+        ):
+            if position["type"] == request["type"]:
+                total = position["volume"] + volume
+                position["price_open"] = round(
+                    (position["price_open"] * position["volume"] + price * volume)
+                    / total,
+                    info.digits,
+                )
+                position["volume"] = total
+                deal = self.__add_deal(
+                    order,
+                    tick,
+                    int(request["type"]),
+                    mt5.DEAL_ENTRY_IN,
+                    request,
+                    position["ticket"],
+                    volume,
+                    price,
+                )
+            elif volume <= position["volume"]:
+                deal = self.__close_position(
+                    order, tick, request, position, volume, price
+                )
+            else:
+                remaining = round(volume - position["volume"], 8)
+                self.__close_position(
+                    order,
+                    tick,
+                    request,
+                    position,
+                    position["volume"],
+                    price,
+                    entry=mt5.DEAL_ENTRY_INOUT,
+                )
+                deal = self.__open_position(order, tick, request, remaining, price)
+
+        # New position
+        else:
+            deal = self.__open_position(order, tick, request, volume, price)
+
+        return self.__result(
+            request,
+            mt5.TRADE_RETCODE_DONE,
+            "Request executed",
+            deal=deal,
+            order=order,
+            volume=volume,
+            price=price,
+            bid=float(tick["bid"]),
+            ask=float(tick["ask"]),
+        )
+
+    @terminal_call
+    def order_send(self, request: dict) -> OrderSendResult:
+        action = request.get("action")
+
+        # Market order
+        if action == mt5.TRADE_ACTION_DEAL:
+            return self.__market_deal(request)
+
+        # Pending order
+        if action == mt5.TRADE_ACTION_PENDING:
+            tick = self.current_tick(request.get("symbol"))
+            if tick is None:
+                return self.__result(
+                    request, mt5.TRADE_RETCODE_MARKET_CLOSED, "Market closed"
+                )
+
+            ticket = self.new_ticket()
+            self.orders[ticket] = {
+                "ticket": ticket,
+                "time_setup": int(tick["time"]),
+                "time_setup_msc": int(tick["time_msc"]),
+                "time_expiration": request.get("expiration", 0),
+                "type": request["type"],
+                "type_time": request.get("type_time", mt5.ORDER_TIME_GTC),
+                "type_filling": request.get("type_filling", mt5.ORDER_FILLING_FOK),
+                "state": mt5.ORDER_STATE_PLACED,
+                "magic": request.get("magic", 0),
+                "reason": mt5.ORDER_REASON_EXPERT,
+                "volume_initial": request["volume"],
+                "volume_current": request["volume"],
+                "price_open": request["price"],
+                "sl": request.get("sl", 0.0),
+                "tp": request.get("tp", 0.0),
+                "price_current": float(tick["bid"]),
+                "price_stoplimit": request.get("stoplimit", 0.0),
+                "symbol": request["symbol"],
+                "comment": request.get("comment", ""),
+            }
+
+            return self.__result(
+                request,
+                mt5.TRADE_RETCODE_DONE,
+                "Request executed",
+                order=ticket,
+                volume=request["volume"],
+                price=request["price"],
+            )
+
+        # Position stop loss and take profit
+        if action == mt5.TRADE_ACTION_SLTP:
+            position = self.positions.get(request.get("position"))
+            if position is None:
+                return self.__result(
+                    request, mt5.TRADE_RETCODE_POSITION_CLOSED, "Position closed"
+                )
+
+            position.update(sl=request.get("sl", 0.0), tp=request.get("tp", 0.0))
+
+            return self.__result(request, mt5.TRADE_RETCODE_DONE, "Request executed")
+
+        # Pending order modification and removal
+        if action in (mt5.TRADE_ACTION_MODIFY, mt5.TRADE_ACTION_REMOVE):
+            order = self.orders.get(request.get("order"))
+            if order is None:
+                return self.__result(
+                    request, mt5.TRADE_RETCODE_INVALID_ORDER, "Invalid order"
+                )
+
+            if action == mt5.TRADE_ACTION_REMOVE:
+                del self.orders[order["ticket"]]
+            else:
+                order.update(
+                    price_open=request.get("price", order["price_open"]),
+                    sl=request.get("sl", 0.0),
+                    tp=request.get("tp", 0.0),
+                    time_expiration=request.get("expiration", 0),
+                )
+
+            return self.__result(
+                request,
+                mt5.TRADE_RETCODE_DONE,
+                "Request executed",
+                order=order["ticket"],
+            )
+
+        return self.__result(request, mt5.TRADE_RETCODE_INVALID, "Invalid request")
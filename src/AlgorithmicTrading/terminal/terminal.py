@@ -0,0 +1,120 @@
+import os
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from AlgorithmicTrading.terminal import constants
+from AlgorithmicTrading.terminal.backend import (
+    TERMINAL_FUNCTIONS,
+    MetaTraderBackend,
+    TerminalBackend,
+)
+from AlgorithmicTrading.terminal.gateway import ROUTED_FUNCTIONS, get_gateway
+from AlgorithmicTrading.terminal.metrics import get_metrics
+
+# Directory of recorded data used as default backend, instead of the terminal
+REPLAY_PATH_VARIABLE = "MT5_REPLAY_PATH"
+
+_backend: TerminalBackend = None
+
+
+def get_backend() -> TerminalBackend:
+    """Get the active terminal backend
+
+    The first call creates the default backend: a replay of the directory set in
+    the "MT5_REPLAY_PATH" environment variable or the MetaTrader 5 terminal.
+
+    Returns:
+        TerminalBackend: Active backend
+    """
+    global _backend
+
+    if _backend is None:
+        replay_path = os.getenv(REPLAY_PATH_VARIABLE)
+
+        if replay_path:
+            from AlgorithmicTrading.terminal.replay import ReplayBackend
+
+            _backend = ReplayBackend.from_directory(replay_path)
+        else:
+            _backend = MetaTraderBackend()
+
+    return _backend
+
+
+def set_backend(backend: TerminalBackend) -> TerminalBackend:
+    """Set the active terminal backend
+
+    Args:
+        backend (TerminalBackend): New backend
+
+    Returns:
+        TerminalBackend: Previous backend
+    """
+    global _backend
+
+    previous, _backend = _backend, backend
+
+    return previous
+
+
+@contextmanager
+def use_backend(backend: TerminalBackend) -> Iterator[TerminalBackend]:
+    """Use a terminal backend inside a block
+
+    Args:
+        backend (TerminalBackend): Backend
+
+    Yields:
+        Iterator[TerminalBackend]: Backend
+    """
+    previous = set_backend(backend)
+
+    try:
+        yield backend
+    finally:
+        set_backend(previous)
+
+
+class TerminalProxy:
+    """MetaTrader5 package interface
+
+    Drop in replacement of the MetaTrader5 module: the constants are the same in
+    every backend and are read from this object, the functions and the result
+    structures are read from the active backend. When the metrics are enabled, the
+    functions are measured, and when the gateway is enabled, the requests are routed
+    through it.
+    """
+
+    # Functions measured by the metrics
+    measured_functions = frozenset(TERMINAL_FUNCTIONS)
+
+    def __init__(self) -> None:
+        self.__dict__.update(
+            {
+                name: value
+                for name, value in vars(constants).items()
+                if name.isupper()
+            }
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        # Python internal attributes
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        attribute = getattr(get_backend(), name)
+
+        # Disabled metrics and gateway cost a single check each
+        metrics = get_metrics()
+        if metrics is not None and name in self.measured_functions:
+            attribute = metrics.wrap(name, attribute)
+
+        # Routed after the metrics, they count the calls reaching the terminal
+        gateway = get_gateway()
+        if gateway is not None and name in ROUTED_FUNCTIONS:
+            attribute = gateway.wrap(name, attribute)
+
+        return attribute
+
+
+mt5 = TerminalProxy()
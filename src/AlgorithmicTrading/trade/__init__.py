@@ -1 +1,3 @@
 from .trade import Trade
+from .retry import RetryPolicy
+from .async_trade import AsyncTrade
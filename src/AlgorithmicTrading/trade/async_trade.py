@@ -0,0 +1,173 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Callable, List
+
+from AlgorithmicTrading.trade.trade import Trade
+
+
+class AsyncTrade:
+    """Asynchronous facade of a Trade
+
+    The trade operations run on a dedicated thread pool, so the terminal calls and
+    the retry delays of an order do not block the event loop nor the other orders.
+    A basket sent with gather takes about as long as its slowest order.
+
+    >>> async with AsyncTrade(trade) as async_trade:
+    ...     results = await async_trade.gather(
+    ...         async_trade.buy("EURUSD", 0.1, timeout=2),
+    ...         async_trade.buy("GBPUSD", 0.1, timeout=2),
+    ...     )
+
+    A timeout stops waiting for the order, not the order itself: an order already
+    sent to the terminal can still be filled after its TimeoutError.
+
+    Args:
+        trade (Trade): Trade running the operations
+        workers (int, optional): Concurrent operations. Defaults to 8.
+        timeout (float, optional): Default timeout of each operation in seconds.
+        Defaults to None, no timeout.
+    """
+
+    def __init__(self, trade: Trade, workers: int = 8, timeout: float = None) -> None:
+        self.trade = trade
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="trade"
+        )
+
+    async def run(
+        self, method: Callable, *args, timeout: float = None, **kwargs
+    ) -> Any:
+        """Run a blocking trade method on the trade thread pool
+
+        Args:
+            method (Callable): Trade method
+            timeout (float, optional): Timeout in seconds. Defaults to the facade
+            timeout.
+
+        Raises:
+            asyncio.TimeoutError: The method did not return in time
+
+        Returns:
+            Any: Method result
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, partial(method, *args, **kwargs))
+
+        return await asyncio.wait_for(
+            future, timeout=self.timeout if timeout is None else timeout
+        )
+
+    async def gather(
+        self, *operations: Awaitable, return_exceptions: bool = True
+    ) -> List[Any]:
+        """Run many operations concurrently, refreshing the account once
+
+        Args:
+            *operations (Awaitable): Operations of this facade, e.g. self.buy(...)
+            return_exceptions (bool, optional): Return the errors and timeouts as
+            results instead of raising the first one. Defaults to True.
+
+        Returns:
+            List[Any]: Operations results, in order
+        """
+        loop = asyncio.get_running_loop()
+        batch = self.trade.batch()
+
+        # Without timeout, the batch must always be closed
+        await loop.run_in_executor(self.executor, batch.__enter__)
+
+        try:
+            return await asyncio.gather(*operations, return_exceptions=return_exceptions)
+        finally:
+            await loop.run_in_executor(
+                self.executor, partial(batch.__exit__, None, None, None)
+            )
+
+    def close(self) -> None:
+        """Wait the running operations and stop the thread pool"""
+        self.executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncTrade":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    # Market trade open shortcuts -----------------------------------------------------
+    async def buy(self, *args, timeout: float = None, **kwargs) -> bool:
+        """Open a buy market order, see Trade.buy"""
+        return await self.run(self.trade.buy, *args, timeout=timeout, **kwargs)
+
+    async def sell(self, *args, timeout: float = None, **kwargs) -> bool:
+        """Open a sell market order, see Trade.sell"""
+        return await self.run(self.trade.sell, *args, timeout=timeout, **kwargs)
+
+    # Pending trade open shortcuts ----------------------------------------------------
+    async def buy_stop(self, *args, timeout: float = None, **kwargs) -> bool:
+        """Open a buy stop order, see Trade.buy_stop"""
+        return await self.run(self.trade.buy_stop, *args, timeout=timeout, **kwargs)
+
+    async def buy_limit(self, *args, timeout: float = None, **kwargs) -> bool:
+        """Open a buy limit order, see Trade.buy_limit"""
+        return await self.run(self.trade.buy_limit, *args, timeout=timeout, **kwargs)
+
+    async def buy_stop_limit(self, *args, timeout: float = None, **kwargs) -> bool:
+        """Open a buy stop limit order, see Trade.buy_stop_limit"""
+        return await self.run(
+            self.trade.buy_stop_limit, *args, timeout=timeout, **kwargs
+        )
+
+    async def sell_limit(self, *args, timeout: float = None, **kwargs) -> bool:
+        """Open a sell limit order, see Trade.sell_limit"""
+        return await self.run(self.trade.sell_limit, *args, timeout=timeout, **kwargs)
+
+    async def sell_stop(self, *args, timeout: float = None, **kwargs) -> bool:
+        """Open a sell stop order, see Trade.sell_stop"""
+        return await self.run(self.trade.sell_stop, *args, timeout=timeout, **kwargs)
+
+    async def sell_stop_limit(self, *args, timeout: float = None, **kwargs) -> bool:
+        """Open a sell stop limit order, see Trade.sell_stop_limit"""
+        return await self.run(
+            self.trade.sell_stop_limit, *args, timeout=timeout, **kwargs
+        )
+
+    # Positions and orders ------------------------------------------------------------
+    async def modify_position(self, *args, timeout: float = None, **kwargs) -> bool:
+        """Modify a position, see Trade.modify_position"""
+        return await self.run(
+            self.trade.modify_position, *args, timeout=timeout, **kwargs
+        )
+
+    async def modify_pending_order(
+        self, *args, timeout: float = None, **kwargs
+    ) -> bool:
+        """Modify a pending order, see Trade.modify_pending_order"""
+        return await self.run(
+            self.trade.modify_pending_order, *args, timeout=timeout, **kwargs
+        )
+
+    async def close_position(self, *args, timeout: float = None, **kwargs) -> bool:
+        """Close a position, see Trade.close_position"""
+        return await self.run(
+            self.trade.close_position, *args, timeout=timeout, **kwargs
+        )
+
+    async def close_all_positions(self, comment: str = "") -> List[Any]:
+        """Close every position concurrently
+
+        Args:
+            comment (str, optional): Trade comment. Defaults to "".
+
+        Returns:
+            List[Any]: Close results, errors included
+        """
+        positions = await self.run(lambda: list(self.trade.account_data.positions))
+
+        return await self.gather(
+            *[
+                self.close_position(position_ticket=position.ticket, comment=comment)
+                for position in positions
+            ]
+        )
@@ -0,0 +1,116 @@
+import random
+from typing import Iterable, Optional
+
+from AlgorithmicTrading.models.metatrader import ENUM_TRADE_RETCODE
+
+MAX_RETRIES = 5  # Max retries on error
+RETRY_DELAY = 0.5  # Longest delay between retries in seconds
+
+# The price moved, the request is re-priced and sent again at once
+REPRICE_RETCODES = (
+    ENUM_TRADE_RETCODE.TRADE_RETCODE_REQUOTE,
+    ENUM_TRADE_RETCODE.TRADE_RETCODE_PRICE_CHANGED,
+    ENUM_TRADE_RETCODE.TRADE_RETCODE_PRICE_OFF,
+)
+# The server or the connection failed, the request waits before the retry
+BACKOFF_RETCODES = (
+    ENUM_TRADE_RETCODE.TRADE_RETCODE_CONNECTION,
+    ENUM_TRADE_RETCODE.TRADE_RETCODE_TIMEOUT,
+    ENUM_TRADE_RETCODE.TRADE_RETCODE_REJECT,
+    ENUM_TRADE_RETCODE.TRADE_RETCODE_ERROR,
+)
+
+
+class RetryPolicy:
+    """Retries of a trade request, by return code class
+
+    - Requotes and price changes: immediate retry, with a new price
+    - Connection errors and timeouts: exponential backoff with jitter
+    - Every retry stops at the max retries or at the order deadline
+
+    Args:
+        max_retries (int, optional): Max retries of an order. Defaults to 5.
+        deadline (float, optional): Seconds from the first request after which the
+        order is not retried. Defaults to 5.0.
+        backoff (float, optional): First backoff delay in seconds, doubled on each
+        retry. Defaults to 0.05.
+        max_backoff (float, optional): Longest backoff delay in seconds. Defaults
+        to 0.5.
+        jitter (float, optional): Fraction of the backoff delay drawn at random, so
+        concurrent orders do not retry together. Defaults to 0.5.
+        reprice_retcodes (Iterable, optional): Return codes retried at once.
+        Defaults to REQUOTE, PRICE_CHANGED and PRICE_OFF.
+        backoff_retcodes (Iterable, optional): Return codes retried with backoff.
+        Defaults to CONNECTION, TIMEOUT, REJECT and ERROR.
+        seed (int, optional): Jitter random seed. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = MAX_RETRIES,
+        deadline: float = 5.0,
+        backoff: float = 0.05,
+        max_backoff: float = RETRY_DELAY,
+        jitter: float = 0.5,
+        reprice_retcodes: Iterable = REPRICE_RETCODES,
+        backoff_retcodes: Iterable = BACKOFF_RETCODES,
+        seed: int = None,
+    ) -> None:
+        self.max_retries = max_retries
+        self.deadline = deadline
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.reprice_retcodes = frozenset(reprice_retcodes)
+        self.backoff_retcodes = frozenset(backoff_retcodes)
+        self.rng = random.Random(seed)
+
+    @classmethod
+    def fixed(
+        cls, max_retries: int = MAX_RETRIES, delay: float = RETRY_DELAY
+    ) -> "RetryPolicy":
+        """Same delay before every retry, without deadline
+
+        Args:
+            max_retries (int, optional): Max retries of an order. Defaults to 5.
+            delay (float, optional): Delay in seconds. Defaults to 0.5.
+
+        Returns:
+            RetryPolicy: Fixed delay policy
+        """
+        return cls(
+            max_retries=max_retries,
+            deadline=float("inf"),
+            backoff=delay,
+            max_backoff=delay,
+            jitter=0,
+            reprice_retcodes=(),
+            backoff_retcodes=REPRICE_RETCODES + BACKOFF_RETCODES,
+        )
+
+    def get_delay(self, retcode: int, retry: int, elapsed: float) -> Optional[float]:
+        """Get the delay before the next retry
+
+        Args:
+            retcode (int): Last request return code
+            retry (int): Retries already sent
+            elapsed (float): Seconds since the first request
+
+        Returns:
+            Optional[float]: Delay in seconds, None when the order is not retried
+        """
+        if retry >= self.max_retries:
+            return None
+
+        if retcode in self.reprice_retcodes:
+            delay = 0.0
+        elif retcode in self.backoff_retcodes:
+            delay = min(self.max_backoff, self.backoff * 2**retry)
+            delay *= 1 - self.jitter * self.rng.random()
+        else:
+            return None
+
+        if elapsed + delay > self.deadline:
+            return None
+
+        return delay
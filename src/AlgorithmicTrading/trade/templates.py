@@ -0,0 +1,223 @@
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Tuple
+
+from AlgorithmicTrading.models.metatrader import MqlTradeRequest, validate_prices
+from AlgorithmicTrading.utils.metatrader import validate_mt5_long_size
+
+# Position tickets, required by some actions and optional for the deals
+TICKET_FIELDS = ("position", "position_by")
+
+# Fields changing on every order, checked by the template
+VARIABLE_FIELDS = ("price", "volume", "sl", "tp", "comment") + TICKET_FIELDS
+
+# Optional variable fields values, to find the fields sent by each action
+UNSET_VALUES = {"sl": 0, "tp": 0, "position": None, "position_by": None, "comment": ""}
+SET_VALUES = {"sl": 1, "tp": 1, "position": 1, "position_by": 1, "comment": "-"}
+
+
+class RequestTemplate:
+    """Trade request validated once, producing the order_send dicts
+
+    The invariant fields (action, symbol, type, filling, magic...) are validated
+    once by MqlTradeRequest. Each order only checks its price, volume, stop loss,
+    take profit and position tickets, and copies the prepared request with its
+    comment, without creating a model.
+
+    >>> template = RequestTemplate({"action": ..., "symbol": "EURUSD", ...})
+    >>> mt5.order_send(template.build(price=1.1001, volume=0.1))
+
+    Args:
+        request (dict): Request data, as the MqlTradeRequest fields, with the
+        price and volume of a valid order
+
+    Raises:
+        ValidationError: Invalid request
+    """
+
+    def __init__(self, request: dict) -> None:
+        model = MqlTradeRequest(**request)
+        prepared = model.prepare()
+
+        self.order_type = model.type
+        self.stoplimit = model.stoplimit
+        # Fields sent by the request action
+        self.has_price = "price" in prepared
+        self.has_volume = "volume" in prepared
+        # Stops, tickets and comment sent by the action, always or only when set
+        unset_fields = model.copy(update=UNSET_VALUES).prepare()
+        set_fields = model.copy(update=SET_VALUES).prepare()
+        self.required_tickets = [
+            field for field in TICKET_FIELDS if field in unset_fields
+        ]
+        self.optional_fields = [
+            field
+            for field in ("sl", "tp", "comment") + TICKET_FIELDS
+            if field in set_fields and field not in unset_fields
+        ]
+        self.request = {
+            field: value
+            for field, value in prepared.items()
+            if field not in VARIABLE_FIELDS
+        }
+
+    @staticmethod
+    def get_key(request: dict) -> Tuple[Hashable, ...]:
+        """Get the key of the invariant fields of a request
+
+        Args:
+            request (dict): Request data
+
+        Returns:
+            Tuple[Hashable, ...]: Invariant fields and values
+        """
+        return tuple(
+            sorted(
+                (field, value)
+                for field, value in request.items()
+                if field not in VARIABLE_FIELDS
+            )
+        )
+
+    def build(
+        self,
+        price: float = None,
+        volume: float = None,
+        sl: float = 0,
+        tp: float = 0,
+        position: int = None,
+        position_by: int = None,
+        comment: str = "",
+    ) -> dict:
+        """Build the order_send dict of an order
+
+        Args:
+            price (float, optional): Order price, also used to check the stop loss
+            and take profit of the actions without price. Defaults to None.
+            volume (float, optional): Order volume. Defaults to None.
+            sl (float, optional): Stop loss, 0 for none. Defaults to 0.
+            tp (float, optional): Take profit, 0 for none. Defaults to 0.
+            position (int, optional): Position ticket. Defaults to None.
+            position_by (int, optional): Opposite position ticket. Defaults to None.
+            comment (str, optional): Order comment. Defaults to "".
+
+        Raises:
+            ValueError: Invalid price
+            ValueError: Invalid volume
+            ValueError: Invalid stop loss, take profit or stop limit
+            ValueError: Invalid position ticket
+
+        Returns:
+            dict: Prepared request
+        """
+        request = self.request.copy()
+        tickets = {"position": position, "position_by": position_by}
+        # Stops of the actions sending them only
+        sl = sl if "sl" in self.optional_fields else 0
+        tp = tp if "tp" in self.optional_fields else 0
+
+        for field, ticket in tickets.items():
+            if ticket is None:
+                if field in self.required_tickets:
+                    raise ValueError(f"[ERROR]: The {field} ticket is required")
+                continue
+
+            if ticket < 0:
+                raise ValueError(f"[ERROR]: Invalid {field} ticket")
+            validate_mt5_long_size(ticket)
+
+        if self.has_price:
+            if not price or price < 0 or not math.isfinite(price):
+                raise ValueError("[ERROR]: Invalid price")
+            request["price"] = price
+
+        if self.has_volume:
+            if not volume or volume < 0 or not math.isfinite(volume):
+                raise ValueError("[ERROR]: Invalid volume")
+            request["volume"] = volume
+
+        if sl or tp or self.stoplimit:
+            validate_prices(
+                price=price,
+                order_type=self.order_type,
+                sl=sl,
+                tp=tp,
+                stoplimit=self.stoplimit,
+            )
+
+        # Same optional fields as MqlTradeRequest.prepare
+        if sl:
+            request["sl"] = sl
+        if tp:
+            request["tp"] = tp
+
+        for field, value in {**tickets, "comment": comment}.items():
+            if field in self.required_tickets or (
+                value and field in self.optional_fields
+            ):
+                request[field] = value
+
+        return request
+
+
+class RequestTemplates:
+    """Request templates of a strategy, by invariant fields
+
+    The templates are shared by the threads of a trade, they are guarded by a
+    lock. The least recently used templates are dropped first.
+
+    Args:
+        max_templates (int, optional): Templates kept. Defaults to 256.
+    """
+
+    def __init__(self, max_templates: int = 256) -> None:
+        self.max_templates = max_templates
+        self.templates: Dict[Tuple[Hashable, ...], RequestTemplate] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, request: dict) -> RequestTemplate:
+        """Get the template of a request, validating it on the first use
+
+        Args:
+            request (dict): Request data
+
+        Returns:
+            RequestTemplate: Request template
+        """
+        key = RequestTemplate.get_key(request)
+
+        with self.lock:
+            template = self.templates.get(key)
+            if template is not None:
+                self.templates.move_to_end(key)
+                return template
+
+        # Validated outside the lock, a concurrent validation keeps the last one
+        template = RequestTemplate(request)
+
+        with self.lock:
+            self.templates[key] = template
+            while len(self.templates) > self.max_templates:
+                self.templates.popitem(last=False)
+
+        return template
+
+    def build(self, request: dict) -> dict:
+        """Build the order_send dict of a request
+
+        Args:
+            request (dict): Request data
+
+        Returns:
+            dict: Prepared request
+        """
+        return self.get(request).build(
+            price=request.get("price"),
+            volume=request.get("volume"),
+            sl=request.get("sl") or 0,
+            tp=request.get("tp") or 0,
+            position=request.get("position"),
+            position_by=request.get("position_by"),
+            comment=request.get("comment") or "",
+        )
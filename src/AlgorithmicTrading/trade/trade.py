@@ -1,11 +1,13 @@
-import MetaTrader5 as mt5
+from AlgorithmicTrading.terminal import mt5
+from AlgorithmicTrading.terminal.metrics import timed
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Callable, List
+from typing import Callable, Iterator, List, Tuple
 import time
+import threading
 import pandas as pd
 
 from AlgorithmicTrading.models.metatrader import (
-    MqlTradeRequest,
     MqlTradeResult,
     MqlAccountInfo,
     MqlTradeOrder,
@@ -20,12 +22,15 @@ from AlgorithmicTrading.models.metatrader import (
     ENUM_TRADE_RETCODE,
     ENUM_POSITION_TYPE,
     ENUM_CHECK_CODE,
+    ENUM_REFRESH_POLICY,
 )
 from AlgorithmicTrading.account import AccountLive
 from AlgorithmicTrading.rates import Rates
 from AlgorithmicTrading.utils.metatrader import decorator_validate_mt5_connection
 from AlgorithmicTrading.utils.trades import get_order
 from AlgorithmicTrading.utils.exceptions import CouldNotSelectPosition
+from AlgorithmicTrading.trade.templates import RequestTemplates
+from AlgorithmicTrading.trade.retry import RetryPolicy
 from AlgorithmicTrading.backtest.backtest import (
     decorator_backtest_open_position,
     decorator_backtest_open_pending_order,
@@ -34,12 +39,16 @@ from AlgorithmicTrading.backtest.backtest import (
     decorator_backtest_close_position,
 )
 
-MAX_RETRIES = 5  # Max retries on error
-RETRY_DELAY = 0.5  # Retry delay in seconds
-
 
 class Trade:
-    """Trade utilility class"""
+    """Trade utilility class
+
+    A trade can be shared by many threads, e.g. by an AsyncTrade: the batch depth
+    and the request templates are guarded by locks and last_result is kept by
+    thread, so each thread reads the result of its own requests. The account data
+    is replaced as a whole by the refreshes. The other attributes are settings,
+    they must not change while requests are sent.
+    """
 
     def __init__(
         self,
@@ -48,12 +57,100 @@ class Trade:
         deviation: int = 5,
         type_filling: ENUM_ORDER_TYPE_FILLING = ENUM_ORDER_TYPE_FILLING.ORDER_FILLING_FOK,
         backtest_env=None,
+        refresh_policy: ENUM_REFRESH_POLICY = ENUM_REFRESH_POLICY.REFRESH_POLICY_FULL,
+        retry_policy: RetryPolicy = None,
     ) -> None:
         self.account_data = account_data
         self.magic_number = magic_number
         self.deviation = deviation
         self.type_filling = type_filling
         self.backtest_env = backtest_env
+        self.refresh_policy = refresh_policy
+        self.retry_policy = RetryPolicy() if retry_policy is None else retry_policy
+        # Validated requests, by symbol and invariant fields
+        self.templates = RequestTemplates()
+        # Result of the last request sent by each thread
+        self.__results = threading.local()
+
+        # Nested batches, the account is refreshed by the outer one only
+        self.__batch_depth = 0
+        self.__batch_lock = threading.RLock()
+
+    @property
+    def last_result(self) -> MqlTradeResult:
+        """Result of the last request sent by the calling thread, with its attempts
+        and latency, None before the first request"""
+        return getattr(self.__results, "result", None)
+
+    # Account refresh -----------------------------------------------------------------
+    @property
+    def account_data(self) -> MqlAccountInfo:
+        """Account data, reloaded on read when it was invalidated"""
+        if self.__stale:
+            self.refresh(ENUM_REFRESH_POLICY.REFRESH_POLICY_FULL)
+
+        return self.__account_data
+
+    @account_data.setter
+    def account_data(self, account: MqlAccountInfo) -> None:
+        self.__account_data = account
+        self.__stale = False
+
+    @property
+    def is_backtest_account(self) -> bool:
+        """Check the account type, without reloading it"""
+        return self.__account_data.is_backtest_account
+
+    @timed("Trade.refresh")
+    def refresh(self, policy: ENUM_REFRESH_POLICY = None) -> None:
+        """Refresh the live account data, the backtest accounts are kept
+
+        Args:
+            policy (ENUM_REFRESH_POLICY, optional): Refresh policy. Defaults to the
+            trade refresh policy.
+        """
+        if self.is_backtest_account:
+            return
+
+        policy = self.refresh_policy if policy is None else policy
+
+        if policy == ENUM_REFRESH_POLICY.REFRESH_POLICY_FULL:
+            self.account_data = AccountLive.get_data()
+        elif policy == ENUM_REFRESH_POLICY.REFRESH_POLICY_POSITIONS_ORDERS:
+            self.__account_data.update_positions()
+            self.__account_data.update_orders()
+        else:
+            self.__stale = True
+
+    @contextmanager
+    def batch(self) -> Iterator["Trade"]:
+        """Refresh the account once around many operations
+
+        The operations inside the batch do not refresh the account, it is refreshed
+        before the first one and after the last one.
+
+        >>> with trade.batch():
+        ...     trade.buy("EURUSD", 0.1)
+        ...     trade.buy("GBPUSD", 0.1)
+
+        Yields:
+            Trade: Self
+        """
+        with self.__batch_lock:
+            self.__batch_depth += 1
+            outer_batch = self.__batch_depth == 1
+
+        try:
+            if outer_batch:
+                self.refresh()
+
+            yield self
+        finally:
+            with self.__batch_lock:
+                self.__batch_depth -= 1
+
+            if outer_batch:
+                self.refresh()
 
     def __decorator_refresh_account_data(method: Callable) -> Callable:
         """Refresh account data
@@ -66,40 +163,26 @@ class Trade:
         """
 
         # Refresh before and after
-        def refresh_before_and_after(*args, **kwargs) -> Callable:
+        def refresh_before_and_after(self: "Trade", *args, **kwargs) -> Callable:
             """Refresh account data
 
-            Refresh account data before and after the method execution
+            Refresh account data before and after the method execution, following
+            the refresh policy. Inside a batch the batch refreshes the account.
 
             Returns:
                 Callable: original function
             """
-
-            # Refresh the data
-            def refresh_account_data(account: MqlAccountInfo) -> MqlAccountInfo:
-                """Refresh account data
-
-                Args:
-                    account (MqlAccountInfo): Account
-
-                Returns:
-                    MqlAccountInfo: Refreshed data
-                """
-                # Check if the account is a backtest account
-                if not account.is_backtest_account:
-                    # Refresh account data
-                    account: MqlAccountInfo = AccountLive.get_data()
-
-                return account
+            if self.__batch_depth:
+                return method(self, *args, **kwargs)
 
             # Refresh before
-            args[0].account_data = refresh_account_data(args[0].account_data)
+            self.refresh()
 
             # Execute the method
-            method_result: bool = method(*args, **kwargs)
+            method_result: bool = method(self, *args, **kwargs)
 
             # Refresh after
-            args[0].account_data = refresh_account_data(args[0].account_data)
+            self.refresh()
 
             return method_result
 
@@ -139,6 +222,71 @@ class Trade:
 
         return status
 
+    @timed("Trade.send_request")
+    def __send_request(
+        self,
+        request: dict,
+        operation: str,
+        reprice: Callable[[dict], None] = None,
+    ) -> Tuple[MqlTradeResult, ENUM_CHECK_CODE]:
+        """Send a request, retrying as the retry policy says
+
+        Args:
+            request (dict): Request data
+            operation (str): Operation name, for the messages
+            reprice (Callable, optional): Function updating the request price before
+            each attempt. Defaults to None.
+
+        Returns:
+            Tuple[MqlTradeResult, ENUM_CHECK_CODE]: Last result, with the attempts
+            and latency, and how it was dealt with
+        """
+        start = time.perf_counter()
+        retry_count: int = 0
+
+        # Send request loop
+        while True:
+            if reprice is not None:
+                reprice(request)
+
+            # send a trading request, the invariant fields are validated once
+            prepared_request = self.templates.build(request)
+            order_send = mt5.order_send(prepared_request)
+            send_result = MqlTradeResult.parse_result(order_send, validate=False)
+
+            # Check the result
+            check_code = self.__check_return_code(send_result.retcode)
+
+            # OK - Exit the function
+            if check_code == ENUM_CHECK_CODE.CHECK_RETCODE_OK:
+                break
+            # Error - Print the error
+            elif check_code == ENUM_CHECK_CODE.CHECK_RETCODE_ERROR:
+                print(
+                    f"{operation}: Error {send_result.retcode} - {send_result.comment}"
+                )
+                break
+
+            # Retry - Send the request again, unless the retries are over
+            delay = self.retry_policy.get_delay(
+                send_result.retcode, retry_count, time.perf_counter() - start
+            )
+            if delay is None:
+                print(
+                    f"Max retries exceeded: Error {send_result.retcode} - {send_result.comment}"
+                )
+                break
+
+            print("Server error detected, retrying...")
+            time.sleep(delay)
+            retry_count += 1
+
+        send_result.attempts = retry_count + 1
+        send_result.latency = time.perf_counter() - start
+        self.__results.result = send_result
+
+        return send_result, check_code
+
     # Open orders ---------------------------------------------------------------------
     @decorator_validate_mt5_connection
     @decorator_backtest_open_position
@@ -182,12 +330,7 @@ class Trade:
             "magic": self.magic_number,
         }
 
-        # Loop variables
-        retry_count: int = 0
-        check_code: ENUM_CHECK_CODE = ENUM_CHECK_CODE.CHECK_RETCODE_ERROR
-
-        # Send request loop
-        while retry_count <= MAX_RETRIES:
+        def reprice(request: dict) -> None:
             # Get symbol data
             symbol_data: MqlSymbolInfo = Rates.get_symbol_data(symbol=symbol)
 
@@ -197,34 +340,10 @@ class Trade:
             elif order_type == ENUM_ORDER_TYPE_MARKET.ORDER_TYPE_SELL:
                 request.update({"price": symbol_data.bid})
 
-            # send a trading request
-            prepared_request = MqlTradeRequest(**request).prepare()
-            order_send = mt5.order_send(prepared_request)
-            send_result = MqlTradeResult.parse_result(order_send)
-
-            # Check the result
-            check_code = self.__check_return_code(send_result.retcode)
-
-            # OK - Exit the function
-            if check_code == ENUM_CHECK_CODE.CHECK_RETCODE_OK:
-                break
-            # Error - Print the error
-            elif check_code == ENUM_CHECK_CODE.CHECK_RETCODE_ERROR:
-                print(
-                    f"Open market order: Error {send_result.retcode} - {send_result.comment}"
-                )
-                break
-            # Retry - Send the request again
-            else:
-                print("Server error detected, retrying...")
-                time.sleep(RETRY_DELAY)
-                retry_count += 1
-
-        # Max retries reached
-        if retry_count >= MAX_RETRIES:
-            print(
-                f"Max retries exceeded: Error {send_result.retcode} - {send_result.comment}"
-            )
+        # Send the request, with retries
+        send_result, check_code = self.__send_request(
+            request, operation="Open market order", reprice=reprice
+        )
 
         # Order result
         print(
@@ -294,40 +413,10 @@ class Trade:
         else:
             request.update({"type_time": ENUM_ORDER_TYPE_TIME.ORDER_TIME_GTC})
 
-        # Loop variables
-        retry_count: int = 0
-        check_code: ENUM_CHECK_CODE = ENUM_CHECK_CODE.CHECK_RETCODE_ERROR
-
-        # Send request loop
-        while retry_count <= MAX_RETRIES:
-            # send a trading request
-            prepared_request = MqlTradeRequest(**request).prepare()
-            order_send = mt5.order_send(prepared_request)
-            send_result = MqlTradeResult.parse_result(order_send)
-
-            # Check the result
-            check_code = self.__check_return_code(send_result.retcode)
-
-            # OK - Exit the function
-            if check_code == ENUM_CHECK_CODE.CHECK_RETCODE_OK:
-                break
-            # Error - Print the error
-            elif check_code == ENUM_CHECK_CODE.CHECK_RETCODE_ERROR:
-                print(
-                    f"Open pending order: Error {send_result.retcode} - {send_result.comment}"
-                )
-                break
-            # Retry - Send the request again
-            else:
-                print("Server error detected, retrying...")
-                time.sleep(RETRY_DELAY)
-                retry_count += 1
-
-        # Max retries reached
-        if retry_count >= MAX_RETRIES:
-            print(
-                f"Max retries exceeded: Error {send_result.retcode} - {send_result.comment}"
-            )
+        # Send the request, with retries
+        send_result, check_code = self.__send_request(
+            request, operation="Open pending order"
+        )
 
         # Order result
         print(
@@ -398,40 +487,10 @@ class Trade:
             "magic": self.magic_number,
         }
 
-        # Loop variables
-        retry_count: int = 0
-        check_code: ENUM_CHECK_CODE = ENUM_CHECK_CODE.CHECK_RETCODE_ERROR
-
-        # Send request loop
-        while retry_count <= MAX_RETRIES:
-            # send a trading request
-            prepared_request = MqlTradeRequest(**request).prepare()
-            order_send = mt5.order_send(prepared_request)
-            send_result = MqlTradeResult.parse_result(order_send)
-
-            # Check the result
-            check_code = self.__check_return_code(send_result.retcode)
-
-            # OK - Exit the function
-            if check_code == ENUM_CHECK_CODE.CHECK_RETCODE_OK:
-                break
-            # Error - Print the error
-            elif check_code == ENUM_CHECK_CODE.CHECK_RETCODE_ERROR:
-                print(
-                    f"Modify position: Error {send_result.retcode} - {send_result.comment}"
-                )
-                break
-            # Retry - Send the request again
-            else:
-                print("Server error detected, retrying...")
-                time.sleep(RETRY_DELAY)
-                retry_count += 1
-
-        # Max retries reached
-        if retry_count >= MAX_RETRIES:
-            print(
-                f"Max retries exceeded: Error {send_result.retcode} - {send_result.comment}"
-            )
+        # Send the request, with retries
+        send_result, check_code = self.__send_request(
+            request, operation="Modify position"
+        )
 
         # Order result
         print(
@@ -483,40 +542,10 @@ class Trade:
         else:
             request.update({"type_time": ENUM_ORDER_TYPE_TIME.ORDER_TIME_GTC})
 
-        # Loop variables
-        retry_count: int = 0
-        check_code: ENUM_CHECK_CODE = ENUM_CHECK_CODE.CHECK_RETCODE_ERROR
-
-        # Send request loop
-        while retry_count <= MAX_RETRIES:
-            # send a trading request
-            prepared_request = MqlTradeRequest(**request).prepare()
-            order_send = mt5.order_send(prepared_request)
-            send_result = MqlTradeResult.parse_result(order_send)
-
-            # Check the result
-            check_code = self.__check_return_code(send_result.retcode)
-
-            # OK - Exit the function
-            if check_code == ENUM_CHECK_CODE.CHECK_RETCODE_OK:
-                break
-            # Error - Print the error
-            elif check_code == ENUM_CHECK_CODE.CHECK_RETCODE_ERROR:
-                print(
-                    f"Modify pending order: Error {send_result.retcode} - {send_result.comment}"
-                )
-                break
-            # Retry - Send the request again
-            else:
-                print("Server error detected, retrying...")
-                time.sleep(RETRY_DELAY)
-                retry_count += 1
-
-        # Max retries reached
-        if retry_count >= MAX_RETRIES:
-            print(
-                f"Max retries exceeded: Error {send_result.retcode} - {send_result.comment}"
-            )
+        # Send the request, with retries
+        send_result, check_code = self.__send_request(
+            request, operation="Modify pending order"
+        )
 
         # Order result
         print(
@@ -582,40 +611,20 @@ class Trade:
             "type_filling": ENUM_ORDER_TYPE_FILLING.ORDER_FILLING_RETURN,
         }
 
-        # Loop variables
-        retry_count: int = 0
-        check_code: ENUM_CHECK_CODE = ENUM_CHECK_CODE.CHECK_RETCODE_ERROR
-
-        # Send request loop
-        while retry_count <= MAX_RETRIES:
-            # send a trading request
-            prepared_request = MqlTradeRequest(**request).prepare()
-            order_send = mt5.order_send(prepared_request)
-            send_result = MqlTradeResult.parse_result(order_send)
-
-            # Check the result
-            check_code = self.__check_return_code(send_result.retcode)
-
-            # OK - Exit the function
-            if check_code == ENUM_CHECK_CODE.CHECK_RETCODE_OK:
-                break
-            # Error - Print the error
-            elif check_code == ENUM_CHECK_CODE.CHECK_RETCODE_ERROR:
-                print(
-                    f"Close position: Error {send_result.retcode} - {send_result.comment}"
-                )
-                break
-            # Retry - Send the request again
-            else:
-                print("Server error detected, retrying...")
-                time.sleep(RETRY_DELAY)
-                retry_count += 1
-
-        # Max retries reached
-        if retry_count >= MAX_RETRIES:
-            print(
-                f"Max retries exceeded: Error {send_result.retcode} - {send_result.comment}"
+        def reprice(request: dict) -> None:
+            # Close at the current oposite price
+            symbol_data: MqlSymbolInfo = Rates.get_symbol_data(
+                symbol=position_selected.symbol
             )
+            if order_type == ENUM_ORDER_TYPE.ORDER_TYPE_SELL:
+                request.update({"price": symbol_data.bid})
+            else:
+                request.update({"price": symbol_data.ask})
+
+        # Send the request, with retries
+        send_result, check_code = self.__send_request(
+            request, operation="Close position", reprice=reprice
+        )
 
         # Order result
         print(
@@ -631,8 +640,10 @@ class Trade:
         return check_code == ENUM_CHECK_CODE.CHECK_RETCODE_OK
 
     def close_all_positions(self, comment=""):
-        for position in self.account_data.positions:
-            self.close_position(position_ticket=position.ticket, comment=comment)
+        # One refresh for all the positions, the closed ones leave the list
+        with self.batch():
+            for position in list(self.account_data.positions):
+                self.close_position(position_ticket=position.ticket, comment=comment)
 
     # Market trade open shortcuts -----------------------------------------------------
     def buy(
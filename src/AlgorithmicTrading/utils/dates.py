@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
 
 
 def get_timestamp_ms(date: datetime) -> int:
@@ -18,3 +18,64 @@ def get_timestamp_ms(date: datetime) -> int:
     microseconds = microseconds.ljust(6, "0")
 
     return int(seconds + microseconds)
+
+
+def get_utc_date(value: datetime) -> date:
+    """Get the UTC day of a datetime, as the dataset partitions
+
+    Args:
+        value (datetime): Datetime, naive datetimes are UTC
+
+    Returns:
+        date: UTC date
+    """
+    if value.tzinfo is None:
+        return value.date()
+
+    return value.astimezone(timezone.utc).date()
+
+
+def get_broker_timestamp(time_offset: int = 0) -> int:
+    """Get the current timestamp in the broker time zone
+
+    The terminal candles and ticks timestamps are in the broker time zone, not in
+    UTC, so they are compared to the UTC clock shifted by the broker offset.
+
+    Args:
+        time_offset (int, optional): Broker time zone offset from UTC in seconds,
+        e.g. 7_200 for UTC+2. Defaults to 0.
+
+    Returns:
+        int: Broker timestamp in seconds
+    """
+    return int(datetime.now(timezone.utc).timestamp()) + time_offset
+
+
+def get_timeframe_seconds(timeframe) -> int:
+    """Get the length of a timeframe in seconds
+
+    The MetaTrader timeframes store the unit in the two highest bits of the value:
+    minutes, hours (0x4000), weeks (0x8000) or months (0xC000).
+
+    Args:
+        timeframe (ENUM_TIMEFRAME | int | timedelta): Timeframe
+
+    Raises:
+        ValueError: The timeframe has no fixed length (months)
+
+    Returns:
+        int: Timeframe length in seconds
+    """
+    if isinstance(timeframe, timedelta):
+        return int(timeframe.total_seconds())
+
+    unit, value = int(timeframe) & 0xC000, int(timeframe) & 0x3FFF
+
+    if unit == 0x0000:
+        return value * 60
+    if unit == 0x4000:
+        return value * 3_600
+    if unit == 0x8000:
+        return value * 604_800
+
+    raise ValueError("[ERROR]: The monthly timeframes have no fixed length")
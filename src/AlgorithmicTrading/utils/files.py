@@ -1,5 +1,25 @@
+from AlgorithmicTrading.models.metatrader import ENUM_TIMEFRAME
+from AlgorithmicTrading.utils.dates import get_utc_date
 import os
+import json
+import uuid
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Set, Union
+
+# Dataset partition columns, in the directories order
+DATASET_PARTITIONING = ds.partitioning(
+    pa.schema(
+        [
+            ("symbol", pa.string()),
+            ("timeframe", pa.string()),
+            ("date", pa.date32()),
+        ]
+    ),
+    flavor="hive",
+)
 
 
 def write_file(df: pd.DataFrame, file_name: str, compression: str = ""):
@@ -21,6 +41,9 @@ def write_file(df: pd.DataFrame, file_name: str, compression: str = ""):
         compression = "zstd" if compression == "" else compression
         df.to_feather(file_name, compression=compression)
 
+    elif file_name_extension == ".arrow":
+        write_memory_map(df, file_name)
+
     elif file_name_extension == ".h5":
         compression = "blosc:lz4" if compression == "" else compression
         df.to_hdf(
@@ -47,9 +70,13 @@ def write_file(df: pd.DataFrame, file_name: str, compression: str = ""):
         )
 
 
-def read_file(file_name: str, compression: str=""):
+def read_file(file_name: str, compression: str="", chunksize: int = None, **kwargs):
     file_name_extension = os.path.splitext(file_name)[1]
 
+    # Streaming mode, the file is never fully loaded
+    if chunksize is not None:
+        return read_file_chunks(file_name, chunksize=chunksize, **kwargs)
+
     if file_name_extension == ".csv" or file_name_extension == ".zip":
         df = pd.read_csv(file_name, keep_default_na=False)
 
@@ -59,10 +86,15 @@ def read_file(file_name: str, compression: str=""):
     elif file_name_extension == ".feather":
         df = pd.read_feather(file_name)
 
+    elif file_name_extension == ".arrow":
+        df = read_memory_map(file_name)
+
     elif file_name_extension == ".h5":
         df = pd.read_hdf(file_name, key="data")
 
     elif file_name_extension == ".pkl":
+        # Same default compression as write_file
+        compression = "zip" if compression == "" else compression
         df = pd.read_pickle(
             file_name, compression=compression
         ).copy()  # copy added because of some trouble with categories not fully read by mem util on first pass
@@ -80,3 +112,417 @@ def read_file(file_name: str, compression: str=""):
         )
 
     return df
+
+
+def write_memory_map(df: pd.DataFrame, file_name: str) -> None:
+    """Write a frame as an uncompressed Arrow IPC file, to be memory mapped
+
+    Every column is written as a single contiguous buffer, so read_memory_map can
+    return views of the file instead of copies.
+
+    Args:
+        df (pd.DataFrame): Data frame
+        file_name (str): File name, .arrow
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False).combine_chunks()
+
+    with pa.OSFile(file_name, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def read_memory_map(file_name: str, columns: List[str] = None) -> pd.DataFrame:
+    """Open an Arrow IPC file written by write_memory_map without reading it
+
+    The numeric and datetime columns are zero copy views of the memory mapped file:
+    opening is instant, the pages are loaded on access and the processes opening
+    the same file share the operating system page cache. The views are read only.
+
+    Args:
+        file_name (str): File name, .arrow
+        columns (List[str], optional): Columns opened. Defaults to all columns.
+
+    Returns:
+        pd.DataFrame: Data frame backed by the file
+    """
+    source = pa.memory_map(file_name, "r")
+    table = pa.ipc.open_file(source).read_all()
+
+    if columns is not None:
+        table = table.select(columns)
+
+    # One block per column, so the columns are not copied into a 2D block
+    return table.to_pandas(split_blocks=True, self_destruct=False)
+
+
+def compact_dtypes(
+    df: pd.DataFrame, dtype: Dict[str, str] = None, downcast: bool = True
+) -> pd.DataFrame:
+    """Cast a frame to compact dtypes, in place
+
+    The columns in dtype are cast to the given dtype, the other integer columns are
+    downcast to the smallest integer dtype holding their values. Float columns are
+    kept, so prices are never rounded.
+
+    Args:
+        df (pd.DataFrame): Data frame
+        dtype (Dict[str, str], optional): Column dtypes. Defaults to None.
+        downcast (bool, optional): Downcast the integer columns not in dtype. The
+        downcast dtype depends on the values, disable it for frames sharing one
+        schema, e.g. chunks. Defaults to True.
+
+    Returns:
+        pd.DataFrame: Same data frame
+    """
+    dtype = dtype or {}
+
+    for column in df.columns:
+        if column in dtype:
+            df[column] = df[column].astype(dtype[column], copy=False)
+        elif downcast and pd.api.types.is_integer_dtype(df[column].dtype):
+            df[column] = pd.to_numeric(
+                df[column],
+                downcast="unsigned" if (df[column] >= 0).all() else "integer",
+            )
+
+    return df
+
+
+def _read_json_records(file_name: str, chunksize: int, block_size: int = 1 << 20):
+    """Read a JSON array of records, as written by write_file, in chunks
+
+    Args:
+        file_name (str): File name
+        chunksize (int): Records per chunk
+        block_size (int, optional): Characters read at once. Defaults to 1 MB.
+
+    Yields:
+        List[dict]: Records chunk
+    """
+    decoder = json.JSONDecoder()
+    records = []
+    buffer = ""
+    position = 0
+
+    with open(file_name, "r", encoding="utf-8") as file:
+        while True:
+            block = file.read(block_size)
+            buffer = buffer[position:] + block
+            position = 0
+
+            while True:
+                # Skip the array delimiters
+                while position < len(buffer) and buffer[position] in "[, \t\r\n]":
+                    position += 1
+
+                try:
+                    record, position_end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    # Incomplete record, read the next block
+                    if not block:
+                        if buffer[position:].strip():
+                            raise Exception(
+                                "[ERROR]: Error in read_file_chunks()! Invalid JSON records file:",
+                                file_name,
+                            )
+                    break
+
+                records.append(record)
+                position = position_end
+
+                if len(records) == chunksize:
+                    yield records
+                    records = []
+
+            if not block:
+                break
+
+    if records:
+        yield records
+
+
+def read_file_chunks(
+    file_name: str,
+    chunksize: int = 100_000,
+    dtype: Dict[str, str] = None,
+    datetime_columns: List[str] = None,
+    datetime_unit: str = None,
+    arrow: bool = False,
+) -> Iterator[Union[pd.DataFrame, pa.RecordBatch]]:
+    """Read a CSV, zip or JSON file in chunks
+
+    The memory used is bounded by the chunk size instead of the file size, the
+    chunks can be written with write_dataset or used one by one in a backtest.
+    Every chunk has the same dtypes: the integer columns are only made compact
+    through dtype, never downcast per chunk, and the Arrow schema is the one of the
+    first batch.
+
+    Args:
+        file_name (str): File name, .csv, .zip or .json
+        chunksize (int, optional): Rows per chunk. Defaults to 100_000.
+        dtype (Dict[str, str], optional): Columns dtypes, the other columns keep the
+        parser dtypes. Defaults to None.
+        datetime_columns (List[str], optional): Columns parsed to UTC datetimes.
+        Defaults to None.
+        datetime_unit (str, optional): Unit of numeric datetimes, e.g. "s" or "ms".
+        Defaults to text datetimes.
+        arrow (bool, optional): Yield Arrow record batches. Defaults to False.
+
+    Raises:
+        Exception: The file extension is not supported
+
+    Yields:
+        Iterator[pd.DataFrame | pa.RecordBatch]: Data chunks
+    """
+    file_name_extension = os.path.splitext(file_name)[1]
+    datetime_columns = datetime_columns or []
+    # Datetimes are parsed after the dtypes cast
+    parser_dtype = {
+        column: column_dtype
+        for column, column_dtype in (dtype or {}).items()
+        if column not in datetime_columns
+    }
+
+    if file_name_extension == ".csv" or file_name_extension == ".zip":
+        chunks = pd.read_csv(
+            file_name,
+            keep_default_na=False,
+            dtype=parser_dtype or None,
+            chunksize=chunksize,
+        )
+
+    elif file_name_extension == ".json":
+        chunks = (
+            pd.DataFrame.from_records(records)
+            for records in _read_json_records(file_name, chunksize)
+        )
+
+    else:
+        raise Exception(
+            "[ERROR]: Error in read_file_chunks()! The file extension does not support chunks:",
+            file_name_extension,
+        )
+
+    schema = None
+
+    for chunk in chunks:
+        chunk = compact_dtypes(chunk, parser_dtype, downcast=False)
+
+        for column in datetime_columns:
+            chunk[column] = pd.to_datetime(chunk[column], unit=datetime_unit, utc=True)
+
+        if not arrow:
+            yield chunk
+            continue
+
+        # Schema decided once, the next batches are cast to it
+        batch = pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=False)
+        schema = batch.schema
+
+        yield batch
+
+
+def get_timeframe_name(timeframe) -> str:
+    """Get the dataset name of a timeframe
+
+    Args:
+        timeframe (ENUM_TIMEFRAME | int | timedelta | str): Timeframe, the
+        MetaTrader 5 integer constants are named as the enum. "ticks" for ticks data
+
+    Returns:
+        str: Timeframe name, e.g. "M5", or "S90" for a 90 seconds timedelta
+    """
+    if isinstance(timeframe, timedelta):
+        return f"S{int(timeframe.total_seconds())}"
+
+    if isinstance(timeframe, str):
+        return timeframe.replace("TIMEFRAME_", "")
+
+    return ENUM_TIMEFRAME(int(timeframe)).name.replace("TIMEFRAME_", "")
+
+
+def write_dataset(
+    df: pd.DataFrame,
+    root: str,
+    symbol: str,
+    timeframe,
+    time_column: str = "time",
+    compression: str = "",
+    row_group_size: int = 65_536,
+    basename: str = None,
+) -> None:
+    """Append candles or ticks to a partitioned Parquet dataset
+
+    The data is partitioned hive style by symbol, timeframe and date
+    ("root/symbol=EURUSD/timeframe=M5/date=2023-01-02/part-....parquet") and sorted
+    by time, so each row group covers a short time range. Each call writes new
+    files only, the existing files are never read or rewritten.
+
+    Args:
+        df (pd.DataFrame): Candles or ticks with a UTC datetime column
+        root (str): Dataset directory
+        symbol (str): Data symbol
+        timeframe (ENUM_TIMEFRAME | str): Data timeframe, "ticks" for ticks data
+        time_column (str, optional): Datetime column. Defaults to "time".
+        compression (str, optional): Parquet compression. Defaults to "zstd".
+        row_group_size (int, optional): Rows per row group. Defaults to 65_536.
+        basename (str, optional): Files name, writing the same name again replaces
+        the files instead of appending. Defaults to a unique name.
+    """
+    basename = uuid.uuid4().hex if basename is None else basename
+    compression = "zstd" if compression == "" else compression
+
+    # Datetime index, as returned by Rates.get_last_n_candles
+    if time_column not in df.columns and df.index.name == time_column:
+        df = df.reset_index()
+
+    df = df.sort_values(time_column, kind="stable")
+
+    # Partition columns
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = (
+        table.append_column(
+            "symbol", pa.array([symbol] * len(table), type=pa.string())
+        )
+        .append_column(
+            "timeframe",
+            pa.array([get_timeframe_name(timeframe)] * len(table), type=pa.string()),
+        )
+        .append_column(
+            "date", pa.array(df[time_column].dt.date.to_numpy(), type=pa.date32())
+        )
+    )
+
+    ds.write_dataset(
+        table,
+        root,
+        format="parquet",
+        partitioning=DATASET_PARTITIONING,
+        # Unique names, so appends never overwrite the existing files
+        basename_template=f"part-{basename}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        file_options=ds.ParquetFileFormat().make_write_options(
+            compression=compression
+        ),
+        min_rows_per_group=min(row_group_size, max(len(table), 1)),
+        max_rows_per_group=row_group_size,
+    )
+
+
+def get_dataset_files(root: str, symbol: str, timeframe) -> Dict[date, List[str]]:
+    """Get the files stored in a dataset by date, from the partitions names only
+
+    Args:
+        root (str): Dataset directory
+        symbol (str): Data symbol
+        timeframe (ENUM_TIMEFRAME | str): Data timeframe, "ticks" for ticks data
+
+    Returns:
+        Dict[date, List[str]]: Files paths, by date
+    """
+    files = {}
+
+    if not os.path.isdir(root):
+        return files
+
+    dataset = ds.dataset(root, format="parquet", partitioning=DATASET_PARTITIONING)
+    fragments = dataset.get_fragments(
+        filter=(ds.field("symbol") == symbol)
+        & (ds.field("timeframe") == get_timeframe_name(timeframe))
+    )
+
+    for fragment in fragments:
+        day = ds.get_partition_keys(fragment.partition_expression)["date"]
+        files.setdefault(day, []).append(fragment.path)
+
+    return files
+
+
+def get_dataset_dates(root: str, symbol: str, timeframe) -> Set[date]:
+    """Get the dates stored in a dataset, from the partitions names only
+
+    Args:
+        root (str): Dataset directory
+        symbol (str): Data symbol
+        timeframe (ENUM_TIMEFRAME | str): Data timeframe, "ticks" for ticks data
+
+    Returns:
+        Set[date]: Stored dates
+    """
+    return set(get_dataset_files(root, symbol, timeframe))
+
+
+def read_dataset(
+    root: str,
+    symbol: str = None,
+    timeframe=None,
+    date_from: datetime = None,
+    date_to: datetime = None,
+    columns: List[str] = None,
+    time_column: str = "time",
+) -> pd.DataFrame:
+    """Read a time range of a partitioned Parquet dataset
+
+    The symbol, timeframe and date filters skip whole partitions, the time filter
+    is checked against the row groups statistics, so only the files metadata and
+    the row groups inside the range are read.
+
+    Args:
+        root (str): Dataset directory
+        symbol (str, optional): Data symbol. Defaults to all symbols.
+        timeframe (ENUM_TIMEFRAME | str, optional): Data timeframe. Defaults to all timeframes.
+        date_from (datetime, optional): From date, included. Defaults to None.
+        date_to (datetime, optional): To date, excluded. Defaults to None.
+        columns (List[str], optional): Columns read. Defaults to all columns.
+        time_column (str, optional): Datetime column. Defaults to "time".
+
+    Returns:
+        pd.DataFrame: Data sorted by time
+    """
+    dataset = ds.dataset(root, format="parquet", partitioning=DATASET_PARTITIONING)
+
+    # Partitions and row groups filter, the partitions are UTC days
+    filters = []
+    if symbol is not None:
+        filters.append(ds.field("symbol") == symbol)
+    if timeframe is not None:
+        filters.append(ds.field("timeframe") == get_timeframe_name(timeframe))
+
+    # Ticks and candles can share a root, so the read partitions keep their own
+    # schema instead of the one inferred from the first file of the root
+    if filters:
+        partition_filter = filters[0] if len(filters) == 1 else filters[0] & filters[1]
+        fragments = list(dataset.get_fragments(filter=partition_filter))
+        if fragments:
+            schema = pa.unify_schemas(
+                [fragments[0].physical_schema, DATASET_PARTITIONING.schema]
+            )
+            dataset = ds.FileSystemDataset(
+                fragments, schema, dataset.format, dataset.filesystem
+            )
+
+    time_type = dataset.schema.field(time_column).type
+    if date_from is not None:
+        day_from = pa.scalar(get_utc_date(date_from), pa.date32())
+        filters.append(ds.field("date") >= day_from)
+        filters.append(ds.field(time_column) >= pa.scalar(date_from, time_type))
+    if date_to is not None:
+        day_to = pa.scalar(get_utc_date(date_to), pa.date32())
+        filters.append(ds.field("date") <= day_to)
+        filters.append(ds.field(time_column) < pa.scalar(date_to, time_type))
+
+    expression = None
+    for dataset_filter in filters:
+        expression = dataset_filter if expression is None else expression & dataset_filter
+
+    # The time column is needed to sort the appended files
+    read_columns = columns
+    if columns is not None and time_column not in columns:
+        read_columns = list(columns) + [time_column]
+
+    table = dataset.to_table(columns=read_columns, filter=expression)
+    table = table.sort_by(time_column)
+
+    df = table.to_pandas()
+
+    return df if read_columns is columns else df[columns]
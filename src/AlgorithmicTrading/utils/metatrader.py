@@ -1,18 +1,77 @@
-import MetaTrader5 as mt5
+from AlgorithmicTrading.terminal import mt5, get_backend
 from typing import Callable
+import time
+
+# Seconds a successful terminal check is trusted without a supervisor
+CONNECTION_CHECK_INTERVAL = 1.0
+
+# Connection supervisor, its cached state replaces the terminal check
+_supervisor = None
+
+# Backend and monotonic time of the last successful terminal check
+_last_check = (None, 0.0)
+
+
+def get_connection_supervisor():
+    """Get the active connection supervisor
+
+    Returns:
+        ConnectionSupervisor: Active supervisor, None without supervision
+    """
+    return _supervisor
+
+
+def set_connection_supervisor(supervisor) -> None:
+    """Set the active connection supervisor
+
+    Args:
+        supervisor (ConnectionSupervisor): Supervisor, None to stop the supervision
+    """
+    global _supervisor
+
+    _supervisor = supervisor
+
+
+def reset_connection_check() -> None:
+    """Forget the last successful terminal check, e.g. after a shutdown"""
+    global _last_check
+
+    _last_check = (None, 0.0)
+
 
 def validate_connection_established() -> None:
     """Validate connection
 
-    Validate if the connection with the server is already established
+    Validate if the connection with the server is already established. With a
+    connection supervisor, its cached state is read and the terminal is not called.
+    Without it, the terminal is checked again once the last successful check is
+    older than CONNECTION_CHECK_INTERVAL.
 
     Raises:
         ConnectionError: Connection is not established
     """
-    # Check request success
-    if mt5.account_info is None:
+    supervisor = _supervisor
+
+    # Supervised connection, an attribute read while connected
+    if supervisor is not None:
+        if not supervisor.connected:
+            supervisor.wait_connected()
+        return
+
+    global _last_check
+
+    backend, checked_at = _last_check
+    now = time.monotonic()
+    if backend is get_backend() and now - checked_at < CONNECTION_CHECK_INTERVAL:
+        return
+
+    # Check request success, the terminal info is None before the initialization
+    if mt5.terminal_info() is None:
+        reset_connection_check()
         raise ConnectionError("[ERROR]: Connection is not established")
 
+    _last_check = (get_backend(), now)
+
 
 def decorator_validate_mt5_connection(server_function: Callable) -> Callable:
     """Validate MetaTrader Connection
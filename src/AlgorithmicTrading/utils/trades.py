@@ -7,6 +7,7 @@ from AlgorithmicTrading.models.metatrader import (
 from AlgorithmicTrading.rates import Rates
 from AlgorithmicTrading.utils.exceptions import PairNotAvailable
 import datetime
+import numpy as np
 import pandas as pd
 from typing import List
 from collections import Counter
@@ -161,6 +162,101 @@ def compute_profit(
     return profit
 
 
+def round_batch(values: np.ndarray, digits: int) -> np.ndarray:
+    """Round an array exactly like the builtin round()
+
+    np.round scales by 10**digits before rounding, so a value close to a half can
+    round to the other side. Those values are rounded again with round().
+
+    Args:
+        values (np.ndarray): Values
+        digits (int): Decimal digits
+
+    Returns:
+        np.ndarray: Rounded values
+    """
+    scaled = values * 10.0**digits
+    rounded = np.rint(scaled) / 10.0**digits
+
+    # Halves, values beyond the float precision and non finite values
+    fraction = np.abs(scaled - np.trunc(scaled))
+    ambiguous = (np.abs(fraction - 0.5) < 1e-6) | ~(np.abs(scaled) < 2**52)
+
+    for index in np.flatnonzero(ambiguous):
+        rounded[index] = round(float(values[index]), digits)
+
+    return rounded
+
+
+def compute_profit_batch(
+    price_open: np.ndarray,
+    price_close: np.ndarray,
+    price_volume: np.ndarray,
+    symbol_data: MqlSymbolInfo,
+    position_type: np.ndarray,
+    account_currency: str,
+    conversion_price: np.ndarray = None,
+) -> np.ndarray:
+    """Compute the profit of many positions
+
+    Same operations as compute_profit on arrays, so the profits are bit identical
+    to the scalar function ones.
+
+    Args:
+        price_open (np.ndarray): Positions price open
+        price_close (np.ndarray): Positions price close
+        price_volume (np.ndarray): Positions volume
+        symbol_data (MqlSymbolInfo): Information about Symbol traded
+        position_type (np.ndarray): Positions ENUM_POSITION_TYPE values
+        account_currency (str): Trade account currency base
+        conversion_price (np.ndarray, optional): Price dividing the tick value when
+        the account currency is the symbol base currency (compute_profit uses the
+        close tick bid), or rate multiplying it for the other currencies. Not used
+        when the account currency is only the profit currency. Defaults to None.
+
+    Raises:
+        ValueError: The conversion price is required for the account currency
+
+    Returns:
+        np.ndarray: Profits
+    """
+    price_open = np.asarray(price_open, dtype=np.float64)
+    price_close = np.asarray(price_close, dtype=np.float64)
+    price_volume = np.asarray(price_volume, dtype=np.float64)
+    position_type = np.asarray(position_type)
+
+    # OBS: This value is in target currency. Ex: USDJPY, will be in JPY currency
+    tick_value = (
+        symbol_data.trade_contract_size * price_volume * symbol_data.trade_tick_size
+    )
+
+    # Get how many ticks the positions worth, reversed for the SELL positions
+    ticks_count = (price_close - price_open) / symbol_data.trade_tick_size
+    ticks_count = np.where(
+        position_type != ENUM_POSITION_TYPE.POSITION_TYPE_BUY, -ticks_count, ticks_count
+    )
+
+    # Same branches order as compute_profit, the base currency is checked first
+    base_currency = symbol_data.currency_base == account_currency
+    cross_currency = not symbol_data.currency_profit == account_currency
+
+    if (base_currency or cross_currency) and conversion_price is None:
+        raise ValueError(
+            f"[ERROR]: The conversion price to {account_currency} is required"
+        )
+
+    # If account currency is the base of pair, convert the target value to base value
+    if base_currency:
+        tick_value = tick_value / np.asarray(conversion_price, dtype=np.float64)
+
+    # Cross currency
+    elif cross_currency:
+        tick_value = tick_value * np.asarray(conversion_price, dtype=np.float64)
+
+    # It is rounded because the computer operation can turn a 2.0 into 2.0000000006348273
+    return round_batch(ticks_count * tick_value, 5)
+
+
 def get_last_tick(symbol: str, financial_data: pd.DataFrame) -> MqlTick:
     """Get last tick of the last DataFrame candle
 
@@ -0,0 +1,92 @@
+from AlgorithmicTrading.terminal import ReplayBackend, set_backend
+from AlgorithmicTrading.terminal.structures import TICKS_DTYPE
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, Iterable
+import functools
+import numpy as np
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "live: run on the MetaTrader 5 terminal instead of the replay one"
+    )
+
+
+def count_requests(function_name: str):
+    """Replay backend function counting its calls in the backend requests"""
+
+    def request(self, *args, **kwargs):
+        self.requests[function_name] += 1
+        return getattr(ReplayBackend, function_name)(self, *args, **kwargs)
+
+    return request
+
+
+class CountingBackend(ReplayBackend):
+    """Replay backend counting the terminal requests, by function name"""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.requests = Counter()
+
+    account_info = count_requests("account_info")
+    positions_get = count_requests("positions_get")
+    copy_ticks_range = count_requests("copy_ticks_range")
+    copy_rates_range = count_requests("copy_rates_range")
+    copy_rates_from = count_requests("copy_rates_from")
+
+
+@pytest.fixture(autouse=True)
+def replay_backend(request):
+    """Run every test on an empty replay terminal, without the MetaTrader 5 terminal
+
+    The tests needing market data load it in their own backend with use_backend.
+    The tests marked as live keep the MetaTrader 5 terminal backend.
+    """
+    if request.node.get_closest_marker("live") is not None:
+        yield None
+        return
+
+    backend = ReplayBackend()
+    previous = set_backend(backend)
+
+    yield backend
+
+    set_backend(previous)
+
+
+@pytest.fixture
+def create_backend():
+    """Build replay terminals quoting 1.1 / 1.1001 over the last 100 seconds"""
+
+    def create(
+        backend_class: type = ReplayBackend,
+        symbols: Iterable[str] = ("EURUSD",),
+        ticks: np.ndarray = None,
+        rates: Dict[int, np.ndarray] = None,
+        **kwargs,
+    ) -> ReplayBackend:
+        if ticks is None:
+            now = int(datetime.now(timezone.utc).timestamp())
+            ticks = np.zeros(10, dtype=TICKS_DTYPE)
+            ticks["time"] = now - 100 + np.arange(10)
+            ticks["time_msc"] = ticks["time"] * 1_000
+            ticks["bid"] = 1.1
+            ticks["ask"] = 1.1001
+
+        kwargs.setdefault("balance", 1_000)
+        backend = backend_class(**kwargs)
+        for symbol in symbols:
+            backend.load_symbol(symbol, ticks=ticks, rates=rates, digits=5)
+
+        return backend
+
+    return create
+
+
+@pytest.fixture
+def create_counting_backend(create_backend):
+    """Build replay terminals counting their requests, as create_backend"""
+    return functools.partial(create_backend, CountingBackend)
@@ -0,0 +1,96 @@
+from AlgorithmicTrading.account import AccountLive
+from AlgorithmicTrading.models.metatrader import MqlAccountInfo
+from AlgorithmicTrading.terminal import ReplayBackend, mt5, use_backend
+from AlgorithmicTrading.terminal.structures import TradeDeal
+from datetime import datetime, timezone
+import threading
+
+
+class RecordingBackend(ReplayBackend):
+    """Replay backend recording the history requests"""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.history_requests = []
+
+    def history_deals_get(self, *args, **kwargs):
+        self.history_requests.append(args)
+        return super().history_deals_get(*args, **kwargs)
+
+
+class TestAccountLive:
+    """Assert the live account refresh"""
+
+    def test_incremental_history_deals(self, create_backend):
+        with use_backend(create_backend(RecordingBackend)) as backend:
+            account = AccountLive.login(login=2, server="Replay", password="")
+            assert len(account.history_deals) == 1
+
+            backend.order_send(
+                {
+                    "action": mt5.TRADE_ACTION_DEAL,
+                    "symbol": "EURUSD",
+                    "type": mt5.ORDER_TYPE_BUY,
+                    "volume": 0.1,
+                }
+            )
+            account = AccountLive.get_data()
+
+        assert len(account.history_deals) == 2
+        assert account.balance == 1_000
+        assert MqlAccountInfo.history_deals_sync.deals_profit == 1_000
+
+        # The second refresh starts one day before the last synced deal
+        first_request, second_request = backend.history_requests
+        assert first_request[0].year == 1970
+        assert second_request[0].year > 1970
+
+    def test_terminal_balance(self, create_backend):
+        with use_backend(create_backend(RecordingBackend)) as backend:
+            AccountLive.login(login=2, server="Replay", password="")
+
+            # A commission deal, left out of the synced deal types
+            now = int(datetime.now(timezone.utc).timestamp())
+            backend.deals.append(
+                TradeDeal(
+                    ticket=backend.new_ticket(),
+                    time=now,
+                    time_msc=now * 1_000,
+                    type=mt5.DEAL_TYPE_COMMISSION,
+                    entry=mt5.DEAL_ENTRY_IN,
+                    profit=-7.0,
+                )
+            )
+            backend.balance -= 7
+            account = AccountLive.get_data()
+
+        # The balance is the terminal one
+        assert account.balance == 993
+
+    def test_concurrent_sync(self, create_backend):
+        with use_backend(create_backend(RecordingBackend)) as backend:
+            AccountLive.login(login=2, server="Replay", password="")
+            for _ in range(20):
+                backend.order_send(
+                    {
+                        "action": mt5.TRADE_ACTION_DEAL,
+                        "symbol": "EURUSD",
+                        "type": mt5.ORDER_TYPE_BUY,
+                        "volume": 0.1,
+                    }
+                )
+            MqlAccountInfo.history_deals_sync.reset()
+
+            threads = [
+                threading.Thread(target=AccountLive.get_data) for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            deals = MqlAccountInfo.get_history_deals(2, "Replay")
+
+        # Each deal is synced once
+        assert len(deals) == 21
+        assert len({deal.ticket for deal in deals}) == 21
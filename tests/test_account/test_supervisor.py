@@ -0,0 +1,102 @@
+from AlgorithmicTrading.account import AccountLive, ConnectionSupervisor
+from AlgorithmicTrading.rates import Rates
+from AlgorithmicTrading.terminal import ReplayBackend, use_backend
+from AlgorithmicTrading.utils.metatrader import validate_connection_established
+import pytest
+import time
+
+
+class FlakyBackend(ReplayBackend):
+    """Replay backend whose logins fail while the server is down"""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.server_down = False
+        self.account_down = False
+        self.terminal_checks = 0
+
+    def terminal_info(self):
+        self.terminal_checks += 1
+        return super().terminal_info()
+
+    def initialize(self, *args, **kwargs) -> bool:
+        if self.server_down:
+            return False
+
+        return super().initialize(*args, **kwargs)
+
+    def account_info(self):
+        # None while the terminal reconnects, parse_account fails
+        if self.account_down:
+            return None
+
+        return super().account_info()
+
+
+def wait_until(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+class TestConnectionSupervisor:
+    """Assert the connection supervision"""
+
+    def test_reconnect(self, create_backend):
+        supervisor = ConnectionSupervisor(
+            login=2, server="Replay", password="", heartbeat=0.01, backoff=0.01
+        )
+
+        with use_backend(create_backend(FlakyBackend)) as backend, supervisor:
+            supervisor.wait_connected(timeout=2)
+            assert Rates.get_symbols_names() == ["EURUSD"]
+            assert supervisor.account_data.login == 2
+
+            # The terminal loses the connection and the logins fail
+            backend.server_down = True
+            backend.shutdown()
+            wait_until(lambda: not supervisor.connected)
+
+            # The callers fail fast during the outage
+            with pytest.raises(ConnectionError):
+                Rates.get_symbols_names()
+
+            # Logged in again once the server is back
+            backend.server_down = False
+            supervisor.wait_connected(timeout=2)
+            assert Rates.get_symbols_names() == ["EURUSD"]
+            assert supervisor.reconnections == 1
+
+    def test_login_errors(self, create_backend):
+        supervisor = ConnectionSupervisor(
+            login=2, server="Replay", password="", heartbeat=0.01, backoff=0.01
+        )
+        backend = create_backend(FlakyBackend)
+        backend.account_down = True
+
+        with use_backend(backend), supervisor:
+            # The parse error is kept and the login is retried
+            wait_until(lambda: supervisor.last_error is not None)
+            assert not isinstance(supervisor.last_error, ConnectionError)
+            assert supervisor.thread.is_alive()
+
+            backend.account_down = False
+            supervisor.wait_connected(timeout=2)
+            assert supervisor.account_data.login == 2
+
+    def test_unsupervised_check(self, create_backend):
+        with use_backend(create_backend(FlakyBackend)) as backend:
+            # The terminal is checked once by the login
+            AccountLive.login(login=2, server="Replay", password="")
+            assert backend.terminal_checks == 1
+
+            # A successful check is trusted for a while
+            for _ in range(100):
+                validate_connection_established()
+            assert backend.terminal_checks == 1
+
+            # The logout forgets it, the terminal is checked again
+            AccountLive.logout()
+            validate_connection_established()
+            assert backend.terminal_checks == 2
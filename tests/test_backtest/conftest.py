@@ -0,0 +1,60 @@
+from AlgorithmicTrading.models.metatrader import ENUM_ACCOUNT_MARGIN_MODE, ENUM_TIMEFRAME
+from AlgorithmicTrading.backtest.environment.environment import TradingEnv
+from AlgorithmicTrading.rates.rates import Rates
+from AlgorithmicTrading.rates.resample import resample_ticks
+from AlgorithmicTrading.terminal import ReplayBackend, mt5
+from AlgorithmicTrading.terminal.structures import TICKS_DTYPE
+from datetime import datetime, timezone
+import numpy as np
+import pytest
+
+# 2022-01-03 00:00:00 UTC, a monday
+START = 1641168000
+
+
+@pytest.fixture
+def create_env(replay_backend: ReplayBackend):
+    """Build trading environments over 5 days of synthetic EURUSD M15 candles"""
+    # One tick per minute, the price waves around 1.13
+    n_ticks = 5 * 24 * 60
+    ticks = np.zeros(n_ticks, dtype=TICKS_DTYPE)
+    ticks["time"] = START + np.arange(n_ticks) * 60
+    ticks["time_msc"] = ticks["time"] * 1_000
+    ticks["bid"] = np.round(1.13 + np.sin(np.arange(n_ticks) / 90) * 0.002, 5)
+    ticks["ask"] = np.round(ticks["bid"] + 0.00008, 5)
+    ticks["flags"] = mt5.TICK_FLAG_BID | mt5.TICK_FLAG_ASK
+
+    rates = resample_ticks(ticks, ENUM_TIMEFRAME.TIMEFRAME_M15, point=0.00001)
+    replay_backend.load_symbol(
+        "EURUSD", ticks=ticks, rates={mt5.TIMEFRAME_M15: rates}, digits=5
+    )
+
+    # Set a fixed rates interval
+    test_rates = TradingEnv.set_col_names(
+        Rates.get_candles_range(
+            "EURUSD",
+            date_from=datetime(2022, 1, 3, tzinfo=timezone.utc),
+            date_to=datetime(2022, 1, 7, tzinfo=timezone.utc),
+            timeframe=ENUM_TIMEFRAME.TIMEFRAME_M15,
+        ).reset_index(),
+        adj_close_col_name="close",
+        close_col_name="close",
+        datetime_col_name="time",
+        high_col_name="high",
+        low_col_name="low",
+        open_col_name="open",
+        volume_col_name="tick_volume",
+    )
+
+    def create(**kwargs) -> TradingEnv:
+        kwargs.setdefault("initial_balance", 100_000)
+        kwargs.setdefault(
+            "margin_mode", ENUM_ACCOUNT_MARGIN_MODE.ACCOUNT_MARGIN_MODE_RETAIL_NETTING
+        )
+
+        env = TradingEnv(df=test_rates, **kwargs)
+        env.reset(seed=7)
+
+        return env
+
+    return create
@@ -0,0 +1,67 @@
+from AlgorithmicTrading.backtest.environment.environment import TradingEnv
+from AlgorithmicTrading.backtest.environment.snapshot import EnvSnapshot
+import pytest
+
+
+@pytest.fixture
+def env(create_env) -> TradingEnv:
+    return create_env(allow_multiple_positions=True)
+
+
+class TestTradingEnvSnapshot:
+    def test_restore(self, env: TradingEnv):
+        # Open a position and take a snapshot
+        env.step(1, trade_volumes=0.1)
+        snapshot = env.snapshot()
+        deals_count = len(env.account.history_deals)
+        position_profit = env.account.positions[-1].profit
+        random_value = env.np_random.random()
+
+        # Move the episode forward
+        env.step(1, trade_volumes=0.1)
+        env.step(0)
+
+        # Restore the snapshot
+        env.restore(snapshot)
+
+        assert env.current_step == snapshot.current_step
+        assert len(env.account.history_deals) == deals_count
+        assert env.account.positions[-1].profit == position_profit
+        assert env.account.positions[-1].volume == 0.1
+        assert env.trade.account_data is env.account
+
+        # Random generator is restored too
+        assert env.np_random.random() == random_value
+
+    def test_fork(self, env: TradingEnv):
+        # Single position, the hold action closes it
+        env.allow_multiple_positions = False
+        env.step(2, trade_volumes=0.1)
+        # Stands for the render window of a human render
+        env.visualization = object()
+
+        # Branches evolve independently
+        branch = env.fork()
+        branch.step(0)
+
+        assert not len(branch.account.positions)
+        assert len(env.account.positions) == 1
+        assert branch.df is env.df
+        assert branch.current_step == env.current_step + 1
+
+        # The branch renders in its own window, created on its first render
+        assert branch.visualization is None
+        assert branch.action_space is not env.action_space
+
+    def test_serialization(self, env: TradingEnv):
+        env.step(1, trade_volumes=0.1)
+
+        snapshot = env.snapshot()
+        loaded = EnvSnapshot.from_bytes(snapshot.to_bytes())
+
+        env.step(0)
+        env.restore(loaded)
+
+        assert env.current_step == snapshot.current_step
+        assert env.account.positions[-1].volume == 0.1
+        assert len(env.account.history_deals) == snapshot.history_deals_count
@@ -0,0 +1,122 @@
+from AlgorithmicTrading.backtest.ledger import DealLedger, DealLogWriter
+from AlgorithmicTrading.models.metatrader import (
+    ENUM_DEAL_ENTRY,
+    ENUM_DEAL_REASON,
+    ENUM_DEAL_TYPE,
+    MqlTradeDeal,
+)
+from datetime import datetime, timedelta, timezone
+
+
+def create_deals(n_deals: int, first_ticket: int = 1) -> list:
+    start = datetime(2023, 1, 2, tzinfo=timezone.utc)
+
+    return [
+        MqlTradeDeal(
+            ticket=ticket,
+            order=ticket,
+            time=start + timedelta(minutes=ticket),
+            time_msc=start + timedelta(minutes=ticket),
+            type=ENUM_DEAL_TYPE.DEAL_TYPE_BUY,
+            entry=ENUM_DEAL_ENTRY.DEAL_ENTRY_IN,
+            position_id=ticket,
+            reason=ENUM_DEAL_REASON.DEAL_REASON_EXPERT,
+            volume=0.1,
+            price=1.1,
+            commission=0,
+            swap=0,
+            profit=ticket,
+            fee=0,
+            symbol="EURUSD",
+        )
+        for ticket in range(first_ticket, first_ticket + n_deals)
+    ]
+
+
+class TestDealLedger:
+    """Assert the deals spill to the Arrow IPC deal log"""
+
+    def test_spill(self, tmp_path):
+        file_name = str(tmp_path / "deals.arrows")
+        ledger = DealLedger(DealLogWriter(file_name), max_in_memory=3, batch_size=2)
+
+        for deal in create_deals(10):
+            ledger.append(deal)
+
+        # Batches of 2 deals written once 5 deals are in memory
+        assert ledger.spilled_count == 6
+        assert [deal.ticket for deal in ledger] == [7, 8, 9, 10]
+        assert ledger.total_count == 10
+
+        # Complete batches are readable while the log is open
+        assert DealLogWriter.read(file_name)["ticket"].tolist() == list(range(1, 7))
+
+        ledger.close()
+
+    def test_flush(self, tmp_path):
+        file_name = str(tmp_path / "deals.arrows")
+        ledger = DealLedger(DealLogWriter(file_name), max_in_memory=3, batch_size=2)
+
+        # Flushed deals stay in memory and are not written again on spill
+        for deal in create_deals(3):
+            ledger.append(deal)
+        ledger.flush()
+        assert len(ledger) == 3
+
+        for deal in create_deals(4, first_ticket=4):
+            ledger.append(deal)
+
+        deals = ledger.to_frame()
+        assert deals["ticket"].tolist() == list(range(1, 8))
+        assert deals["profit"].tolist() == list(range(1, 8))
+
+        ledger.close()
+        assert ledger.writer.sink.closed
+
+    def test_read_back(self, tmp_path):
+        file_name = str(tmp_path / "deals.arrows")
+        deals = create_deals(5)
+
+        with DealLogWriter(file_name) as writer:
+            writer.write(deals[:2])
+            writer.write([])
+            writer.write(deals[2:])
+
+        frame = DealLogWriter.read(file_name)
+
+        assert writer.deals_written == 5
+        assert frame["ticket"].tolist() == [deal.ticket for deal in deals]
+        assert frame["symbol"].unique().tolist() == ["EURUSD"]
+        assert frame["time"].iloc[0] == deals[0].time
+
+
+class TestEnvironmentDealLog:
+    """Assert the environment deals round trip through the deal log"""
+
+    def test_round_trip(self, create_env, tmp_path):
+        file_name = str(tmp_path / "deals.arrows")
+        env = create_env(
+            allow_multiple_positions=True, deal_log_file=file_name, deal_log_memory=2
+        )
+        # Spill in small batches
+        env.account.history_deals.batch_size = 2
+
+        # Open and close positions, more deals than kept in memory
+        for action in [1, 2, 1, 2, 1, 2] * 3:
+            env.step(action, trade_volumes=0.1)
+        env.trade.close_all_positions()
+
+        ledger = env.account.history_deals
+        assert isinstance(ledger, DealLedger)
+        assert ledger.spilled_count > 0
+
+        deals = ledger.to_frame()
+        env.close()
+
+        assert len(deals) == ledger.total_count
+        assert deals["ticket"].is_unique
+        assert deals["ticket"].tolist()[-len(ledger) :] == [
+            deal.ticket for deal in ledger
+        ]
+        written = DealLogWriter.read(file_name)
+        assert written["ticket"].tolist() == deals["ticket"].tolist()
@@ -0,0 +1,51 @@
+from AlgorithmicTrading.backtest.metrics import PerformanceTracker, compute_metrics
+import numpy as np
+import pytest
+
+
+class TestMetrics:
+    """Assert incremental and batch metrics"""
+
+    equity = np.array([100, 110, 99, 105, 120, 90, 95, 130], dtype=np.float64)
+    trade_profits = np.array([10, -11, 6, 15, -30, 40], dtype=np.float64)
+    exposure = np.array([0, 1, 1, 0, 1, 1, 0, 1], dtype=bool)
+
+    def test_tracker_matches_batch(self):
+        tracker = PerformanceTracker()
+
+        for equity, exposed in zip(self.equity, self.exposure):
+            tracker.update_equity(equity, exposed=exposed)
+
+        for profit in self.trade_profits:
+            tracker.add_trade(profit)
+
+        incremental = tracker.metrics()
+        batch = compute_metrics(
+            self.equity, trade_profits=self.trade_profits, exposure=self.exposure
+        )
+
+        assert incremental.keys() == batch.keys()
+        for name in batch:
+            assert incremental[name] == pytest.approx(batch[name])
+
+    def test_metrics_values(self):
+        metrics = compute_metrics(self.equity, trade_profits=self.trade_profits)
+
+        assert metrics["total_return"] == pytest.approx(0.3)
+        assert metrics["max_drawdown"] == pytest.approx(0.25)
+        assert metrics["win_rate"] == pytest.approx(4 / 6)
+        assert metrics["profit_factor"] == pytest.approx(71 / 41)
+        assert metrics["average_trade"] == pytest.approx(30 / 6)
+
+    def test_excursions(self):
+        tracker = PerformanceTracker()
+
+        # Position floating profit path
+        for profit in (0, -5, 3, 8, 2):
+            tracker.update_position(1, profit)
+
+        tracker.add_trade(4, position_id=1)
+
+        assert not tracker.excursions
+        assert tracker.metrics()["average_mae"] == -5
+        assert tracker.metrics()["average_mfe"] == 8
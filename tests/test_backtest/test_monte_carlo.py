@@ -0,0 +1,34 @@
+from AlgorithmicTrading.backtest.monte_carlo import simulate
+import numpy as np
+import pytest
+
+
+class TestMonteCarlo:
+    """Assert Monte Carlo trades resampling"""
+
+    profits = np.array([100, -50, 30, -20, 80, -60, 10], dtype=np.float64)
+
+    def test_shuffle_keeps_final_equity(self):
+        result = simulate(
+            self.profits, initial_balance=1_000, n_simulations=500, method="shuffle", seed=1
+        )
+
+        # Permutations only change the path, not the final equity
+        assert len(result.final_equity) == 500
+        assert np.allclose(result.final_equity, 1_000 + self.profits.sum())
+        assert (result.max_drawdown >= 0).all()
+        assert result.risk_of_ruin == 0
+
+    def test_seed_reproducibility(self):
+        first = simulate(self.profits, initial_balance=1_000, n_simulations=300, seed=3)
+        second = simulate(self.profits, initial_balance=1_000, n_simulations=300, seed=3)
+
+        assert np.array_equal(first.final_equity, second.final_equity)
+        assert np.array_equal(first.max_drawdown, second.max_drawdown)
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            simulate(self.profits, initial_balance=1_000, method="invalid")
+
+        with pytest.raises(ValueError):
+            simulate(np.array([]), initial_balance=1_000)
@@ -0,0 +1,45 @@
+from AlgorithmicTrading.backtest.prefetch import Prefetcher
+import threading
+import pytest
+
+
+class TestPrefetcher:
+    """Assert the background chunks prefetcher"""
+
+    def test_order_and_transform(self):
+        chunks = list(Prefetcher(range(10), depth=3, transform=lambda x: x * 2))
+
+        assert chunks == [x * 2 for x in range(10)]
+
+    def test_read_ahead_depth(self):
+        loaded = []
+
+        def source():
+            for chunk in range(10):
+                loaded.append(chunk)
+                yield chunk
+
+        prefetcher = Prefetcher(source(), depth=2).start()
+
+        # 2 chunks queued and 1 waiting for a free slot
+        prefetcher.thread.join(timeout=0.5)
+        assert len(loaded) == 3
+
+        prefetcher.close()
+        assert not prefetcher.thread.is_alive()
+
+    def test_errors_are_raised(self):
+        def source():
+            yield 1
+            raise OSError("disk")
+
+        with pytest.raises(OSError):
+            list(Prefetcher(source()))
+
+    def test_early_stop(self):
+        prefetcher = Prefetcher(iter(range(1_000)), depth=1)
+
+        for chunk in prefetcher:
+            break
+
+        assert not prefetcher.thread.is_alive()
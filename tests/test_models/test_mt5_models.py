@@ -9,6 +9,9 @@ from AlgorithmicTrading.utils.exceptions import NotExpectedParseType
 import pytest
 from datetime import datetime, timezone
 
+# The MetaTrader 5 structures, not the replay ones
+pytestmark = pytest.mark.live
+
 
 class TestMqlSymbolInfo:
     """Assert MT5 models"""
@@ -0,0 +1,74 @@
+from AlgorithmicTrading.rates.bars import LiveBarBuilder
+from AlgorithmicTrading.rates.resample import resample_ticks
+from AlgorithmicTrading.terminal import mt5
+from AlgorithmicTrading.terminal.structures import TICKS_DTYPE
+from datetime import datetime, timedelta, timezone
+import numpy as np
+
+# 2023-01-02 00:00:00 UTC
+START = 1672617600
+TIMEFRAMES = (mt5.TIMEFRAME_M1, timedelta(minutes=7))
+
+
+def create_ticks(n_ticks: int = 1_200) -> np.ndarray:
+    # One tick every 3 seconds, the price goes up and down
+    ticks = np.zeros(n_ticks, dtype=TICKS_DTYPE)
+    ticks["time_msc"] = START * 1_000 + np.arange(n_ticks) * 3_000
+    ticks["time"] = ticks["time_msc"] // 1_000
+    ticks["bid"] = np.round(1.1 + np.sin(np.arange(n_ticks) / 7) * 0.001, 5)
+    ticks["ask"] = np.round(ticks["bid"] + 0.00008, 5)
+    ticks["volume"] = 1
+
+    return ticks
+
+
+class TestLiveBarBuilder:
+    """Assert the live bars"""
+
+    def test_same_bars_as_resample(self):
+        ticks = create_ticks()
+        builder = LiveBarBuilder(TIMEFRAMES, point=0.00001)
+
+        closed = {timeframe: [] for timeframe in TIMEFRAMES}
+        builder.on_bar_close(lambda timeframe, bar: closed[timeframe].append(bar))
+
+        # Ticks in uneven batches, cutting the bars anywhere
+        for start in range(0, len(ticks), 37):
+            builder.update(ticks[start : start + 37])
+
+        for timeframe in TIMEFRAMES:
+            rates = resample_ticks(ticks, timeframe, point=0.00001)
+
+            assert np.array_equal(builder.window(timeframe), rates[:-1])
+            closed_bars = np.array(closed[timeframe], dtype=rates.dtype)
+            assert np.array_equal(closed_bars, rates[:-1])
+            assert builder.get_forming(timeframe) == rates[-1]
+
+    def test_close_expired(self):
+        ticks = create_ticks(10)
+        builder = LiveBarBuilder(TIMEFRAMES, point=0.00001, capacity=5)
+        builder.update(ticks)
+
+        # The M1 bar ended, the 7 minutes bar goes on
+        closed = builder.close_expired(datetime.fromtimestamp(START + 60, timezone.utc))
+
+        assert list(closed) == [mt5.TIMEFRAME_M1]
+        assert builder.get_forming(mt5.TIMEFRAME_M1) is None
+        assert len(builder.window(mt5.TIMEFRAME_M1)) == 1
+        assert builder.get_forming(TIMEFRAMES[1]) is not None
+
+    def test_close_expired_broker_time(self):
+        # Broker time zone at UTC-5, one tick at the current broker time
+        time_offset = -5 * 3_600
+        ticks = create_ticks(1)
+        ticks["time"] = int(datetime.now(timezone.utc).timestamp()) + time_offset
+        ticks["time_msc"] = ticks["time"] * 1_000
+
+        builder = LiveBarBuilder(
+            [mt5.TIMEFRAME_H1], point=0.00001, time_offset=time_offset
+        )
+        builder.update(ticks)
+
+        # The bar of the broker hour goes on, the UTC clock is 5 hours later
+        assert builder.close_expired() == {}
+        assert builder.get_forming(mt5.TIMEFRAME_H1) is not None
@@ -0,0 +1,122 @@
+from AlgorithmicTrading.rates.cache import CandleCache
+from AlgorithmicTrading.terminal import ReplayBackend, mt5, use_backend
+from AlgorithmicTrading.terminal.structures import RATES_DTYPE
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pytest
+import threading
+
+# 2023-01-02 00:00:00 UTC, Monday
+START = datetime(2023, 1, 2, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def day_rates() -> dict:
+    """One day of EURUSD one minute candles"""
+    rates = np.zeros(1_440, dtype=RATES_DTYPE)
+    rates["time"] = int(START.timestamp()) + np.arange(1_440) * 60
+    rates["close"] = np.arange(1_440)
+
+    return {mt5.TIMEFRAME_M1: rates}
+
+
+class TestCandleCache:
+    """Assert the incremental candles cache"""
+
+    def test_range(self, create_counting_backend, day_rates):
+        cache = CandleCache()
+
+        with use_backend(create_counting_backend(rates=day_rates)) as backend:
+            rates = cache.get_range(
+                "EURUSD", mt5.TIMEFRAME_M1, START, START + timedelta(minutes=59)
+            )
+            assert len(rates) == 60
+            assert backend.requests.total() == 1
+
+            # Covered range
+            cache.get_range(
+                "EURUSD", mt5.TIMEFRAME_M1, START, START + timedelta(minutes=30)
+            )
+            assert backend.requests.total() == 1
+
+            # Only the new hour is requested
+            rates = cache.get_range(
+                "EURUSD", mt5.TIMEFRAME_M1, START, START + timedelta(minutes=119)
+            )
+            assert len(rates) == 120
+            assert np.array_equal(rates["close"], np.arange(120))
+            assert backend.requests.total() == 2
+            assert cache.coverage[("EURUSD", mt5.TIMEFRAME_M1)] == [
+                [int(START.timestamp()), int(START.timestamp()) + 119 * 60]
+            ]
+
+    def test_before(self, create_counting_backend, day_rates):
+        cache = CandleCache()
+
+        with use_backend(create_counting_backend(rates=day_rates)) as backend:
+            date_to = START + timedelta(hours=2)
+            rates = cache.get_before("EURUSD", mt5.TIMEFRAME_M1, date_to, 100)
+            assert len(rates) == 100
+
+            # Cached candles and one new minute
+            rates = cache.get_before(
+                "EURUSD", mt5.TIMEFRAME_M1, date_to + timedelta(minutes=1), 50
+            )
+            assert rates["close"][-1] == 121
+            assert backend.requests.total() == 2
+
+    def test_closed_market(self):
+        saturday = int(datetime(2023, 1, 7, tzinfo=timezone.utc).timestamp())
+
+        assert not CandleCache.has_candles(
+            mt5.TIMEFRAME_M1, saturday, saturday + 3_600
+        )
+        # No candle opens inside the interval
+        assert not CandleCache.has_candles(mt5.TIMEFRAME_H1, 60, 3_599)
+        assert CandleCache.has_candles(mt5.TIMEFRAME_H1, 60, 3_600)
+
+        # Sunday closed too, in broker time
+        sunday = saturday + 86_400
+        assert CandleCache.has_candles(mt5.TIMEFRAME_M1, sunday, sunday + 3_600)
+        assert not CandleCache(closed_days=[5, 6]).get_gaps(
+            "EURUSD", mt5.TIMEFRAME_M1, sunday, sunday + 3_600
+        )
+
+    def test_broker_clock(self):
+        # Broker time zone at UTC+2
+        cache = CandleCache(time_offset=7_200)
+        rates = np.zeros(1, dtype=RATES_DTYPE)
+        utc_now = int(datetime.now(timezone.utc).timestamp()) // 60 * 60
+        rates["time"] = utc_now + 7_200
+
+        # The candle opened in broker time is still open, it is not covered
+        cache.add("EURUSD", mt5.TIMEFRAME_M1, rates, utc_now, utc_now + 7_200)
+
+        assert cache.coverage[("EURUSD", mt5.TIMEFRAME_M1)] == [
+            [utc_now, utc_now + 7_199]
+        ]
+
+    def test_request_without_lock(self, create_backend, day_rates):
+        cache = CandleCache()
+        locked = []
+
+        def probe_lock():
+            if cache.lock.acquire(timeout=1):
+                locked.append(True)
+                cache.lock.release()
+
+        class LockProbeBackend(ReplayBackend):
+            def copy_rates_range(self, *args):
+                # Another thread can use the cache during the request
+                thread = threading.Thread(target=probe_lock)
+                thread.start()
+                thread.join()
+
+                return super().copy_rates_range(*args)
+
+        with use_backend(create_backend(LockProbeBackend, rates=day_rates)):
+            cache.get_range(
+                "EURUSD", mt5.TIMEFRAME_M1, START, START + timedelta(minutes=59)
+            )
+
+        assert locked == [True]
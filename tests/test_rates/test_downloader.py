@@ -0,0 +1,82 @@
+from AlgorithmicTrading.rates.downloader import DownloadManager
+from AlgorithmicTrading.terminal import ReplayBackend, mt5, use_backend
+from AlgorithmicTrading.terminal.structures import RATES_DTYPE, TICKS_DTYPE
+from AlgorithmicTrading.utils.files import read_dataset
+from datetime import datetime, timezone
+import numpy as np
+
+# 2023-01-02 00:00:00 UTC
+START = 1672617600
+DATE_FROM = datetime(2023, 1, 2, tzinfo=timezone.utc)
+DATE_TO = datetime(2023, 1, 2, 0, 10, tzinfo=timezone.utc)
+
+
+def create_backend() -> ReplayBackend:
+    ticks = np.zeros(600, dtype=TICKS_DTYPE)
+    ticks["time"] = START + np.arange(600)
+    ticks["time_msc"] = ticks["time"] * 1_000
+    ticks["bid"] = 1.1
+    ticks["ask"] = 1.1001
+
+    rates = np.zeros(20, dtype=RATES_DTYPE)
+    rates["time"] = START + np.arange(20) * 60
+    rates["close"] = 1.1
+
+    backend = ReplayBackend()
+    for symbol in ("EURUSD", "GBPUSD"):
+        backend.load_symbol(symbol, ticks=ticks, rates={mt5.TIMEFRAME_M1: rates})
+
+    return backend
+
+
+class TestDownloadManager:
+    """Assert the historical data download manager"""
+
+    def test_download(self, tmp_path):
+        root = str(tmp_path)
+        manager = DownloadManager(root, workers=2, chunk_bars=3)
+
+        with use_backend(create_backend()):
+            summary = manager.run(
+                ["EURUSD", "GBPUSD"],
+                DATE_FROM,
+                DATE_TO,
+                timeframes=[mt5.TIMEFRAME_M1, "ticks"],
+            )
+
+        # 4 candles chunks and 1 ticks chunk by symbol
+        assert summary == {"chunks": 10, "rows": 1_220, "failed": {}}
+
+        candles = read_dataset(root, symbol="EURUSD", timeframe="M1")
+        assert len(candles) == 10
+        assert candles["time"].is_unique
+
+    def test_resume(self, tmp_path):
+        root = str(tmp_path)
+
+        with use_backend(create_backend()):
+            DownloadManager(root, chunk_bars=3).run(
+                ["EURUSD"], DATE_FROM, DATE_TO, timeframes=[mt5.TIMEFRAME_M1]
+            )
+
+            # The finished chunks are skipped
+            manager = DownloadManager(root, chunk_bars=3)
+            assert manager.plan(["EURUSD"], DATE_FROM, DATE_TO, [mt5.TIMEFRAME_M1]) == []
+
+    def test_open_chunks(self, tmp_path):
+        root = str(tmp_path)
+        # The broker time is 2023-01-02 00:05, so the job ends in the future
+        time_offset = START + 300 - int(datetime.now(timezone.utc).timestamp())
+        manager = DownloadManager(root, chunk_bars=3, time_offset=time_offset)
+
+        with use_backend(create_backend()):
+            summary = manager.run(
+                ["EURUSD"], DATE_FROM, DATE_TO, timeframes=[mt5.TIMEFRAME_M1]
+            )
+
+            # Only the chunk ending at 00:03 is finished, the others are pending
+            pending = manager.plan(["EURUSD"], DATE_FROM, DATE_TO, [mt5.TIMEFRAME_M1])
+
+        assert summary["chunks"] == 4
+        assert len(manager.manifest) == 1
+        assert [chunk["date_from"].minute for chunk in pending] == [3, 6, 9]
@@ -0,0 +1,56 @@
+from AlgorithmicTrading.rates.dtypes import (
+    denormalize_frame,
+    normalize_frame,
+    points_to_prices,
+    prices_to_points,
+)
+from types import SimpleNamespace
+import numpy as np
+import pandas as pd
+
+SYMBOL_DATA = SimpleNamespace(trade_tick_size=0.00001, digits=5)
+
+
+def create_candles() -> pd.DataFrame:
+    close = np.round(1.1 + np.arange(100) * 0.00007, 5)
+
+    return pd.DataFrame(
+        {
+            "time": pd.date_range("2023-01-02", periods=100, freq="5min", tz="UTC"),
+            "open": close - 0.00003,
+            "close": close,
+            "tick_volume": np.arange(100, dtype=np.uint64),
+            "Feature - 5 SMA": close,
+        }
+    )
+
+
+class TestDtypes:
+    """Assert the compact dtypes normalization"""
+
+    def test_points(self):
+        prices = np.array([1.10001, 1.2, 0.99999])
+        points = prices_to_points(prices, SYMBOL_DATA.trade_tick_size)
+
+        assert points.dtype == np.int32
+        assert list(points) == [110_001, 120_000, 99_999]
+        assert np.array_equal(
+            points_to_prices(points, SYMBOL_DATA.trade_tick_size, 5), prices
+        )
+
+    def test_round_trip(self):
+        df = create_candles()
+        normalized = normalize_frame(df, SYMBOL_DATA)
+
+        assert normalized["close"].dtype == np.int32
+        assert normalized["tick_volume"].dtype == np.uint32
+        assert normalized["time"].dtype == np.int64
+        assert normalized["Feature - 5 SMA"].dtype == np.float32
+        assert normalized["time"].iloc[1] - normalized["time"].iloc[0] == 300_000
+
+        restored = denormalize_frame(normalized)
+
+        pd.testing.assert_frame_equal(
+            restored.drop(columns="Feature - 5 SMA"),
+            df.drop(columns="Feature - 5 SMA"),
+        )
@@ -0,0 +1,115 @@
+from AlgorithmicTrading.rates.resample import (
+    get_resampled_candles,
+    resample_tick_bars,
+    resample_ticks,
+    resample_volume_bars,
+)
+from AlgorithmicTrading.terminal.structures import TICKS_DTYPE
+from AlgorithmicTrading.utils.files import write_dataset
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pandas as pd
+import os
+import time
+
+# 2023-01-02 00:00:00 UTC
+START = 1672617600
+
+
+def create_ticks(n_ticks: int = 1_200) -> np.ndarray:
+    # One tick every 3 seconds, the price goes up 1 point each tick
+    ticks = np.zeros(n_ticks, dtype=TICKS_DTYPE)
+    ticks["time_msc"] = START * 1_000 + np.arange(n_ticks) * 3_000
+    ticks["time"] = ticks["time_msc"] // 1_000
+    ticks["bid"] = np.round(1.1 + np.arange(n_ticks) * 0.00001, 5)
+    ticks["ask"] = np.round(ticks["bid"] + 0.00008, 5)
+    ticks["volume"] = 1
+
+    return ticks
+
+
+class TestResample:
+    """Assert the ticks resampler"""
+
+    def test_time_bars(self):
+        ticks = create_ticks()
+
+        # 7 minutes bars, 140 ticks each
+        rates = resample_ticks(ticks, timedelta(minutes=7), point=0.00001)
+
+        assert len(rates) == 9
+        assert rates["time"][1] - rates["time"][0] == 420
+        assert rates["tick_volume"][0] == 140
+        assert rates["open"][0] == ticks["bid"][0]
+        assert rates["close"][0] == ticks["bid"][139]
+        assert rates["high"][0] == ticks["bid"][139]
+        assert rates["spread"][0] == 8
+
+    def test_count_bars(self):
+        ticks = create_ticks()
+
+        assert len(resample_tick_bars(ticks, 100, point=0.00001)) == 12
+
+        rates = resample_volume_bars(ticks, 250, point=0.00001)
+        assert list(rates["real_volume"]) == [250, 250, 250, 250, 200]
+
+    def test_cache(self, tmp_path):
+        root = str(tmp_path)
+        ticks = pd.DataFrame(create_ticks())
+        ticks["time"] = pd.to_datetime(ticks["time"], unit="s", utc=True)
+        write_dataset(ticks, root, "EURUSD", "ticks")
+
+        date_from = datetime(2023, 1, 2, tzinfo=timezone.utc)
+        date_to = datetime(2023, 1, 3, tzinfo=timezone.utc)
+        candles = get_resampled_candles(
+            root, "EURUSD", timedelta(minutes=5), date_from, date_to, 0.00001
+        )
+
+        assert len(candles) == 12
+        assert os.path.isdir(tmp_path / "symbol=EURUSD" / "timeframe=M5")
+
+    def test_cache_partial_days(self, tmp_path):
+        root = str(tmp_path)
+        ticks = pd.DataFrame(create_ticks())
+        ticks["time"] = pd.to_datetime(ticks["time"], unit="s", utc=True)
+        date_from = datetime(2023, 1, 2, tzinfo=timezone.utc)
+        date_to = datetime(2023, 1, 3, tzinfo=timezone.utc)
+
+        # The day is downloaded in two chunks, the candles are read in between
+        write_dataset(ticks.iloc[:600], root, "EURUSD", "ticks")
+        candles = get_resampled_candles(
+            root, "EURUSD", timedelta(minutes=5), date_from, date_to, 0.00001
+        )
+        assert len(candles) == 6
+
+        write_dataset(ticks.iloc[600:], root, "EURUSD", "ticks")
+        # The second chunk is newer than the candles
+        for path in (tmp_path / "symbol=EURUSD" / "timeframe=ticks").rglob("*"):
+            os.utime(path, (time.time() + 10, time.time() + 10))
+
+        candles = get_resampled_candles(
+            root, "EURUSD", timedelta(minutes=5), date_from, date_to, 0.00001
+        )
+        assert len(candles) == 12
+        assert candles["time"].is_unique
+
+    def test_open_day(self, tmp_path):
+        root = str(tmp_path)
+        today = pd.Timestamp.now(tz="UTC").floor("D").to_pydatetime()
+        ticks = pd.DataFrame(create_ticks(100))
+        ticks["time_msc"] = int(today.timestamp()) * 1_000 + np.arange(100) * 3_000
+        ticks["time"] = pd.to_datetime(ticks["time_msc"], unit="ms", utc=True)
+        write_dataset(ticks, root, "EURUSD", "ticks")
+
+        candles = get_resampled_candles(
+            root,
+            "EURUSD",
+            timedelta(minutes=5),
+            today,
+            today + timedelta(days=1),
+            0.00001,
+        )
+
+        # The candles of the current day are not stored
+        assert len(candles) == 1
+        assert not os.path.isdir(tmp_path / "symbol=EURUSD" / "timeframe=M5")
@@ -0,0 +1,77 @@
+from AlgorithmicTrading.rates.stream import TickBuffer, TickStream
+from AlgorithmicTrading.terminal import ReplayBackend, mt5, use_backend
+from AlgorithmicTrading.terminal.structures import TICKS_DTYPE
+from datetime import datetime, timezone
+import numpy as np
+
+# 2023-01-02 00:00:00 UTC
+START = 1672617600
+
+
+def create_ticks(n_ticks: int) -> np.ndarray:
+    # Two ticks per second, sharing the same ms
+    ticks = np.zeros(n_ticks, dtype=TICKS_DTYPE)
+    ticks["time"] = START + np.arange(n_ticks) // 2
+    ticks["time_msc"] = ticks["time"] * 1_000
+    ticks["bid"] = np.round(1.1 + np.arange(n_ticks) * 0.00001, 5)
+    ticks["ask"] = ticks["bid"] + 0.0001
+    ticks["flags"] = mt5.TICK_FLAG_BID | mt5.TICK_FLAG_ASK
+
+    return ticks
+
+
+class TestTickBuffer:
+    """Assert the ticks ring buffer"""
+
+    def test_windows(self):
+        ticks = create_ticks(25)
+        buffer = TickBuffer(capacity=10)
+
+        for start in range(0, 25, 7):
+            buffer.append(ticks[start : start + 7])
+
+            # The last ticks, in order, without copy
+            end = min(start + 7, 25)
+            window = buffer.window()
+            assert np.array_equal(window, ticks[max(0, end - 10) : end])
+            assert np.shares_memory(window, buffer.data)
+            assert not window.flags.writeable
+
+        assert np.array_equal(buffer.window(3), ticks[-3:])
+
+        # More ticks than the capacity
+        buffer.append(create_ticks(15))
+        assert np.array_equal(buffer.window(), create_ticks(15)[-10:])
+
+
+class TestTickStream:
+    """Assert the ticks polling"""
+
+    def test_poll(self):
+        ticks = create_ticks(100)
+        backend = ReplayBackend()
+        backend.load_symbol("EURUSD", ticks=ticks, digits=5)
+
+        received = []
+        stream = TickStream(max_ticks=8)
+
+        with use_backend(backend):
+            # Half of the ticks of the second 10 are visible
+            backend.set_time(datetime.fromtimestamp(START + 10, timezone.utc))
+            buffer = stream.subscribe(
+                "EURUSD",
+                callback=lambda symbol, new: received.append(new.copy()),
+                date_from=datetime.fromtimestamp(START, timezone.utc),
+            )
+            assert stream.poll() == 22
+
+            # Nothing new
+            assert stream.poll() == 0
+
+            backend.set_time(datetime.fromtimestamp(START + 30, timezone.utc))
+            assert stream.poll() == 40
+
+        # Every tick once, in order
+        received = np.concatenate(received)
+        assert np.array_equal(received, ticks[:62])
+        assert np.array_equal(buffer.window(), ticks[:62])
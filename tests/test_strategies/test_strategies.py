@@ -0,0 +1,93 @@
+from AlgorithmicTrading.account import AccountBacktest
+from AlgorithmicTrading.backtest.prefetch import Prefetcher
+from AlgorithmicTrading.strategies.base import BaseStrategy
+from AlgorithmicTrading.trade import Trade
+from AlgorithmicTrading.utils.files import read_dataset, write_dataset
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def create_candles(periods: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {"close": [float(value) for value in range(periods)]},
+        index=pd.date_range("2023-01-02", periods=periods, freq="15min", tz="UTC"),
+    )
+
+
+class TestInitializeRun:
+    """Assert the candles and trade class of a run"""
+
+    def test_given_data(self):
+        strategy = BaseStrategy(AccountBacktest.login(), 7, ["EURUSD"])
+        candles = create_candles(10)
+
+        # The symbol and dates are not needed with the candles
+        finantial_data, trade = strategy.initialize_run(finantial_data=candles)
+
+        assert finantial_data is candles
+        assert isinstance(trade, Trade)
+        assert trade.magic_number == 7
+        assert trade.account_data is strategy.account_data
+
+    def test_missing_dates(self):
+        strategy = BaseStrategy(AccountBacktest.login(), 7, ["EURUSD"])
+
+        with pytest.raises(Exception, match="initialize_run"):
+            strategy.initialize_run(symbol="EURUSD")
+
+
+class MeanReversionStrategy(BaseStrategy):
+    """Record a signal per candle, from the mean of the last 4 closes"""
+
+    def __init__(self) -> None:
+        super().__init__(AccountBacktest.login(), 7, ["EURUSD"])
+        self.signals = []
+
+    def run(self, finantial_data: pd.DataFrame) -> None:
+        closes = finantial_data["close"].iloc[-4:]
+        signal = 0 if len(closes) < 4 else int(np.sign(closes.mean() - closes.iloc[-1]))
+
+        self.signals.append((finantial_data["time"].iloc[-1], signal))
+
+
+class TestBacktestRunStream:
+    """Assert a strategy run on a streamed dataset"""
+
+    def test_dataset_stream(self, tmp_path):
+        root = str(tmp_path)
+        candles = pd.DataFrame(
+            {
+                "time": pd.date_range(
+                    "2023-01-02", periods=3 * 96, freq="15min", tz="UTC"
+                ),
+                "close": np.round(1.1 + np.sin(np.arange(3 * 96) / 7) * 0.01, 5),
+            }
+        )
+        write_dataset(candles, root, "EURUSD", "M15")
+
+        # Whole range in memory
+        strategy = MeanReversionStrategy()
+        finantial_data, _ = strategy.initialize_run(
+            finantial_data=read_dataset(root, symbol="EURUSD", timeframe="M15")
+        )
+        strategy.backtest_run(finantial_data)
+
+        # Same range, one day per chunk, the lookback is kept across the chunks
+        stream_strategy = MeanReversionStrategy()
+        stream_strategy.backtest_run_stream(
+            Prefetcher.from_dataset(
+                root,
+                "EURUSD",
+                "M15",
+                date_from=datetime(2023, 1, 2, tzinfo=timezone.utc),
+                date_to=datetime(2023, 1, 5, tzinfo=timezone.utc),
+                window=timedelta(days=1),
+            ),
+            history=3,
+        )
+
+        assert len(stream_strategy.signals) == len(candles)
+        assert stream_strategy.signals == strategy.signals
+        assert {signal for _, signal in strategy.signals} == {-1, 0, 1}
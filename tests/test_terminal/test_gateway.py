@@ -0,0 +1,118 @@
+from AlgorithmicTrading.terminal import (
+    disable_gateway,
+    enable_gateway,
+    mt5,
+    use_backend,
+)
+from AlgorithmicTrading.terminal.gateway import (
+    PRIORITY_DATA,
+    PRIORITY_ORDER,
+    TokenBucket,
+)
+from AlgorithmicTrading.terminal.structures import TICKS_DTYPE
+import numpy as np
+import pytest
+import threading
+import time
+
+# 2023-01-02 00:00:00 UTC
+START = 1672617600
+
+
+@pytest.fixture
+def gateway_backend(create_counting_backend):
+    """Slow replay terminal counting its requests, with 2 minutes of EURUSD ticks"""
+    ticks = np.zeros(120, dtype=TICKS_DTYPE)
+    ticks["time"] = START + np.arange(120)
+    ticks["time_msc"] = ticks["time"] * 1_000
+    ticks["bid"] = 1.1
+    ticks["ask"] = 1.1001
+
+    return create_counting_backend(ticks=ticks, latency=0.05)
+
+
+def run_threads(target, n_threads: int) -> None:
+    threads = [threading.Thread(target=target) for _ in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestTokenBucket:
+    """Assert the rate limits"""
+
+    def test_rate(self):
+        bucket = TokenBucket(rate=100, burst=1)
+
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+
+        # The first token is in the bucket, the others refill in 10 ms each
+        assert time.monotonic() - start >= 0.045
+
+    def test_order_priority(self):
+        bucket = TokenBucket(rate=20, burst=1)
+        bucket.acquire()
+        served = []
+
+        def request(name: str, priority: int) -> None:
+            bucket.acquire(priority)
+            served.append(name)
+
+        data = threading.Thread(target=request, args=("data", PRIORITY_DATA))
+        order = threading.Thread(target=request, args=("order", PRIORITY_ORDER))
+
+        # The data request waits first, the order is served first
+        data.start()
+        time.sleep(0.01)
+        order.start()
+        data.join()
+        order.join()
+
+        assert served == ["order", "data"]
+
+
+class TestTerminalGateway:
+    """Assert the requests routing"""
+
+    def test_coalescing(self, gateway_backend):
+        results = []
+        gateway = enable_gateway()
+
+        def request():
+            results.append(
+                mt5.copy_ticks_range("EURUSD", START, START + 60, mt5.COPY_TICKS_ALL)
+            )
+
+        try:
+            with use_backend(gateway_backend) as backend:
+                # 8 identical requests while the first is in progress
+                run_threads(request, 8)
+
+                # A distinct request is not shared
+                mt5.copy_ticks_range("EURUSD", START, START + 30, mt5.COPY_TICKS_ALL)
+        finally:
+            disable_gateway()
+
+        assert backend.requests["copy_ticks_range"] == 2
+        assert gateway.requests == 9
+        assert gateway.coalesced == 7
+
+        # Every caller has its own copy of the ticks
+        assert all(np.array_equal(ticks, results[0]) for ticks in results)
+        assert len({id(ticks) for ticks in results}) == 8
+
+    def test_account_state_not_shared(self, gateway_backend):
+        gateway = enable_gateway()
+
+        try:
+            with use_backend(gateway_backend) as backend:
+                run_threads(mt5.positions_get, 4)
+        finally:
+            disable_gateway()
+
+        # Each caller reads the positions after its own request
+        assert backend.requests["positions_get"] == 4
+        assert gateway.coalesced == 0
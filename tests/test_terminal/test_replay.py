@@ -0,0 +1,137 @@
+from AlgorithmicTrading.terminal import ReplayBackend, mt5, use_backend
+from AlgorithmicTrading.terminal.structures import RATES_DTYPE, TICKS_DTYPE
+from AlgorithmicTrading.models.metatrader import MqlAccountInfo, MqlTradeResult
+from AlgorithmicTrading.account import AccountLive
+from datetime import datetime, timezone
+import numpy as np
+
+# 2023-01-02 00:00:00 UTC
+START = 1672617600
+
+
+def create_backend(**kwargs) -> ReplayBackend:
+    # One tick per second, the price goes up 1 point each tick
+    ticks = np.zeros(600, dtype=TICKS_DTYPE)
+    ticks["time"] = START + np.arange(600)
+    ticks["time_msc"] = ticks["time"] * 1_000
+    ticks["bid"] = np.round(1.1 + np.arange(600) * 0.00001, 5)
+    ticks["ask"] = np.round(ticks["bid"] + 0.0001, 5)
+    ticks["flags"] = mt5.TICK_FLAG_BID | mt5.TICK_FLAG_ASK
+
+    # One minute candles
+    rates = np.zeros(10, dtype=RATES_DTYPE)
+    rates["time"] = START + np.arange(10) * 60
+    rates["open"] = ticks["bid"][::60]
+    rates["close"] = ticks["bid"][59::60]
+
+    backend = ReplayBackend(**kwargs)
+    backend.load_symbol(
+        "EURUSD", ticks=ticks, rates={mt5.TIMEFRAME_M1: rates}, digits=5
+    )
+
+    return backend
+
+
+class TestReplayBackend:
+    """Assert the terminal replay backend"""
+
+    def test_market_data(self):
+        backend = create_backend()
+
+        # Both range dates are included on candles
+        rates = backend.copy_rates_range(
+            "EURUSD", mt5.TIMEFRAME_M1, START, START + 120
+        )
+        assert len(rates) == 3
+
+        # The end date is excluded on ticks
+        ticks = backend.copy_ticks_range(
+            "EURUSD", START, START + 60, mt5.COPY_TICKS_ALL
+        )
+        assert len(ticks) == 60
+
+        # The data after the clock is not visible
+        backend.set_time(START + 90)
+        assert len(backend.copy_rates_from_pos("EURUSD", mt5.TIMEFRAME_M1, 0, 100)) == 2
+        assert backend.symbol_info("EURUSD").bid == 1.1009
+
+    def test_positions(self):
+        backend = create_backend(balance=1_000)
+        backend.set_time(START)
+
+        # Open a buy position at the ask price
+        result = backend.order_send(
+            {
+                "action": mt5.TRADE_ACTION_DEAL,
+                "symbol": "EURUSD",
+                "type": mt5.ORDER_TYPE_BUY,
+                "volume": 1.0,
+            }
+        )
+        assert result.retcode == mt5.TRADE_RETCODE_DONE
+        assert result.price == 1.1001
+
+        # Close it 200 ticks later at the bid price
+        backend.set_time(START + 200)
+        (position,) = backend.positions_get()
+        assert position.profit == 190
+
+        backend.order_send(
+            {
+                "action": mt5.TRADE_ACTION_DEAL,
+                "symbol": "EURUSD",
+                "type": mt5.ORDER_TYPE_SELL,
+                "volume": 1.0,
+                "position": position.ticket,
+            }
+        )
+
+        assert not backend.positions_get()
+        assert backend.account_info().balance == 1_190
+        assert len(backend.history_deals_get(position=position.ticket)) == 2
+
+    def test_requote(self):
+        backend = create_backend()
+
+        result = backend.order_send(
+            {
+                "action": mt5.TRADE_ACTION_DEAL,
+                "symbol": "EURUSD",
+                "type": mt5.ORDER_TYPE_BUY,
+                "volume": 0.1,
+                "price": 1.0,
+                "deviation": 10,
+            }
+        )
+
+        assert result.retcode == mt5.TRADE_RETCODE_REQUOTE
+        assert MqlTradeResult.parse_result(result).retcode == result.retcode
+
+    def test_account_models(self):
+        with use_backend(create_backend(balance=5_000)):
+            account = AccountLive.login(login=1, server="Replay", password="")
+
+        assert isinstance(account, MqlAccountInfo)
+        assert account.balance == 5_000
+        assert account.login == 1
+
+    def test_save_and_load(self, tmp_path):
+        backend = create_backend()
+        backend.save(str(tmp_path))
+
+        loaded = ReplayBackend.from_directory(str(tmp_path))
+
+        assert np.array_equal(loaded.ticks["EURUSD"], backend.ticks["EURUSD"])
+        assert np.array_equal(
+            loaded.rates[("EURUSD", mt5.TIMEFRAME_M1)],
+            backend.rates[("EURUSD", mt5.TIMEFRAME_M1)],
+        )
+        assert loaded.symbol_info("EURUSD") == backend.symbol_info("EURUSD")
+
+    def test_latency(self):
+        backend = create_backend(latency=0.005)
+
+        start = datetime.now(timezone.utc)
+        backend.symbols_get()
+
+        assert (datetime.now(timezone.utc) - start).total_seconds() >= 0.005
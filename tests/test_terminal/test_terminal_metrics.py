@@ -0,0 +1,93 @@
+from AlgorithmicTrading.terminal import (
+    ReplayBackend,
+    disable_metrics,
+    enable_metrics,
+    get_metrics,
+    mt5,
+    use_backend,
+)
+from AlgorithmicTrading.terminal.metrics import LatencyHistogram
+from AlgorithmicTrading.terminal.structures import TICKS_DTYPE
+from AlgorithmicTrading.account import AccountLive
+import numpy as np
+
+# 2023-01-02 00:00:00 UTC
+START = 1672617600
+
+
+def create_backend() -> ReplayBackend:
+    # One tick per second
+    ticks = np.zeros(120, dtype=TICKS_DTYPE)
+    ticks["time"] = START + np.arange(120)
+    ticks["time_msc"] = ticks["time"] * 1_000
+    ticks["bid"] = 1.1
+    ticks["ask"] = 1.1001
+
+    backend = ReplayBackend(latency=0.002)
+    backend.load_symbol("EURUSD", ticks=ticks, digits=5)
+
+    return backend
+
+
+class TestLatencyHistogram:
+    """Assert the HDR style histogram"""
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 100_001):
+            histogram.record(value * 1_000)
+
+        # Precision of the buckets, about 6%
+        assert abs(histogram.percentile(50) / 50_000_000 - 1) < 0.07
+        assert abs(histogram.percentile(99) / 99_000_000 - 1) < 0.07
+        assert histogram.percentile(100) == 100_000_000
+        assert histogram.count_below(50_000_000) <= 50_000
+
+
+class TestTerminalMetrics:
+    """Assert the terminal calls instrumentation"""
+
+    def test_disabled(self):
+        disable_metrics()
+        backend = create_backend()
+
+        with use_backend(backend):
+            # The backend function itself, not wrapped
+            assert mt5.copy_ticks_range == backend.copy_ticks_range
+
+        assert get_metrics() is None
+
+    def test_terminal_calls(self):
+        metrics = enable_metrics()
+
+        try:
+            with use_backend(create_backend()):
+                mt5.copy_ticks_range("EURUSD", START, START + 60, mt5.COPY_TICKS_ALL)
+                mt5.symbol_info("UNKNOWN")
+                AccountLive.get_data()
+        finally:
+            disable_metrics()
+
+        snapshot = metrics.snapshot()
+        ticks = snapshot["terminal"]["copy_ticks_range"]
+        assert ticks["count"] == 1
+        assert ticks["payload_items"] == 60
+        assert ticks["payload_bytes"] == 60 * TICKS_DTYPE.itemsize
+        assert ticks["p50_s"] >= 0.002
+
+        # The unknown symbol returns None
+        assert snapshot["terminal"]["symbol_info"]["errors"] == 1
+
+        # The account refresh and its terminal calls
+        assert snapshot["span"]["AccountLive.get_data"]["count"] == 1
+        assert snapshot["terminal"]["account_info"]["count"] == 1
+
+        text = metrics.to_prometheus()
+        assert (
+            'algorithmictrading_calls_total{kind="terminal",call="copy_ticks_range"} 1'
+            in text
+        )
+        assert (
+            'algorithmictrading_call_seconds_count{kind="span",'
+            'call="AccountLive.get_data"} 1' in text
+        )
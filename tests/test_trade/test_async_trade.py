@@ -0,0 +1,65 @@
+from AlgorithmicTrading.account import AccountLive
+from AlgorithmicTrading.terminal import use_backend
+from AlgorithmicTrading.trade import AsyncTrade, Trade
+import asyncio
+import threading
+
+
+class TestAsyncTrade:
+    """Assert the asynchronous trade facade"""
+
+    def test_gather(self, create_backend):
+        async def basket(trade: Trade):
+            async with AsyncTrade(trade) as async_trade:
+                opened = await async_trade.gather(
+                    async_trade.buy("EURUSD", 0.1),
+                    async_trade.sell("GBPUSD", 0.1),
+                    async_trade.buy("GBPUSD", 0.2),
+                )
+                closed = await async_trade.close_all_positions()
+
+            return opened, closed
+
+        with use_backend(create_backend(symbols=("EURUSD", "GBPUSD"))):
+            trade = Trade(AccountLive.login(login=2, server="Replay", password=""))
+            opened, closed = asyncio.run(basket(trade))
+
+        assert opened == [True, True, True]
+        assert closed == [True, True, True]
+        assert trade.account_data.positions == []
+
+    def test_timeout(self, create_backend):
+        async def slow_order(trade: Trade):
+            async with AsyncTrade(trade) as async_trade:
+                return await async_trade.gather(
+                    async_trade.buy("EURUSD", 0.1, timeout=0.01)
+                )
+
+        with use_backend(create_backend()) as backend:
+            trade = Trade(AccountLive.login(login=2, server="Replay", password=""))
+            backend.latency = 0.05
+
+            (result,) = asyncio.run(slow_order(trade))
+
+        assert isinstance(result, asyncio.TimeoutError)
+
+    def test_last_result_by_thread(self, create_backend):
+        with use_backend(create_backend()):
+            trade = Trade(AccountLive.login(login=2, server="Replay", password=""))
+            sent = threading.Barrier(2)
+            volumes = {}
+
+            def buy(volume: float):
+                trade.buy("EURUSD", volume)
+                # Both requests are sent before the results are read
+                sent.wait(timeout=5)
+                volumes[volume] = trade.last_result.volume
+
+            threads = [threading.Thread(target=buy, args=(v,)) for v in (0.1, 0.2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert volumes == {0.1: 0.1, 0.2: 0.2}
+        assert trade.last_result is None
@@ -0,0 +1,69 @@
+from AlgorithmicTrading.account import AccountLive
+from AlgorithmicTrading.models.metatrader import ENUM_REFRESH_POLICY
+from AlgorithmicTrading.terminal import mt5, use_backend
+from AlgorithmicTrading.trade import Trade
+import pytest
+
+
+@pytest.fixture
+def trade_backend(create_counting_backend):
+    """Replay terminal counting its requests, with 5 open positions"""
+    backend = create_counting_backend()
+
+    for _ in range(5):
+        backend.order_send(
+            {
+                "action": mt5.TRADE_ACTION_DEAL,
+                "symbol": "EURUSD",
+                "type": mt5.ORDER_TYPE_BUY,
+                "volume": 0.1,
+            }
+        )
+
+    return backend
+
+
+class TestRefreshPolicy:
+    """Assert the account refreshes around the trade operations"""
+
+    def test_close_all_positions_batch(self, trade_backend):
+        with use_backend(trade_backend) as backend:
+            trade = Trade(AccountLive.login(login=2, server="Replay", password=""))
+            backend.requests.clear()
+
+            trade.close_all_positions()
+
+        # One refresh before and one after the 5 closes
+        assert backend.requests["account_info"] == 2
+        assert trade.account_data.positions == []
+
+    def test_lazy_refresh(self, trade_backend):
+        with use_backend(trade_backend) as backend:
+            trade = Trade(
+                AccountLive.login(login=2, server="Replay", password=""),
+                refresh_policy=ENUM_REFRESH_POLICY.REFRESH_POLICY_LAZY,
+            )
+            backend.requests.clear()
+
+            trade.buy("EURUSD", 0.1)
+            trade.buy("EURUSD", 0.1)
+            assert backend.requests["account_info"] == 0
+
+            # Reloaded once, on the first read
+            assert len(trade.account_data.positions) == 7
+            assert len(trade.account_data.positions) == 7
+            assert backend.requests["account_info"] == 1
+
+    def test_positions_orders_refresh(self, trade_backend):
+        with use_backend(trade_backend) as backend:
+            trade = Trade(
+                AccountLive.login(login=2, server="Replay", password=""),
+                refresh_policy=ENUM_REFRESH_POLICY.REFRESH_POLICY_POSITIONS_ORDERS,
+            )
+            backend.requests.clear()
+
+            trade.buy("EURUSD", 0.1)
+
+        assert backend.requests["account_info"] == 0
+        assert backend.requests["positions_get"] == 2
+        assert len(trade.account_data.positions) == 6
@@ -0,0 +1,59 @@
+from AlgorithmicTrading.account import AccountLive
+from AlgorithmicTrading.models.metatrader import ENUM_TRADE_RETCODE
+from AlgorithmicTrading.terminal import ReplayBackend, use_backend
+from AlgorithmicTrading.trade import RetryPolicy, Trade
+
+
+class RequoteBackend(ReplayBackend):
+    """Replay backend requoting the first order, sent with a stale price"""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.orders_sent = 0
+
+    def order_send(self, request: dict):
+        self.orders_sent += 1
+        if self.orders_sent == 1:
+            request = {**request, "price": 1.0}
+
+        return super().order_send(request)
+
+
+class TestRetryPolicy:
+    """Assert the trade requests retries"""
+
+    def test_delays(self):
+        policy = RetryPolicy(backoff=0.1, max_backoff=0.3, deadline=1.0, seed=1)
+
+        # Requotes are retried at once
+        assert policy.get_delay(ENUM_TRADE_RETCODE.TRADE_RETCODE_REQUOTE, 0, 0) == 0
+
+        # Connection errors back off, with jitter, up to the longest delay
+        delays = [
+            policy.get_delay(ENUM_TRADE_RETCODE.TRADE_RETCODE_CONNECTION, retry, 0)
+            for retry in range(4)
+        ]
+        assert 0.05 <= delays[0] <= 0.1
+        assert 0.1 <= delays[1] <= 0.2
+        assert all(0.15 <= delay <= 0.3 for delay in delays[2:])
+
+        # No retry after the max retries, the deadline or on other errors
+        assert policy.get_delay(ENUM_TRADE_RETCODE.TRADE_RETCODE_REQUOTE, 5, 0) is None
+        assert (
+            policy.get_delay(ENUM_TRADE_RETCODE.TRADE_RETCODE_TIMEOUT, 0, 0.99) is None
+        )
+        assert (
+            policy.get_delay(ENUM_TRADE_RETCODE.TRADE_RETCODE_NO_MONEY, 0, 0) is None
+        )
+
+    def test_requote_reprice(self, create_backend):
+        with use_backend(create_backend(RequoteBackend)) as backend:
+            trade = Trade(AccountLive.login(login=2, server="Replay", password=""))
+
+            assert trade.buy("EURUSD", 0.1)
+
+        # Filled on the second attempt, without waiting
+        assert backend.orders_sent == 2
+        assert trade.last_result.attempts == 2
+        assert trade.last_result.latency < RetryPolicy().max_backoff
+        assert trade.last_result.price == 1.1001
@@ -0,0 +1,108 @@
+from AlgorithmicTrading.models.metatrader import (
+    ENUM_ORDER_TYPE,
+    ENUM_ORDER_TYPE_TIME,
+    ENUM_TRADE_REQUEST_ACTIONS,
+    MqlTradeRequest,
+)
+from AlgorithmicTrading.trade.templates import RequestTemplate, RequestTemplates
+import pytest
+
+
+def create_request(**kwargs) -> dict:
+    request = {
+        "action": ENUM_TRADE_REQUEST_ACTIONS.TRADE_ACTION_DEAL,
+        "symbol": "EURUSD",
+        "type": ENUM_ORDER_TYPE.ORDER_TYPE_BUY,
+        "price": 1.1001,
+        "volume": 0.1,
+        "sl": 1.09,
+        "tp": 1.11,
+        "comment": "template",
+        "magic": 7,
+    }
+    request.update(kwargs)
+
+    return request
+
+
+class TestRequestTemplate:
+    """Assert the validated request templates"""
+
+    def test_same_request_as_model(self):
+        templates = RequestTemplates()
+
+        for request in (
+            create_request(),
+            create_request(price=1.2, sl=0, tp=1.3),
+            create_request(
+                action=ENUM_TRADE_REQUEST_ACTIONS.TRADE_ACTION_PENDING,
+                type=ENUM_ORDER_TYPE.ORDER_TYPE_SELL_LIMIT,
+                price=1.2,
+                sl=1.21,
+                tp=0,
+                type_time=ENUM_ORDER_TYPE_TIME.ORDER_TIME_GTC,
+            ),
+        ):
+            assert templates.build(request) == MqlTradeRequest(**request).prepare()
+
+        # The market orders share one template
+        assert len(templates.templates) == 2
+
+    def test_variable_fields(self):
+        templates = RequestTemplates()
+        requests = [
+            # Closes of many positions, with their own comments
+            create_request(position=ticket, comment=f"close {ticket}", sl=0, tp=0)
+            for ticket in range(1, 50)
+        ] + [
+            create_request(
+                action=ENUM_TRADE_REQUEST_ACTIONS.TRADE_ACTION_SLTP,
+                position=ticket,
+                sl=1.09,
+                tp=1.11,
+            )
+            for ticket in range(1, 50)
+        ]
+        requests.append(
+            create_request(
+                action=ENUM_TRADE_REQUEST_ACTIONS.TRADE_ACTION_CLOSE_BY,
+                position=1,
+                position_by=2,
+            )
+        )
+
+        for request in requests:
+            assert templates.build(request) == MqlTradeRequest(**request).prepare()
+
+        # One template by action, whatever the tickets and comments
+        assert len(templates.templates) == 3
+
+        # The modified position is required
+        with pytest.raises(ValueError):
+            templates.build({**requests[50], "position": None})
+
+    def test_bounded_templates(self):
+        templates = RequestTemplates(max_templates=2)
+
+        for magic in [1, 2, 1, 3]:
+            templates.build(create_request(magic=magic))
+
+        # The least recently used template is dropped
+        assert [dict(key)["magic"] for key in templates.templates] == [1, 3]
+
+    def test_invalid_orders(self):
+        template = RequestTemplate(create_request())
+
+        with pytest.raises(ValueError):
+            template.build(price=1.1, volume=0.1, sl=1.2)
+        with pytest.raises(ValueError):
+            template.build(price=1.1, volume=0.1, tp=1.0)
+        with pytest.raises(ValueError):
+            template.build(price=1.1, volume=0)
+        with pytest.raises(ValueError):
+            template.build(price=None, volume=0.1)
+
+    def test_invalid_template(self):
+        # A pending order type on a market deal
+        with pytest.raises(ValueError):
+            RequestTemplate(create_request(type=ENUM_ORDER_TYPE.ORDER_TYPE_BUY_LIMIT))
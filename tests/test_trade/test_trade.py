@@ -6,6 +6,10 @@ from AlgorithmicTrading.config.config import MT5_LOGIN, MT5_PASSWORD, MT5_SERVER
 from AlgorithmicTrading.rates.rates import Rates
 from AlgorithmicTrading.models.metatrader import ENUM_TIMEFRAME
 from datetime import datetime, timezone
+import pytest
+
+# Orders sent to the MetaTrader 5 terminal
+pytestmark = pytest.mark.live
 
 class TestTrade:
     # Start a mt5 connection
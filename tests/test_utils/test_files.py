@@ -0,0 +1,176 @@
+from AlgorithmicTrading.models.metatrader import ENUM_TIMEFRAME
+from AlgorithmicTrading.utils.files import (
+    get_timeframe_name,
+    read_dataset,
+    read_file,
+    read_memory_map,
+    write_dataset,
+    write_file,
+)
+from datetime import datetime, timedelta, timezone
+import pandas as pd
+import pyarrow as pa
+import pytest
+import os
+
+
+def create_candles(start: str, periods: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "time": pd.date_range(start, periods=periods, freq="1H", tz="UTC"),
+            "close": range(periods),
+        }
+    )
+
+
+class TestDataset:
+    """Assert the partitioned Parquet dataset"""
+
+    def test_partitions(self, tmp_path):
+        write_dataset(create_candles("2023-01-02", 48), str(tmp_path), "EURUSD", "M5")
+
+        partitions = os.listdir(tmp_path / "symbol=EURUSD" / "timeframe=M5")
+        assert sorted(partitions) == ["date=2023-01-02", "date=2023-01-03"]
+
+    def test_append_and_filter(self, tmp_path):
+        root = str(tmp_path)
+
+        # Appends in any order, other symbols are not read
+        write_dataset(create_candles("2023-01-03", 24), root, "EURUSD", "M5")
+        write_dataset(create_candles("2023-01-02", 24), root, "EURUSD", "M5")
+        write_dataset(create_candles("2023-01-02", 48), root, "GBPUSD", "M5")
+
+        df = read_dataset(root, symbol="EURUSD", timeframe="M5")
+        assert len(df) == 48
+        assert df["time"].is_monotonic_increasing
+
+        # The end date is excluded
+        df = read_dataset(
+            root,
+            symbol="EURUSD",
+            date_from=datetime(2023, 1, 2, 12, tzinfo=timezone.utc),
+            date_to=datetime(2023, 1, 3, 6, tzinfo=timezone.utc),
+            columns=["close"],
+        )
+        assert list(df.columns) == ["close"]
+        assert len(df) == 18
+
+    def test_broker_time_bounds(self, tmp_path):
+        root = str(tmp_path)
+        write_dataset(create_candles("2023-01-02", 48), root, "EURUSD", "M5")
+
+        # 2023-01-03 01:00 at UTC+3 is 2023-01-02 22:00 UTC
+        broker_time = timezone(timedelta(hours=3))
+        df = read_dataset(
+            root,
+            symbol="EURUSD",
+            date_from=datetime(2023, 1, 3, 1, tzinfo=broker_time),
+            date_to=datetime(2023, 1, 3, 5, tzinfo=broker_time),
+        )
+
+        assert df["time"].dt.hour.tolist() == [22, 23, 0, 1]
+
+    def test_shared_root(self, tmp_path):
+        root = str(tmp_path)
+        ticks = pd.DataFrame(
+            {
+                "time": pd.date_range("2023-01-02", periods=10, freq="s", tz="UTC"),
+                "bid": [1.1] * 10,
+            }
+        )
+        write_dataset(ticks, root, "EURUSD", "ticks")
+        # The candles partition sorts before the ticks one
+        write_dataset(create_candles("2023-01-02", 4), root, "EURUSD", "M5")
+
+        df = read_dataset(root, symbol="EURUSD", timeframe="ticks")
+
+        assert len(df) == 10
+        assert "bid" in df.columns and "close" not in df.columns
+
+
+class TestReadFileChunks:
+    """Assert the streaming mode of read_file"""
+
+    @pytest.mark.parametrize("extension", [".csv", ".zip", ".json"])
+    def test_chunks(self, tmp_path, extension):
+        df = create_candles("2023-01-02", 25)
+        df["time"] = df["time"].astype("int64") // 10**9
+        file_name = str(tmp_path / f"candles{extension}")
+        write_file(df, file_name)
+
+        chunks = list(
+            read_file(
+                file_name,
+                chunksize=10,
+                dtype={"close": "float32"},
+                datetime_columns=["time"],
+                datetime_unit="s",
+            )
+        )
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert chunks[0]["close"].dtype == "float32"
+        assert str(chunks[0]["time"].dtype) == "datetime64[ns, UTC]"
+        assert pd.concat(chunks)["time"].iloc[-1] == pd.Timestamp(
+            "2023-01-03", tz="UTC"
+        )
+
+    def test_arrow_batches(self, tmp_path):
+        file_name = str(tmp_path / "candles.csv")
+        write_file(pd.DataFrame({"volume": range(300)}), file_name)
+
+        batches = list(read_file(file_name, chunksize=100, arrow=True))
+
+        assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+        # Small and large values share one schema
+        assert {batch.schema for batch in batches} == {batches[0].schema}
+        assert batches[0].schema.field("volume").type == pa.int64()
+
+    def test_dataset_round_trip(self, tmp_path):
+        df = create_candles("2023-01-02", 48)
+        df["time"] = df["time"].astype("int64") // 10**9
+        df["volume"] = [1] * 24 + [1_000] * 24
+        file_name = str(tmp_path / "candles.csv")
+        write_file(df, file_name)
+
+        # Small volumes in the first chunk, large ones in the second
+        root = str(tmp_path / "dataset")
+        for chunk in read_file(
+            file_name, chunksize=24, datetime_columns=["time"], datetime_unit="s"
+        ):
+            write_dataset(chunk, root, "EURUSD", "M5")
+
+        dataset = read_dataset(root, symbol="EURUSD", timeframe="M5")
+        assert dataset["volume"].tolist() == df["volume"].tolist()
+
+
+class TestMemoryMap:
+    """Assert the memory mapped Arrow files"""
+
+    def test_zero_copy(self, tmp_path):
+        df = create_candles("2023-01-02", 100)
+        file_name = str(tmp_path / "candles.arrow")
+        write_file(df, file_name)
+
+        loaded = read_memory_map(file_name)
+
+        pd.testing.assert_frame_equal(loaded, df)
+        # The columns are read only views of the file
+        assert not loaded["close"].to_numpy().flags.writeable
+        assert list(read_memory_map(file_name, columns=["time"]).columns) == ["time"]
+
+
+class TestTimeframeName:
+    """Assert the dataset timeframe names"""
+
+    @pytest.mark.parametrize(
+        "timeframe", [ENUM_TIMEFRAME.TIMEFRAME_M1, 1, "M1", "TIMEFRAME_M1"]
+    )
+    def test_names(self, timeframe):
+        # The integer constants are named as the enum
+        assert get_timeframe_name(timeframe) == "M1"
+
+    def test_other_names(self):
+        assert get_timeframe_name(ENUM_TIMEFRAME.TIMEFRAME_H4) == "H4"
+        assert get_timeframe_name(timedelta(seconds=90)) == "S90"
+        assert get_timeframe_name("ticks") == "ticks"
@@ -0,0 +1,120 @@
+from AlgorithmicTrading.models.metatrader import ENUM_POSITION_TYPE
+from AlgorithmicTrading.utils.trades import (
+    compute_profit,
+    compute_profit_batch,
+    round_batch,
+)
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+EURUSD = SimpleNamespace(
+    trade_contract_size=100_000.0,
+    trade_tick_size=0.00001,
+    currency_base="EUR",
+    currency_profit="USD",
+)
+
+
+class CloseTick(SimpleNamespace):
+    """Close tick, with the attribute and item access of the candles ticks"""
+
+    def __getitem__(self, key: str):
+        return getattr(self, key)
+
+
+class TestComputeProfitBatch:
+    """Assert the vectorized profit against the scalar one"""
+
+    rng = np.random.default_rng(7)
+    size = 10_000
+    price_open = np.round(1.1 + rng.normal(0, 0.01, size), 5)
+    price_close = np.round(1.1 + rng.normal(0, 0.01, size), 5)
+    volume = np.round(rng.uniform(0.01, 5, size), 2)
+    position_type = rng.integers(0, 2, size)
+    bid = np.round(1.1 + rng.normal(0, 0.01, size), 5)
+
+    def scalar_profits(self, account_currency: str, symbol_data=EURUSD) -> np.ndarray:
+        return np.array(
+            [
+                compute_profit(
+                    price_open=float(self.price_open[i]),
+                    price_close=float(self.price_close[i]),
+                    price_volume=float(self.volume[i]),
+                    # The tick position stands for its date in the cross rates
+                    tick_close=CloseTick(ask=0.0, bid=float(self.bid[i]), Datetime=i),
+                    symbol_data=symbol_data,
+                    position_type=ENUM_POSITION_TYPE(int(self.position_type[i])),
+                    account_currency=account_currency,
+                )
+                for i in range(self.size)
+            ]
+        )
+
+    @pytest.mark.parametrize(
+        "currency_base, currency_profit, account_currency",
+        [
+            ("EUR", "USD", "USD"),
+            ("EUR", "USD", "EUR"),
+            ("EUR", "USD", "GBP"),
+            # Base and profit currencies are the account one, e.g. an index
+            ("USD", "USD", "USD"),
+            ("USD", "JPY", "USD"),
+        ],
+    )
+    def test_currencies(
+        self, monkeypatch, currency_base, currency_profit, account_currency
+    ):
+        symbol_data = SimpleNamespace(**vars(EURUSD))
+        symbol_data.currency_base = currency_base
+        symbol_data.currency_profit = currency_profit
+        # Cross rates, by tick position
+        monkeypatch.setattr(
+            "AlgorithmicTrading.utils.trades.convert_cross_currency_value",
+            lambda value, date_from, **kwargs: value * self.bid[date_from],
+        )
+
+        profits = compute_profit_batch(
+            self.price_open,
+            self.price_close,
+            self.volume,
+            symbol_data,
+            self.position_type,
+            account_currency,
+            conversion_price=self.bid,
+        )
+
+        assert np.array_equal(
+            profits, self.scalar_profits(account_currency, symbol_data)
+        )
+
+    def test_profit_currency(self):
+        profits = compute_profit_batch(
+            self.price_open,
+            self.price_close,
+            self.volume,
+            EURUSD,
+            self.position_type,
+            "USD",
+        )
+
+        assert np.array_equal(profits, self.scalar_profits("USD"))
+
+    def test_base_currency(self):
+        profits = compute_profit_batch(
+            self.price_open,
+            self.price_close,
+            self.volume,
+            EURUSD,
+            self.position_type,
+            "EUR",
+            conversion_price=self.bid,
+        )
+
+        assert np.array_equal(profits, self.scalar_profits("EUR"))
+
+    def test_round(self):
+        values = np.array([2.675, 0.000015, -1.000005, 1e300, np.nan, 0.1 + 0.2])
+        expected = [round(value, 5) for value in values.tolist()]
+
+        np.testing.assert_array_equal(round_batch(values, 5), expected)